@@ -0,0 +1,353 @@
+#!/usr/bin/env python3
+"""
+BMAD Migration Benchmark
+Misst den Durchsatz der Migrations-Stufen auf synthetischen Projektbäumen
+
+Jede Stufe (Backup, Struktur, YAML-Dump, Registry, Tasks, End-to-End) läuft in
+einem eigenen Prozess auf einem frisch generierten Workspace - so sind Laufzeit
+und Peak-RSS pro Stufe isoliert. Ergebnisse werden als JSON inkl. Git-Commit
+gespeichert und lassen sich mit --compare gegen einen früheren Lauf vergleichen.
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import shutil
+import argparse
+import platform
+import tempfile
+import subprocess
+import multiprocessing
+from pathlib import Path
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# Füge src-Pfad hinzu
+REPO_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(REPO_ROOT / "src"))
+
+from bmad_mcp.core.atomic_writer import AtomicWriter
+from bmad_mcp.core.backup_store import BackupStore
+from bmad_mcp.core.registry_store import SQLiteRegistry
+from bmad_mcp.core.task_event_log import TaskEventLog
+from bmad_mcp.core.task_store import TaskStoreReader
+from bmad_mcp.core.template_layout import get_template_layout, materialize_layout
+from bmad_mcp.core.workspace_scanner import WorkspaceScanner
+
+STAGES = ("backup_snapshot", "backup_archive", "structure", "yaml_dump", "registry", "tasks", "end_to_end")
+
+LEGACY_FILES = {
+    "bmad-config.json": lambda i: json.dumps({"project": f"bench-{i}", "notion": {"databases": 10}}),
+    "agent-access-config.yaml": lambda i: f"agents:\n  dev: true\n  qa: true\nproject: bench-{i}\n",
+    "bmad-dev-settings.json": lambda i: json.dumps({"agent": "dev", "temperature": 0.1}),
+    "bmad-pm-settings.json": lambda i: json.dumps({"agent": "pm", "temperature": 0.2}),
+}
+
+
+# ----------------------------------------------------------------------
+# Synthetische Daten
+# ----------------------------------------------------------------------
+
+def generate_project(root: Path, index: int, files: int, depth: int, file_size: int,
+                     legacy_configs: bool, rng: random.Random) -> Dict[str, int]:
+    """Projektbaum mit `files` Dateien über `depth` Ebenen verteilt"""
+    root.mkdir(parents=True, exist_ok=True)
+    written = 0
+    total = 0
+
+    # Pro Ebene höchstens 8 Verzeichnisse (je 2 Kinder der vorherigen Ebene)
+    directories = [root]
+    frontier = [root]
+    for level in range(depth):
+        frontier = [d / f"dir{level}_{n}" for d in frontier for n in range(2)][:8]
+        directories.extend(frontier)
+    for directory in directories:
+        directory.mkdir(parents=True, exist_ok=True)
+
+    for n in range(files):
+        directory = directories[rng.randrange(len(directories))]
+        # Halb Text (gut komprimierbar), halb Zufall - realistischer Mix
+        size = max(1, int(rng.expovariate(1.0 / file_size)))
+        if n % 2:
+            data = rng.getrandbits(8 * size).to_bytes(size, "little")
+        else:
+            data = (f"line {n} of synthetic project {index}\n" * (size // 32 + 1)).encode()[:size]
+        (directory / f"file{n}.txt").write_bytes(data)
+        written += 1
+        total += size
+
+    if legacy_configs:
+        for name, render in LEGACY_FILES.items():
+            (root / name).write_text(render(index), encoding="utf-8")
+            written += 1
+
+    return {"files": written, "bytes": total}
+
+
+def generate_tasks_file(path: Path, count: int, rng: random.Random):
+    agents = ("dev", "qa", "pm", "analyst", "architect")
+    statuses = ("todo", "in_progress", "completed", "blocked")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write('{"tasks": [')
+        for n in range(count):
+            task = {
+                "task_id": f"task-{n}",
+                "title": f"Synthetic task {n}",
+                "agent": rng.choice(agents),
+                "status": rng.choice(statuses),
+                "allocated_hours": rng.randint(1, 16),
+                "completed_hours": rng.randint(0, 8),
+                "start_date": f"2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}"
+            }
+            f.write(("," if n else "") + json.dumps(task))
+        f.write("], \"sessions\": []}")
+
+
+def generate_workspace(workspace: Path, params: Dict[str, Any]) -> Dict[str, Any]:
+    rng = random.Random(params["seed"])
+    projects = []
+    totals = {"files": 0, "bytes": 0}
+    for i in range(params["projects"]):
+        project_path = workspace / "projects" / f"project-{i}"
+        counts = generate_project(project_path, i, params["files"], params["depth"],
+                                  params["file_size"], params["legacy_configs"], rng)
+        projects.append(project_path)
+        totals["files"] += counts["files"]
+        totals["bytes"] += counts["bytes"]
+    generate_tasks_file(workspace / "home" / ".bmad-global" / "tasks.json", params["tasks"], rng)
+    return {"projects": projects, **totals}
+
+
+# ----------------------------------------------------------------------
+# Stufen
+# ----------------------------------------------------------------------
+
+def _layout(template: str = "standard"):
+    return get_template_layout(template)
+
+
+def stage_backup_snapshot(workspace: Path, data: Dict[str, Any]) -> Dict[str, int]:
+    store = BackupStore(workspace / "store")
+    for path in data["projects"]:
+        store.create_snapshot(path, path.name)
+    return {"files": data["files"], "bytes": data["bytes"]}
+
+
+def stage_backup_archive(workspace: Path, data: Dict[str, Any]) -> Dict[str, int]:
+    store = BackupStore(workspace / "store")
+    compressed = 0
+    for path in data["projects"]:
+        compressed += store.create_archive(path, path.name).stat().st_size
+    return {"files": data["files"], "bytes": data["bytes"], "compressed_bytes": compressed}
+
+
+def stage_structure(workspace: Path, data: Dict[str, Any]) -> Dict[str, int]:
+    layout = _layout()
+    created = 0
+    for path in data["projects"]:
+        stats = materialize_layout(path / ".bmad-core", layout)
+        created += stats["directories_created"] + stats["files_created"]
+    return {"files": created, "bytes": 0}
+
+
+def stage_yaml_dump(workspace: Path, data: Dict[str, Any]) -> Dict[str, int]:
+    writer = AtomicWriter()
+    for path in data["projects"]:
+        config = {
+            "name": path.name, "version": "2.0.0", "type": "standard", "template": "standard",
+            "features": [f"feature {n}" for n in range(20)],
+            "agents": {a: {"enabled": True, "config_file": f"bmad-{a}-settings.json"}
+                       for a in ("dev", "analyst", "architect", "pm", "qa")}
+        }
+        writer.write_yaml(path / ".bmad-core" / "project.yaml", config)
+        for agent in ("dev", "analyst", "architect", "pm"):
+            writer.write_yaml(path / ".bmad-core" / "agents" / f"{agent}.yaml",
+                              {"name": f"bmad-{agent}", "version": "2.0.0", "enabled": True})
+    report = writer.report()
+    return {"files": report["files_written"], "bytes": report["bytes_written"]}
+
+
+def stage_registry(workspace: Path, data: Dict[str, Any]) -> Dict[str, int]:
+    registry = SQLiteRegistry(workspace / "registry.db")
+    entries = [(str(path), {"name": path.name, "type": "standard", "template": "standard"})
+               for path in data["projects"]]
+    registry.register_projects(entries)
+    registry.close()
+    return {"files": len(entries), "bytes": (workspace / "registry.db").stat().st_size}
+
+
+def stage_tasks(workspace: Path, data: Dict[str, Any]) -> Dict[str, int]:
+    tasks_file = workspace / "home" / ".bmad-global" / "tasks.json"
+    TaskEventLog(tasks_file.parent).task_count()
+    TaskStoreReader(tasks_file).summary()
+    return {"files": 1, "bytes": tasks_file.stat().st_size}
+
+
+def stage_end_to_end(workspace: Path, data: Dict[str, Any]) -> Dict[str, int]:
+    # Migrator nutzt Path.home() -> auf den Benchmark-Workspace umbiegen
+    home = workspace / "home"
+    os.environ["HOME"] = os.environ["USERPROFILE"] = str(home)
+    sys.path.insert(0, str(REPO_ROOT / "scripts"))
+    import migrate_existing_projects
+
+    # Gleiches Ersatz-Layout wie bei "structure", falls die Templates fehlen
+    migrate_existing_projects.get_template_layout = _layout
+    migrator = migrate_existing_projects.BMadProjectMigrator()
+    migrator.discovered_projects = WorkspaceScanner(use_cache=False).scan([workspace / "projects"])
+    results = migrator.run_full_migration()
+    if results["errors"]:
+        raise RuntimeError(f"{len(results['errors'])} Projekte fehlgeschlagen: {results['errors'][0]['error']}")
+    return {"files": data["files"], "bytes": data["bytes"]}
+
+
+STAGE_FUNCTIONS: Dict[str, Callable[[Path, Dict[str, Any]], Dict[str, int]]] = {
+    "backup_snapshot": stage_backup_snapshot,
+    "backup_archive": stage_backup_archive,
+    "structure": stage_structure,
+    "yaml_dump": stage_yaml_dump,
+    "registry": stage_registry,
+    "tasks": stage_tasks,
+    "end_to_end": stage_end_to_end,
+}
+
+
+# ----------------------------------------------------------------------
+# Ausführung
+# ----------------------------------------------------------------------
+
+def _peak_rss_bytes() -> Optional[int]:
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux: Kilobytes, macOS: Bytes
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def run_stage(stage: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    """Eine Stufe messen (läuft im Kind-Prozess); Generierung zählt nicht mit"""
+    workspace = Path(tempfile.mkdtemp(prefix=f"bmad-bench-{stage}-"))
+    try:
+        data = generate_workspace(workspace, params)
+        rss_before = _peak_rss_bytes()
+        started = time.perf_counter()
+        try:
+            counts = STAGE_FUNCTIONS[stage](workspace, data)
+        except ImportError as e:
+            return {"stage": stage, "skipped": f"Abhängigkeit fehlt: {e}"}
+        seconds = time.perf_counter() - started
+
+        result = {
+            "stage": stage,
+            "seconds": round(seconds, 4),
+            "files": counts["files"],
+            "bytes": counts["bytes"],
+            "files_per_sec": round(counts["files"] / seconds, 1) if seconds else None,
+            "mb_per_sec": round(counts["bytes"] / seconds / (1024 * 1024), 2) if seconds else None,
+            "peak_rss_bytes": _peak_rss_bytes(),
+            "rss_before_bytes": rss_before
+        }
+        result.update({k: v for k, v in counts.items() if k not in ("files", "bytes")})
+        return result
+    finally:
+        shutil.rmtree(workspace, ignore_errors=True)
+
+
+def run_isolated(stage: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    """Frischer Prozess pro Stufe - Peak-RSS und Caches bleiben getrennt"""
+    with multiprocessing.get_context("spawn").Pool(1) as pool:
+        return pool.apply(run_stage, (stage, params))
+
+
+def git_revision() -> Dict[str, Any]:
+    def git(*args: str) -> str:
+        return subprocess.run(["git", *args], cwd=REPO_ROOT, capture_output=True, text=True).stdout.strip()
+    try:
+        return {"commit": git("rev-parse", "HEAD") or None, "dirty": bool(git("status", "--porcelain", "--untracked-files=no"))}
+    except OSError:
+        return {"commit": None, "dirty": None}
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any]):
+    """Veränderung je Stufe gegenüber einem früheren Ergebnis"""
+    print(f"\nVergleich mit {(baseline.get('git') or {}).get('commit') or 'Baseline'}:")
+    for stage, result in current["stages"].items():
+        old = baseline.get("stages", {}).get(stage)
+        if not old or "seconds" not in old or "seconds" not in result:
+            continue
+        speedup = old["seconds"] / result["seconds"] if result["seconds"] else float("inf")
+        print(f"  {stage:<16} {old['seconds']:.3f}s -> {result['seconds']:.3f}s ({speedup:.2f}x)")
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="BMAD Migration Benchmark")
+    parser.add_argument("--projects", type=int, default=5, help="Anzahl synthetischer Projekte")
+    parser.add_argument("--files", type=int, default=500, help="Dateien pro Projekt")
+    parser.add_argument("--depth", type=int, default=4, help="Verzeichnistiefe pro Projekt")
+    parser.add_argument("--file-size", type=int, default=8192, help="Mittlere Dateigröße in Bytes")
+    parser.add_argument("--tasks", type=int, default=10000, help="Tasks in tasks.json")
+    parser.add_argument("--no-legacy-configs", action="store_true", help="Keine Legacy-Konfigurationen erzeugen")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--stages", nargs="+", choices=STAGES, default=list(STAGES))
+    parser.add_argument("--repeat", type=int, default=1, help="Wiederholungen pro Stufe (bester Lauf zählt)")
+    parser.add_argument("--output", metavar="FILE", help="Ergebnis-JSON (Standard: ~/.bmad-global/benchmarks/)")
+    parser.add_argument("--compare", metavar="FILE", help="Früheres Ergebnis-JSON zum Vergleich")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    params = {
+        "projects": args.projects, "files": args.files, "depth": args.depth,
+        "file_size": args.file_size, "tasks": args.tasks,
+        "legacy_configs": not args.no_legacy_configs, "seed": args.seed
+    }
+
+    print("BMAD Migration Benchmark")
+    print("=" * 50)
+    print(f"{args.projects} Projekte x {args.files} Dateien (Tiefe {args.depth}, ~{args.file_size} B), "
+          f"{args.tasks} Tasks")
+
+    results: Dict[str, Any] = {
+        "benchmark": "migration",
+        "created_at": datetime.now().isoformat(),
+        "git": git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "params": params,
+        "stages": {}
+    }
+
+    for stage in args.stages:
+        runs = [run_isolated(stage, params) for _ in range(max(1, args.repeat))]
+        best = min(runs, key=lambda r: r.get("seconds", float("inf")))
+        results["stages"][stage] = best
+        if "skipped" in best:
+            print(f"  {stage:<16} übersprungen ({best['skipped']})")
+            continue
+        rss = f"{best['peak_rss_bytes'] / (1024 * 1024):.1f} MB" if best["peak_rss_bytes"] else "n/a"
+        print(f"  {stage:<16} {best['seconds']:>8.3f}s  {best['files_per_sec'] or 0:>10.1f} Dateien/s  "
+              f"{best['mb_per_sec'] or 0:>8.2f} MB/s  Peak-RSS {rss}")
+
+    output = Path(args.output) if args.output else (
+        Path.home() / ".bmad-global" / "benchmarks" /
+        f"migration_{(results['git']['commit'] or 'nogit')[:12]}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+    output.parent.mkdir(parents=True, exist_ok=True)
+    AtomicWriter().write_json(output, results, indent=2)
+    print(f"\n📊 Ergebnis: {output}")
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            compare(results, json.load(f))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
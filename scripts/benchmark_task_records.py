@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+BMAD Task Record Benchmark
+Vergleicht Speicherbedarf und JSON-Decode/Encode von Task-dicts mit den
+__slots__-Records aus bmad_mcp.core.records (tracemalloc)
+"""
+
+import sys
+import json
+import time
+import random
+import argparse
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+# Füge src-Pfad hinzu
+REPO_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(REPO_ROOT / "src"))
+
+from bmad_mcp.core.records import Task, encode_tasks, decode_tasks, decode_sessions
+
+AGENTS = ("analyst", "architect", "dev", "qa", "pm")
+STATUSES = ("todo", "in_progress", "review", "completed", "blocked")
+PHASES = ("Planning", "Design", "Development", "Testing", "Deployment")
+
+
+def generate_tasks_json(count: int, seed: int) -> str:
+    """Tasks wie in examples/real-world-project.py, als JSON (wie aus tasks.json gelesen)"""
+    rng = random.Random(seed)
+    tasks = []
+    for n in range(count):
+        allocated = float(rng.randint(1, 16))
+        tasks.append({
+            "task_id": f"task-{n}",
+            "name": f"Synthetic task {n}",
+            "allocated_hours": allocated,
+            "agent": rng.choice(AGENTS),
+            "status": rng.choice(STATUSES),
+            "phase": rng.choice(PHASES),
+            "completed_hours": float(rng.randint(0, int(allocated))),
+            "start_date": f"2025-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}"
+        })
+    return json.dumps(tasks)
+
+
+def generate_sessions_json(count: int, seed: int) -> str:
+    rng = random.Random(seed)
+    return json.dumps([
+        {
+            "task_id": f"task-{rng.randrange(count)}",
+            "agent": rng.choice(AGENTS),
+            "started_at": f"2025-03-{rng.randint(1, 28):02d}T09:00:00",
+            "ended_at": f"2025-03-{rng.randint(1, 28):02d}T12:00:00",
+            "hours_worked": float(rng.randint(1, 8))
+        }
+        for _ in range(count)
+    ])
+
+
+def measure(build: Callable[[], Any]) -> Dict[str, Any]:
+    """Speicher (tracemalloc, nach Abschluss gehalten) und Laufzeit von build()"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = build()
+    seconds = time.perf_counter() - start
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"result": result, "bytes": current, "peak_bytes": peak, "seconds": seconds}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="BMAD Task Record Benchmark")
+    parser.add_argument("--tasks", type=int, default=100_000, help="Anzahl Tasks")
+    parser.add_argument("--sessions", type=int, default=20_000, help="Anzahl Work-Sessions")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--json", action="store_true", help="Ergebnis als JSON ausgeben")
+    args = parser.parse_args(argv)
+
+    tasks_json = generate_tasks_json(args.tasks, args.seed)
+    sessions_json = generate_sessions_json(args.sessions, args.seed)
+
+    runs = {
+        "task_dicts": measure(lambda: json.loads(tasks_json)),
+        "task_records": measure(lambda: decode_tasks(tasks_json)),
+        "session_dicts": measure(lambda: json.loads(sessions_json)),
+        "session_records": measure(lambda: decode_sessions(sessions_json))
+    }
+
+    records: List[Task] = runs["task_records"]["result"]
+    start = time.perf_counter()
+    encoded = encode_tasks(records)
+    encode_seconds = time.perf_counter() - start
+    # Verlustfreier Roundtrip ist Voraussetzung für den Einsatz im Task-Store
+    roundtrip_ok = [t.to_dict() for t in records] == runs["task_dicts"]["result"] and \
+        json.loads(encoded) == runs["task_dicts"]["result"]
+
+    report = {
+        "tasks": args.tasks,
+        "sessions": args.sessions,
+        "python": sys.version.split()[0],
+        "roundtrip_ok": roundtrip_ok,
+        "encode_seconds": round(encode_seconds, 4)
+    }
+    for name, run in runs.items():
+        count = args.tasks if name.startswith("task") else args.sessions
+        report[name] = {
+            "bytes": run["bytes"],
+            "bytes_per_entry": round(run["bytes"] / max(count, 1), 1),
+            "peak_bytes": run["peak_bytes"],
+            "decode_seconds": round(run["seconds"], 4)
+        }
+    for kind in ("task", "session"):
+        dicts, slots = report[f"{kind}_dicts"]["bytes"], report[f"{kind}_records"]["bytes"]
+        report[f"{kind}_savings_percent"] = round((1 - slots / dicts) * 100, 1) if dicts else 0.0
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return 0 if roundtrip_ok else 1
+
+    print("BMAD Task Record Benchmark")
+    print("=" * 50)
+    for kind, count in (("task", args.tasks), ("session", args.sessions)):
+        d, r = report[f"{kind}_dicts"], report[f"{kind}_records"]
+        print(f"{kind.capitalize() + 's':<9} {count:>8}: dict {d['bytes_per_entry']:>7.1f} B/Eintrag"
+              f" -> Record {r['bytes_per_entry']:>7.1f} B/Eintrag"
+              f"  ({report[f'{kind}_savings_percent']:.1f}% weniger)"
+              f"  decode {d['decode_seconds']:.3f}s -> {r['decode_seconds']:.3f}s")
+    print(f"Encode {args.tasks} Records: {encode_seconds:.3f}s")
+    if not roundtrip_ok:
+        print("⚠️  Roundtrip dict -> Record -> dict nicht verlustfrei")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+BMAD YAML Backend Benchmark
+Vergleicht Laden/Schreiben der echten Konfigurationsdateien mit reinem
+Python-PyYAML und dem libyaml C-Backend
+"""
+
+import sys
+import time
+import argparse
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import yaml
+
+# Füge src-Pfad hinzu
+REPO_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(REPO_ROOT / "src"))
+
+from bmad_mcp.core.serialization import LIBYAML_AVAILABLE, backend_info
+
+CONFIG_FILES = [
+    REPO_ROOT / "config" / "bmad-global-config.yaml",
+    REPO_ROOT / "config" / "bmad-core" / "core-config.yaml",
+    REPO_ROOT / "config" / "bmad-core" / "workflows" / "development-workflow.yaml",
+    REPO_ROOT / ".bmad-core" / "project.yaml",
+    REPO_ROOT / "templates" / "project-structure" / "project-status.yaml",
+]
+
+
+def _best_of(func: Callable[[], Any], iterations: int, repeat: int = 3) -> float:
+    """Beste Laufzeit pro Aufruf in Millisekunden"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(iterations):
+            func()
+        best = min(best, (time.perf_counter() - start) / iterations)
+    return best * 1000
+
+
+def benchmark_file(path: Path, iterations: int) -> Dict[str, Any]:
+    text = path.read_text(encoding="utf-8")
+    data = yaml.load(text, Loader=yaml.SafeLoader)
+    dump = lambda dumper: yaml.dump(data, Dumper=dumper, default_flow_style=False, allow_unicode=True)
+
+    result = {
+        "file": str(path.relative_to(REPO_ROOT)),
+        "bytes": len(text.encode("utf-8")),
+        "load_py_ms": _best_of(lambda: yaml.load(text, Loader=yaml.SafeLoader), iterations),
+        "dump_py_ms": _best_of(lambda: dump(yaml.SafeDumper), iterations),
+    }
+
+    if LIBYAML_AVAILABLE:
+        result["load_c_ms"] = _best_of(lambda: yaml.load(text, Loader=yaml.CSafeLoader), iterations)
+        result["dump_c_ms"] = _best_of(lambda: dump(yaml.CSafeDumper), iterations)
+        result["load_speedup"] = result["load_py_ms"] / result["load_c_ms"]
+        result["dump_speedup"] = result["dump_py_ms"] / result["dump_c_ms"]
+        # Gleiche Ausgabe ist Voraussetzung für stabile Write-if-changed Vergleiche
+        result["identical_output"] = dump(yaml.SafeDumper) == dump(yaml.CSafeDumper)
+
+    return result
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="BMAD YAML Backend Benchmark")
+    parser.add_argument("--iterations", type=int, default=200, help="Aufrufe pro Messung")
+    args = parser.parse_args(argv)
+
+    info = backend_info()
+    print("BMAD YAML Backend Benchmark")
+    print("=" * 50)
+    print(f"PyYAML {info['pyyaml_version']} - aktiv: {info['loader']}/{info['dumper']}")
+
+    if not LIBYAML_AVAILABLE:
+        print("⚠️  libyaml nicht verfügbar - nur reines Python wird gemessen")
+
+    for path in CONFIG_FILES:
+        if not path.exists():
+            continue
+        r = benchmark_file(path, args.iterations)
+        line = f"{r['file']:<58} {r['bytes']:>6} B  load {r['load_py_ms']:.3f}ms"
+        if LIBYAML_AVAILABLE:
+            line += (f" -> {r['load_c_ms']:.3f}ms ({r['load_speedup']:.1f}x)"
+                     f"  dump {r['dump_py_ms']:.3f}ms -> {r['dump_c_ms']:.3f}ms ({r['dump_speedup']:.1f}x)")
+            if not r["identical_output"]:
+                line += "  ⚠️ Ausgabe abweichend"
+        else:
+            line += f"  dump {r['dump_py_ms']:.3f}ms"
+        print(line)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
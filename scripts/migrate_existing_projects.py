@@ -6,71 +6,129 @@ Migriert bestehende Projekte auf die neue BMAD-Standardstruktur
 
 import os
 import sys
-import json
-import yaml
-import shutil
+import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Callable, Optional, Tuple
 
 # Füge src-Pfad hinzu
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from bmad_mcp.core.project_templates import template_manager
 from bmad_mcp.core.global_registry import global_registry
+from bmad_mcp.core.backup_store import BackupStore, DEFAULT_IGNORE_NAMES
+from bmad_mcp.core.backup_archive import BackupArchive, is_archive, SUFFIXES
+from bmad_mcp.core.migration_plan import MigrationPlan, VOLATILE_KEYS
+from bmad_mcp.core.atomic_writer import AtomicWriter
+from bmad_mcp.core.serialization import load_yaml_file, load_json_file
+from bmad_mcp.core.task_event_log import TaskEventLog
+from bmad_mcp.core.template_layout import get_template_layout
+from bmad_mcp.core.instrumentation import instrumentation
+from bmad_mcp.core.agent_config_converter import AgentConfigConverter
+from bmad_mcp.core.config_resolver import config_resolver
+from bmad_mcp.core.migration_journal import MigrationJournal, STEP_BACKUP, STEP_AGENTS, STEP_TASKS, STEP_REGISTRY
+from bmad_mcp.core.workspace_scanner import WorkspaceScanner, DiscoveredProject, DEFAULT_MAX_DEPTH
 
 
 class BMadProjectMigrator:
     """Migration bestehender Projekte auf BMAD v2.0 Standard"""
     
-    def __init__(self):
+    def __init__(self, backup_ignore: Optional[List[str]] = None,
+                 max_backup_file_size: Optional[int] = None,
+                 max_backup_bytes: Optional[int] = None,
+                 backup_mode: str = "snapshot",
+                 backup_compression: Optional[str] = None):
         self.backup_dir = Path.home() / ".bmad-global" / "migration-backups"
         self.backup_dir.mkdir(parents=True, exist_ok=True)
         
-        # Bekannte Projekte aus vorheriger Analyse
+        # Inhaltsadressierter Backup-Store: wiederholte Läufe kopieren nur Änderungen
+        ignore_names = DEFAULT_IGNORE_NAMES if backup_ignore is None else backup_ignore
+        # .gitignore/.bmadignore werden beachtet, Größen-Budgets sind optional
+        self.backup_store = BackupStore(
+            self.backup_dir,
+            ignore_names=ignore_names,
+            max_file_size=max_backup_file_size,
+            max_total_bytes=max_backup_bytes
+        )
+        # "snapshot" = deduplizierter Store, "archive" = komprimiertes tar.gz/tar.zst
+        self.backup_mode = backup_mode
+        self.backup_compression = backup_compression
+        
+        # Bekannte Projekte aus vorheriger Analyse (Fallback ohne Workspace-Scan)
         self.existing_projects = {
             "Claude Global": Path.home() / "AppData" / "Roaming" / "Claude",
             "BMAD MCP Infrastructure": Path.home() / "AppData" / "Roaming" / "Claude" / "bmad-mcp-infrastructure", 
             "Gutachter App": Path.home() / "AppData" / "Roaming" / "Claude" / "gutachter-app"
         }
+        
+        # Per Workspace-Scan gefundene Projekte ersetzen die bekannten Pfade
+        self.discovered_projects: List[DiscoveredProject] = []
+        
+        # Alle YAML/JSON-Ausgaben laufen über den Write-if-changed Writer
+        self.writer = AtomicWriter()
+        
+        # Registry ist der einzige geteilte Zustand - Schreibzugriffe serialisieren
+        self._registry_lock = threading.Lock()
+        
+        # Globale Registry (SQLite); Registrierungen werden gesammelt und am Ende
+        # in einer Transaktion geschrieben
+        self.registry_store = global_registry.store
+        self._pending_registrations: List[Tuple[str, Dict[str, Any]]] = []
+        
+        # Checkpoint-Journal pro Projekt und Schritt (für --resume)
+        self.journal = MigrationJournal()
+        
+        # Legacy-Agent-Settings aller Projekte mit gemeinsamen Defaults konvertieren
+        self.agent_converter = AgentConfigConverter()
+    
+    def discover_projects(self, roots: List[Path], max_depth: int = DEFAULT_MAX_DEPTH,
+                          max_workers: int = 8, use_cache: bool = True) -> List[DiscoveredProject]:
+        """Finde alle BMAD-Projekte unter den Wurzeln (paralleler Scan mit mtime-Cache)"""
+        scanner = WorkspaceScanner(max_depth=max_depth, max_workers=max_workers, use_cache=use_cache)
+        self.discovered_projects = scanner.scan(roots)
+        
+        stats = scanner.stats
+        print(f"🔍 {len(self.discovered_projects)} Projekte gefunden "
+              f"({stats['directories']} Verzeichnisse, {stats['cached']} aus Cache)")
+        return self.discovered_projects
     
     def create_backup(self, project_path: Path, project_name: str) -> Path:
-        """Erstelle Backup vor Migration"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        backup_path = self.backup_dir / f"{project_name}_{timestamp}"
-        
-        print(f"Erstelle Backup: {backup_path}")
-        
-        # Kopiere nur wichtige Dateien (nicht node_modules, etc.)
-        def ignore_patterns(dir_path, contents):
-            ignore = {
-                'node_modules', '__pycache__', '.git', '.vscode', '.idea',
-                'venv', 'env', 'dist', 'build', '.cache', 'logs',
-                'temp', 'tmp', '.DS_Store', 'Thumbs.db'
-            }
-            return [item for item in contents if item in ignore]
-        
-        shutil.copytree(project_path, backup_path, ignore=ignore_patterns)
+        """Erstelle Backup vor Migration (Snapshot-Manifest oder Archiv im Backup-Store)"""
+        if self.backup_mode == "archive":
+            backup_path = self.backup_store.create_archive(project_path, project_name,
+                                                           compression=self.backup_compression)
+            manifest = BackupArchive(backup_path).index
+            stats = manifest["stats"]
+            print(f"Erstelle Backup-Archiv: {backup_path}")
+            print(f"   {stats['files']} Dateien, {stats['bytes']} -> {stats['compressed_bytes']} Bytes "
+                  f"(Faktor {stats['compression_ratio']}, {stats['throughput_mb_s']} MB/s)")
+        else:
+            backup_path = self.backup_store.create_snapshot(project_path, project_name)
+            manifest = self.backup_store.load_manifest(str(backup_path))
+            print(f"Erstelle Backup: {backup_path}")
+        
+        if manifest["skipped"]:
+            skipped = ", ".join(f"{reason}={count}" for reason, count in sorted(manifest["skipped"].items()))
+            print(f"   Übersprungen: {skipped}")
+        if not manifest["complete"]:
+            print("⚠️  Backup-Budget erreicht - Backup ist unvollständig")
         return backup_path
     
-    def migrate_claude_global_project(self) -> Dict[str, Any]:
-        """Migriere Claude Global Projekt"""
+    def backup_stats(self, backup_path: Path) -> Dict[str, Any]:
+        """Statistik eines Backups (Archiv: inkl. Kompressionsrate und Durchsatz)"""
+        if is_archive(backup_path):
+            return BackupArchive(backup_path).index["stats"]
+        return self.backup_store.load_manifest(str(backup_path))["stats"]
+    
+    def plan_claude_global_project(self) -> Tuple[MigrationPlan, Dict[str, Any]]:
+        """Plane Migration des Claude Global Projekts (ohne Schreibzugriffe)"""
         project_path = self.existing_projects["Claude Global"]
-        
-        print(f"Migriere Claude Global Projekt: {project_path}")
-        
-        # Backup erstellen
-        backup_path = self.create_backup(project_path, "claude-global")
-        
-        # .bmad-core erstellen falls nicht vorhanden
         bmad_core = project_path / ".bmad-core"
-        if not bmad_core.exists():
-            bmad_core.mkdir(parents=True, exist_ok=True)
+        plan = MigrationPlan(project="Claude Global", project_path=project_path)
         
-        # Standard-Struktur erstellen
-        template_config = template_manager._get_standard_template()
-        structure = template_config["structure"][".bmad-core"]
-        template_manager._create_directory_structure(bmad_core, structure)
+        # Standard-Struktur
+        plan.add_layout(bmad_core, get_template_layout("standard"))
         
         # Projekt-Konfiguration
         project_config = {
@@ -81,7 +139,7 @@ class BMadProjectMigrator:
             "description": "Zentrales BMAD-System mit globaler Konfiguration für alle Projekte",
             "migrated_from": "legacy_bmad_system",
             "migrated_at": datetime.now().isoformat(),
-            "backup_location": str(backup_path),
+            "backup_location": None,
             "features": [
                 "Globale Agent-Konfigurationen",
                 "OpenRouter Multi-Model Integration", 
@@ -102,57 +160,43 @@ class BMadProjectMigrator:
                 "qa": {"enabled": True, "config_file": "bmad-qa.bat"}
             }
         }
+        plan.add_yaml(bmad_core / "project.yaml", project_config, volatile_keys=VOLATILE_KEYS)
         
-        # Konfiguration schreiben
-        with open(bmad_core / "project.yaml", 'w', encoding='utf-8') as f:
-            yaml.dump(project_config, f, default_flow_style=False, allow_unicode=True)
-        
-        # Bestehende bmad-global-config.json verlinken
+        # Bestehende bmad-global-config.json verlinken (relative Verlinkung)
         if (project_path / "bmad-global-config.json").exists():
-            legacy_config_link = bmad_core / "memory" / "legacy-global-config.json"
-            legacy_config_link.parent.mkdir(parents=True, exist_ok=True)
-            
-            # Relative Verlinkung erstellen
-            with open(legacy_config_link, 'w', encoding='utf-8') as f:
-                json.dump({
-                    "note": "Legacy-Konfiguration für Rückwärtskompatibilität",
-                    "legacy_config_path": "../bmad-global-config.json",
-                    "migration_note": "Diese Datei wird schrittweise in die neue Struktur integriert"
-                }, f, indent=2)
+            plan.add_json(bmad_core / "memory" / "legacy-global-config.json", {
+                "note": "Legacy-Konfiguration für Rückwärtskompatibilität",
+                "legacy_config_path": "../bmad-global-config.json",
+                "migration_note": "Diese Datei wird schrittweise in die neue Struktur integriert"
+            })
         
         # Agent-Konfigurationen migrieren
-        self._migrate_agent_configs(project_path, bmad_core)
+        self._plan_agent_configs(plan, project_path, bmad_core)
         
         # Task-Integration
-        self._integrate_global_tasks(project_path, bmad_core)
+        self._plan_global_tasks(plan, bmad_core)
         
-        # Registriere Projekt
-        global_registry.register_project(str(project_path), project_config)
-        
-        return {
-            "project": "Claude Global",
-            "status": "migrated",
-            "backup": str(backup_path),
-            "bmad_core": str(bmad_core),
-            "config": project_config
-        }
+        plan.add_registry_update(project_path, project_config)
+        return plan, project_config
     
-    def migrate_mcp_infrastructure_project(self) -> Dict[str, Any]:
-        """Migriere MCP Infrastructure Projekt"""
-        project_path = self.existing_projects["BMAD MCP Infrastructure"]
-        
-        print(f"🔄 Migriere MCP Infrastructure Projekt: {project_path}")
+    def migrate_claude_global_project(self) -> Dict[str, Any]:
+        """Migriere Claude Global Projekt"""
+        project_path = self.existing_projects["Claude Global"]
         
-        # Backup erstellen
-        backup_path = self.create_backup(project_path, "bmad-mcp-infrastructure")
+        print(f"Migriere Claude Global Projekt: {project_path}")
         
-        # .bmad-core erweitern
+        with instrumentation.stage("plan"):
+            plan, project_config = self.plan_claude_global_project()
+        return self._apply_plan(plan, "claude-global", "Claude Global", project_config)
+    
+    def plan_mcp_infrastructure_project(self) -> Tuple[MigrationPlan, Dict[str, Any]]:
+        """Plane Migration des MCP Infrastructure Projekts (ohne Schreibzugriffe)"""
+        project_path = self.existing_projects["BMAD MCP Infrastructure"]
         bmad_core = project_path / ".bmad-core"
+        plan = MigrationPlan(project="BMAD MCP Infrastructure", project_path=project_path)
         
         # Infrastructure-Template nutzen
-        template_config = template_manager._get_infrastructure_template()
-        structure = template_config["structure"][".bmad-core"]
-        template_manager._create_directory_structure(bmad_core, structure)
+        plan.add_layout(bmad_core, get_template_layout("infrastructure"))
         
         # Projekt-Konfiguration
         project_config = {
@@ -163,7 +207,7 @@ class BMadProjectMigrator:
             "description": "Cross-IDE MCP server infrastructure für BMAD system integration",
             "migrated_from": "agent_access_config",
             "migrated_at": datetime.now().isoformat(),
-            "backup_location": str(backup_path),
+            "backup_location": None,
             "features": [
                 "Agent access configuration",
                 "Cross-IDE synchronization",
@@ -182,43 +226,33 @@ class BMadProjectMigrator:
         # Bestehende agent-access-config.yaml integrieren
         if (project_path / "agent-access-config.yaml").exists():
             try:
-                with open(project_path / "agent-access-config.yaml", 'r', encoding='utf-8') as f:
-                    legacy_config = yaml.safe_load(f)
-                    project_config["legacy_agent_config"] = legacy_config
+                legacy_config = load_yaml_file(project_path / "agent-access-config.yaml")
+                project_config["legacy_agent_config"] = legacy_config
             except Exception as e:
                 print(f"⚠️  Warnung beim Laden der Legacy-Config: {e}")
         
-        # Konfiguration schreiben
-        with open(bmad_core / "project.yaml", 'w', encoding='utf-8') as f:
-            yaml.dump(project_config, f, default_flow_style=False, allow_unicode=True)
+        plan.add_yaml(bmad_core / "project.yaml", project_config, volatile_keys=VOLATILE_KEYS)
+        plan.add_registry_update(project_path, project_config)
+        return plan, project_config
+    
+    def migrate_mcp_infrastructure_project(self) -> Dict[str, Any]:
+        """Migriere MCP Infrastructure Projekt"""
+        project_path = self.existing_projects["BMAD MCP Infrastructure"]
         
-        # Registriere Projekt
-        global_registry.register_project(str(project_path), project_config)
+        print(f"🔄 Migriere MCP Infrastructure Projekt: {project_path}")
         
-        return {
-            "project": "BMAD MCP Infrastructure",
-            "status": "migrated", 
-            "backup": str(backup_path),
-            "bmad_core": str(bmad_core),
-            "config": project_config
-        }
+        with instrumentation.stage("plan"):
+            plan, project_config = self.plan_mcp_infrastructure_project()
+        return self._apply_plan(plan, "bmad-mcp-infrastructure", "BMAD MCP Infrastructure", project_config)
     
-    def migrate_gutachter_project(self) -> Dict[str, Any]:
-        """Migriere Gutachter App Projekt"""
+    def plan_gutachter_project(self) -> Tuple[MigrationPlan, Dict[str, Any]]:
+        """Plane Migration des Gutachter App Projekts (ohne Schreibzugriffe)"""
         project_path = self.existing_projects["Gutachter App"]
-        
-        print(f"🔄 Migriere Gutachter App Projekt: {project_path}")
-        
-        # Backup erstellen  
-        backup_path = self.create_backup(project_path, "gutachter-app")
-        
-        # .bmad-core erweitern
         bmad_core = project_path / ".bmad-core"
+        plan = MigrationPlan(project="Gutachter App", project_path=project_path)
         
         # Web-App Template nutzen (Business-Anwendung)
-        template_config = template_manager._get_webapp_template()
-        structure = template_config["structure"][".bmad-core"]
-        template_manager._create_directory_structure(bmad_core, structure)
+        plan.add_layout(bmad_core, get_template_layout("web-app"))
         
         # Projekt-Konfiguration
         project_config = {
@@ -229,7 +263,7 @@ class BMadProjectMigrator:
             "description": "Vehicle assessment system mit Notion database integration",
             "migrated_from": "bmad_config",
             "migrated_at": datetime.now().isoformat(),
-            "backup_location": str(backup_path),
+            "backup_location": None,
             "business_domain": "automotive_assessment",
             "features": [
                 "Specialized workflow für vehicle assessments",
@@ -252,105 +286,218 @@ class BMadProjectMigrator:
         # Bestehende bmad-config.json integrieren
         if (project_path / "bmad-config.json").exists():
             try:
-                with open(project_path / "bmad-config.json", 'r', encoding='utf-8') as f:
-                    legacy_config = json.load(f)
-                    project_config["legacy_config"] = legacy_config
+                legacy_config = load_json_file(project_path / "bmad-config.json")
+                project_config["legacy_config"] = legacy_config
             except Exception as e:
                 print(f"⚠️  Warnung beim Laden der Legacy-Config: {e}")
         
-        # Konfiguration schreiben
-        with open(bmad_core / "project.yaml", 'w', encoding='utf-8') as f:
-            yaml.dump(project_config, f, default_flow_style=False, allow_unicode=True)
+        plan.add_yaml(bmad_core / "project.yaml", project_config, volatile_keys=VOLATILE_KEYS)
         
-        # Business-spezifische Workflows erstellen
-        self._create_business_workflows(bmad_core)
+        # Business-spezifische Workflows
+        self._plan_business_workflows(plan, bmad_core)
         
-        # Registriere Projekt
-        global_registry.register_project(str(project_path), project_config)
+        plan.add_registry_update(project_path, project_config)
+        return plan, project_config
+    
+    def migrate_gutachter_project(self) -> Dict[str, Any]:
+        """Migriere Gutachter App Projekt"""
+        project_path = self.existing_projects["Gutachter App"]
         
-        return {
-            "project": "Gutachter KFZ System",
-            "status": "migrated",
-            "backup": str(backup_path), 
-            "bmad_core": str(bmad_core),
-            "config": project_config
-        }
+        print(f"🔄 Migriere Gutachter App Projekt: {project_path}")
+        
+        with instrumentation.stage("plan"):
+            plan, project_config = self.plan_gutachter_project()
+        return self._apply_plan(plan, "gutachter-app", "Gutachter KFZ System", project_config)
     
-    def _migrate_agent_configs(self, project_path: Path, bmad_core: Path):
-        """Migriere bestehende Agent-Konfigurationen"""
-        agents_dir = bmad_core / "agents"
+    def plan_discovered_project(self, project: DiscoveredProject) -> Tuple[MigrationPlan, Dict[str, Any]]:
+        """Plane Migration eines per Workspace-Scan gefundenen Projekts"""
+        project_path = project.path
+        bmad_core = project_path / ".bmad-core"
+        plan = MigrationPlan(project=project.name, project_path=project_path)
         
-        # Mapping von Legacy-Dateien zu neuen Agent-Configs
-        legacy_mappings = {
-            "bmad-dev-settings.json": "dev.yaml",
-            "bmad-analyst-settings.json": "analyst.yaml", 
-            "bmad-architect-settings.json": "architect.yaml",
-            "bmad-pm-settings.json": "pm.yaml"
-        }
+        # Template anhand der gefundenen Legacy-Dateien
+        plan.add_layout(bmad_core, get_template_layout(project.template))
         
-        for legacy_file, new_file in legacy_mappings.items():
-            legacy_path = project_path / legacy_file
-            if legacy_path.exists():
+        # Bestehende project.yaml bleibt maßgeblich - nur fehlende Felder ergänzen
+        project_config: Dict[str, Any] = {}
+        if (bmad_core / "project.yaml").exists():
+            try:
+                project_config = config_resolver.load(bmad_core / "project.yaml")
+            except Exception as e:
+                print(f"⚠️  Warnung beim Laden von project.yaml: {e}")
+        
+        project_config.setdefault("name", project.name)
+        project_config.setdefault("version", "2.0.0")
+        project_config.setdefault("type", project.template)
+        project_config.setdefault("template", project.template)
+        project_config.setdefault("description", f"Migriertes BMAD-Projekt: {project.name}")
+        project_config.setdefault("migrated_from", ", ".join(project.legacy_files) or "bmad_core")
+        project_config["migrated_at"] = datetime.now().isoformat()
+        
+        # Legacy-Konfigurationen integrieren
+        legacy_loaders = (
+            ("agent-access-config.yaml", "legacy_agent_config", load_yaml_file),
+            ("bmad-config.json", "legacy_config", load_json_file)
+        )
+        for legacy_file, key, loader in legacy_loaders:
+            if legacy_file in project.markers:
                 try:
-                    with open(legacy_path, 'r', encoding='utf-8') as f:
-                        legacy_config = json.load(f)
-                    
-                    # Konvertiere zu neuem Format
-                    agent_config = {
-                        "name": f"bmad-{new_file.replace('.yaml', '')}",
-                        "version": "2.0.0",
-                        "enabled": True,
-                        "migrated_from": legacy_file,
-                        "legacy_config": legacy_config,
-                        "model_preferences": {
-                            "primary": "claude-3-sonnet",
-                            "fallback": "claude-3-haiku",
-                            "temperature": 0.1
-                        },
-                        "permissions": {
-                            "file_access": True,
-                            "api_access": True,
-                            "git_access": True
-                        }
-                    }
-                    
-                    # Schreibe neue Agent-Config
-                    with open(agents_dir / new_file, 'w', encoding='utf-8') as f:
-                        yaml.dump(agent_config, f, default_flow_style=False, allow_unicode=True)
-                    
-                    print(f"Agent-Config migriert: {legacy_file} -> {new_file}")
-                    
+                    project_config[key] = loader(project_path / legacy_file)
                 except Exception as e:
-                    print(f"Fehler bei Agent-Migration {legacy_file}: {e}")
+                    print(f"⚠️  Warnung beim Laden der Legacy-Config {legacy_file}: {e}")
+        
+        plan.add_yaml(bmad_core / "project.yaml", project_config, volatile_keys=VOLATILE_KEYS)
+        
+        # Agent-Konfigurationen migrieren
+        self._plan_agent_configs(plan, project_path, bmad_core)
+        
+        plan.add_registry_update(project_path, project_config)
+        return plan, project_config
+    
+    def migrate_discovered_project(self, project: DiscoveredProject) -> Dict[str, Any]:
+        """Migriere ein per Workspace-Scan gefundenes Projekt"""
+        print(f"🔄 Migriere {project.name}: {project.path}")
+        
+        with instrumentation.stage("plan"):
+            plan, project_config = self.plan_discovered_project(project)
+        return self._apply_plan(plan, project.backup_name, project_config["name"], project_config)
+    
+    def _migration_targets(self) -> List[Tuple[str, Path, Callable[[], Tuple[MigrationPlan, Dict[str, Any]]],
+                                               Callable[[], Dict[str, Any]]]]:
+        """(Name, Pfad, Planer, Migration) für bekannte bzw. gescannte Projekte"""
+        known = [
+            ("Claude Global", "Claude Global",
+             self.plan_claude_global_project, self.migrate_claude_global_project),
+            ("MCP Infrastructure", "BMAD MCP Infrastructure",
+             self.plan_mcp_infrastructure_project, self.migrate_mcp_infrastructure_project),
+            ("Gutachter App", "Gutachter App",
+             self.plan_gutachter_project, self.migrate_gutachter_project)
+        ]
+        if not self.discovered_projects:
+            return [(name, self.existing_projects[key], planner, migrate) for name, key, planner, migrate in known]
+        
+        # Gescannte Projekte an bekannten Pfaden behalten ihre spezielle Migration
+        known_by_path = {self.existing_projects[key].resolve(): (name, self.existing_projects[key], planner, migrate)
+                         for name, key, planner, migrate in known}
+        targets, used_names = [], set()
+        for project in self.discovered_projects:
+            if project.path in known_by_path:
+                target = known_by_path[project.path]
+            else:
+                name = project.name if project.name not in used_names else f"{project.name} ({project.path})"
+                target = (name, project.path,
+                          lambda p=project: self.plan_discovered_project(p),
+                          lambda p=project: self.migrate_discovered_project(p))
+            used_names.add(target[0])
+            targets.append(target)
+        return targets
+    
+    def _apply_plan(self, plan: MigrationPlan, backup_name: str, project_label: str,
+                    project_config: Dict[str, Any]) -> Dict[str, Any]:
+        """Wende einen Plan an - ohne Änderungen kein Backup und keine Schreibzugriffe
+        
+        Jeder erledigte Schritt wird im Journal festgehalten; bei --resume werden
+        erledigte Schritte (inkl. Backup) übersprungen.
+        """
+        bmad_core = plan.project_path / ".bmad-core"
+        journal_key = str(plan.project_path)
+        done_steps = self.journal.done_steps(journal_key)
+        
+        if not plan.has_changes:
+            with instrumentation.stage("unchanged"):
+                plan.apply(writer=self.writer)
+            # Abgebrochener Lauf: Dateien sind geschrieben, Registry fehlt noch
+            needs_registry = STEP_BACKUP in done_steps and STEP_REGISTRY not in done_steps
+            if needs_registry:
+                for update in plan.registry_updates:
+                    self._register_project(Path(update.project_path), update.config)
+            print(f"⏭️  {project_label}: keine Änderungen - Backup und Schreibzugriffe übersprungen")
+            result = {
+                "project": project_label,
+                "status": "unchanged",
+                "backup": None,
+                "bmad_core": str(bmad_core),
+                "config": project_config,
+                "plan": plan.summary()
+            }
+            self.journal.record_result(journal_key, result, needs_registry=needs_registry)
+            return result
+        
+        # Backup erstellen (bei --resume das Backup des abgebrochenen Laufs verwenden)
+        if STEP_BACKUP in done_steps:
+            backup_path = Path(self.journal.step_data(journal_key, STEP_BACKUP)["path"])
+            print(f"⏩ Backup aus abgebrochenem Lauf: {backup_path}")
+        else:
+            with instrumentation.stage(STEP_BACKUP):
+                backup_path = self.create_backup(plan.project_path, backup_name)
+            self.journal.mark_done(journal_key, STEP_BACKUP, path=str(backup_path))
+        project_config["migrated_at"] = datetime.now().isoformat()
+        project_config["backup_location"] = str(backup_path)
+        
+        # Registry-Schritt wird erst nach dem Batch-Flush als erledigt markiert
+        def checkpoint(step: str):
+            if step != STEP_REGISTRY:
+                self.journal.mark_done(journal_key, step)
+        
+        summary = plan.apply(register=self._register_project, writer=self.writer,
+                             skip_steps=done_steps, on_step=checkpoint)
+        print(f"   {summary['create']} neu, {summary['overwrite']} aktualisiert, "
+              f"{summary['unchanged']} unverändert")
+        
+        result = {
+            "project": project_label,
+            "status": "migrated",
+            "backup": str(backup_path),
+            "backup_stats": self.backup_stats(backup_path),
+            "bmad_core": str(bmad_core),
+            "config": project_config,
+            "plan": summary
+        }
+        self.journal.record_result(journal_key, result, needs_registry=STEP_REGISTRY not in done_steps)
+        return result
+    
+    def _register_project(self, project_path: Path, project_config: Dict[str, Any]):
+        """Registrierung vormerken - geschrieben wird gesammelt in _flush_registrations"""
+        with self._registry_lock:
+            self._pending_registrations.append((str(project_path), project_config))
+    
+    def _flush_registrations(self) -> int:
+        """Schreibe gesammelte Registrierungen als Batch in die globale (SQLite-)Registry"""
+        with self._registry_lock:
+            pending, self._pending_registrations = self._pending_registrations, []
+        registered = self.registry_store.register_projects(pending)
+        for project_path, _ in pending:
+            self.journal.mark_done(project_path, STEP_REGISTRY)
+        return registered
+    
+    def _plan_agent_configs(self, plan: MigrationPlan, project_path: Path, bmad_core: Path):
+        """Plane Migration bestehender Agent-Konfigurationen"""
+        # Geteilter Konverter: identische Legacy-Settings werden nur einmal gerendert
+        for conversion in self.agent_converter.convert_project(project_path, bmad_core):
+            if conversion.error:
+                print(f"Fehler bei Agent-Migration {conversion.legacy_path.name}: {conversion.error}")
+                continue
+            plan.add_file(conversion.target_path, conversion.content, step=STEP_AGENTS)
     
-    def _integrate_global_tasks(self, project_path: Path, bmad_core: Path):
-        """Integriere globale Tasks in neue Struktur"""
-        global_tasks_file = Path.home() / ".bmad-global" / "tasks.json"
+    def _plan_global_tasks(self, plan: MigrationPlan, bmad_core: Path):
+        """Plane Verlinkung der globalen Tasks in die neue Struktur"""
+        task_log = TaskEventLog()
         
-        if global_tasks_file.exists():
+        if task_log.snapshot_file.exists() or task_log.log_file.exists():
             try:
-                with open(global_tasks_file, 'r', encoding='utf-8') as f:
-                    global_tasks = json.load(f)
-                
-                # Link zu globalen Tasks erstellen
-                tasks_dir = bmad_core / "tasks"
-                tasks_link = tasks_dir / "global_tasks_link.json"
-                
-                with open(tasks_link, 'w', encoding='utf-8') as f:
-                    json.dump({
-                        "note": "Link zu globalen BMAD-Tasks",
-                        "global_tasks_path": str(global_tasks_file),
-                        "active_tasks_count": len(global_tasks.get("tasks", [])),
-                        "integration_note": "Diese Tasks sind global verfügbar für alle BMAD-Projekte"
-                    }, f, indent=2)
-                
-                print("✅ Globale Tasks verlinkt")
+                # Nur Snapshot-Metadaten + Log-Tail lesen, nicht das komplette tasks.json
+                plan.add_json(bmad_core / "tasks" / "global_tasks_link.json", {
+                    "note": "Link zu globalen BMAD-Tasks",
+                    "global_tasks_path": str(task_log.snapshot_file),
+                    "active_tasks_count": task_log.task_count(),
+                    "integration_note": "Diese Tasks sind global verfügbar für alle BMAD-Projekte"
+                }, step=STEP_TASKS)
                 
             except Exception as e:
                 print(f"⚠️  Fehler bei Task-Integration: {e}")
     
-    def _create_business_workflows(self, bmad_core: Path):
-        """Erstelle business-spezifische Workflows für Gutachter-App"""
+    def _plan_business_workflows(self, plan: MigrationPlan, bmad_core: Path):
+        """Plane business-spezifische Workflows für Gutachter-App"""
         workflows_dir = bmad_core / "workflows"
         
         # Assessment Workflow
@@ -396,17 +543,62 @@ class BMadProjectMigrator:
             }
         }
         
-        with open(workflows_dir / "assessment.yaml", 'w', encoding='utf-8') as f:
-            yaml.dump(assessment_workflow, f, default_flow_style=False, allow_unicode=True)
-        
-        print("✅ Business-Workflows erstellt")
+        plan.add_yaml(workflows_dir / "assessment.yaml", assessment_workflow)
     
-    def run_full_migration(self) -> Dict[str, Any]:
-        """Führe komplette Migration aller Projekte durch"""
+    def plan_full_migration(self) -> Dict[str, Any]:
+        """Dry-Run: berechne alle Pläne ohne Backup und ohne Schreibzugriffe"""
+        plans = {"projects": {}, "errors": []}
+        for project_name, _, planner, _ in self._migration_targets():
+            try:
+                plan, _ = planner()
+                plans["projects"][project_name] = plan
+            except Exception as e:
+                plans["errors"].append({"project": project_name, "error": str(e)})
+        return plans
+    
+    def _run_single_migration(self, project_name: str, project_path: Path,
+                              migration_func: Callable[[], Dict[str, Any]]) -> Tuple[str, Optional[Dict[str, Any]], Optional[str]]:
+        """Migriere ein einzelnes Projekt - Fehler bleiben auf das Projekt beschränkt"""
+        completed = self.journal.completed_result(str(project_path))
+        if completed is not None:
+            print(f"\n⏩ {project_name}: bereits im abgebrochenen Lauf migriert")
+            return project_name, completed, None
+        
+        try:
+            print(f"\n📋 Migriere {project_name}...")
+            with instrumentation.project(project_name):
+                result = migration_func()
+            print(f"✅ {project_name} erfolgreich migriert")
+            return project_name, result, None
+            
+        except Exception as e:
+            error_msg = f"❌ Fehler bei Migration von {project_name}: {str(e)}"
+            print(error_msg)
+            return project_name, None, str(e)
+    
+    def run_full_migration(self, parallel: bool = False, max_workers: int = 4,
+                           resume: bool = False) -> Dict[str, Any]:
+        """Führe komplette Migration aller Projekte durch
+        
+        Mit parallel=True laufen die Projekte in einem begrenzten Thread-Pool
+        (I/O-gebunden); nur die Registry-Registrierung wird serialisiert.
+        Mit resume=True wird der letzte abgebrochene Lauf fortgesetzt.
+        """
         print("🚀 Starte BMAD-Projekt Migration...")
         print(f"📦 Backups werden gespeichert in: {self.backup_dir}")
         
+        run_id, resumed = self.journal.start_run(resume=resume)
+        if resumed:
+            print(f"⏩ Setze abgebrochenen Lauf {run_id} fort")
+        elif resume:
+            print("ℹ️  Kein abgebrochener Lauf gefunden - starte neu")
+        
+        self.writer.reset()
+        instrumentation.reset()
+        
         migration_results = {
+            "run_id": run_id,
+            "resumed": resumed,
             "started_at": datetime.now().isoformat(),
             "projects": [],
             "errors": [],
@@ -414,49 +606,191 @@ class BMadProjectMigrator:
         }
         
         # Migriere alle Projekte
-        migrations = [
-            ("Claude Global", self.migrate_claude_global_project),
-            ("MCP Infrastructure", self.migrate_mcp_infrastructure_project), 
-            ("Gutachter App", self.migrate_gutachter_project)
-        ]
-        
-        for project_name, migration_func in migrations:
-            try:
-                print(f"\n📋 Migriere {project_name}...")
-                result = migration_func()
+        migrations = [(name, path, migrate) for name, path, _, migrate in self._migration_targets()]
+        
+        if parallel and max_workers > 1:
+            print(f"⚡ Parallele Migration mit {max_workers} Workern")
+            with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="bmad-migration") as executor:
+                # map() liefert die Ergebnisse in Eingabe-Reihenfolge -> identischer Bericht
+                outcomes = list(executor.map(lambda item: self._run_single_migration(*item), migrations))
+        else:
+            outcomes = [self._run_single_migration(*item) for item in migrations]
+        
+        for project_name, result, error in outcomes:
+            if error is None:
                 migration_results["projects"].append(result)
-                print(f"✅ {project_name} erfolgreich migriert")
-                
-            except Exception as e:
-                error_msg = f"❌ Fehler bei Migration von {project_name}: {str(e)}"
-                print(error_msg)
+            else:
                 migration_results["errors"].append({
                     "project": project_name,
-                    "error": str(e)
+                    "error": error
                 })
         
+        with instrumentation.stage("registry_flush"):
+            registered = self._flush_registrations()
+        
         # Zusammenfassung
         migration_results["completed_at"] = datetime.now().isoformat()
         migration_results["summary"] = {
             "total_projects": len(migrations),
             "successful_migrations": len(migration_results["projects"]),
             "failed_migrations": len(migration_results["errors"]),
-            "backup_location": str(self.backup_dir)
+            "backup_location": str(self.backup_dir),
+            "registered_projects": registered,
+            "backups": self._backup_summary(migration_results["projects"]),
+            "writes": self.writer.report(),
+            "agent_configs": dict(self.agent_converter.stats, failed=list(self.agent_converter.failed))
         }
+        # Zeit und I/O je Projekt und Stufe
+        migration_results["instrumentation"] = instrumentation.report()
+        migration_results["summary"]["stages"] = instrumentation.totals_by_stage()
         
         # Migrations-Bericht speichern
         report_file = self.backup_dir / f"migration_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        with open(report_file, 'w', encoding='utf-8') as f:
-            json.dump(migration_results, f, indent=2, ensure_ascii=False)
+        self.writer.write_json(report_file, migration_results, indent=2, ensure_ascii=False)
         
+        # Nur fehlerfreie Läufe abschließen - sonst kann --resume nachholen
+        if not migration_results["errors"]:
+            self.journal.finish_run(successful_migrations=len(migration_results["projects"]))
+        
+        writes = migration_results["summary"]["writes"]
         print(f"\n📊 Migrations-Bericht: {report_file}")
+        print(f"💾 {writes['files_written']} Dateien geschrieben ({writes['bytes_written']} Bytes), "
+              f"{writes['files_unchanged']} unverändert")
+        stages = sorted(migration_results["summary"]["stages"].items(), key=lambda item: -item[1]["wall_time"])
+        if stages:
+            print("⏱️  " + ", ".join(f"{name} {entry['wall_time']:.2f}s" for name, entry in stages[:4]))
         print(f"✅ Migration abgeschlossen: {migration_results['summary']['successful_migrations']}/{migration_results['summary']['total_projects']} Projekte erfolgreich")
         
         return migration_results
+    
+    def _backup_summary(self, results: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Gesamt-Kompressionsrate und Durchsatz über alle Backups dieses Laufs"""
+        stats = [r["backup_stats"] for r in results if r.get("backup_stats")]
+        summary = {"mode": self.backup_mode, "backups": len(stats),
+                   "bytes": sum(s.get("bytes", 0) for s in stats)}
+        if self.backup_mode == "archive" and stats:
+            compressed = sum(s["compressed_bytes"] for s in stats)
+            seconds = sum(s["seconds"] for s in stats)
+            summary["compressed_bytes"] = compressed
+            summary["compression_ratio"] = round(summary["bytes"] / compressed, 3) if compressed else 0.0
+            summary["throughput_mb_s"] = round(summary["bytes"] / seconds / (1024 * 1024), 2) if seconds else 0.0
+        return summary
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Kommandozeilen-Optionen"""
+    parser = argparse.ArgumentParser(description="BMAD Project Migration Tool v2.0")
+    parser.add_argument("--parallel", action="store_true",
+                        help="Projekte parallel migrieren (begrenzter Worker-Pool)")
+    parser.add_argument("--workers", type=int, default=4,
+                        help="Anzahl paralleler Worker (Standard: 4)")
+    parser.add_argument("--resume", action="store_true",
+                        help="Abgebrochenen Lauf fortsetzen (erledigte Schritte überspringen)")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="Nur planen: Änderungen als Diff anzeigen, nichts schreiben")
+    parser.add_argument("--scan", action="append", default=[], metavar="ROOT",
+                        help="Projekte unter ROOT suchen statt der bekannten Pfade (mehrfach möglich)")
+    parser.add_argument("--scan-depth", type=int, default=DEFAULT_MAX_DEPTH, metavar="N",
+                        help=f"Maximale Verzeichnistiefe für --scan (Standard: {DEFAULT_MAX_DEPTH})")
+    parser.add_argument("--no-scan-cache", action="store_true",
+                        help="mtime-Cache des Workspace-Scans nicht verwenden")
+    parser.add_argument("--import-registry", nargs="?", const="", metavar="FILE",
+                        help="Bestehende JSON-Registry einmalig in die SQLite-Registry importieren")
+    parser.add_argument("--backup-exclude", action="append", default=[], metavar="NAME",
+                        help="Zusätzlicher Datei-/Ordnername, der nicht gesichert wird")
+    parser.add_argument("--backup-include", action="append", default=[], metavar="NAME",
+                        help="Standard-Ausschluss entfernen (z.B. 'logs')")
+    parser.add_argument("--backup-max-file-mb", type=float, metavar="MB",
+                        help="Dateien über dieser Größe nicht sichern")
+    parser.add_argument("--backup-max-total-mb", type=float, metavar="MB",
+                        help="Maximales Backup-Volumen pro Projekt")
+    parser.add_argument("--backup-mode", choices=["snapshot", "archive"], default="snapshot",
+                        help="snapshot = deduplizierter Store, archive = komprimiertes Archiv")
+    parser.add_argument("--backup-compression", choices=sorted(SUFFIXES),
+                        help="Kompression für --backup-mode archive (Standard: zstd falls installiert, sonst gzip)")
+    parser.add_argument("--list-backups", action="store_true",
+                        help="Vorhandene Backup-Snapshots anzeigen")
+    parser.add_argument("--restore", metavar="SNAPSHOT",
+                        help="Snapshot wiederherstellen (ID oder Manifest-Pfad)")
+    parser.add_argument("--restore-to", metavar="DIR",
+                        help="Zielverzeichnis für --restore (Standard: Original-Pfad)")
+    parser.add_argument("--restore-file", metavar="PATH",
+                        help="Nur diese Datei aus einem Archiv wiederherstellen (mit --restore)")
+    parser.add_argument("--prune-backups", type=int, metavar="N",
+                        help="Nur die letzten N Snapshots pro Projekt behalten")
+    return parser.parse_args(argv)
+
+
+def _megabytes(value: Optional[float]) -> Optional[int]:
+    return int(value * 1024 * 1024) if value is not None else None
+
+
+def run_backup_command(migrator: BMadProjectMigrator, args: argparse.Namespace) -> Optional[int]:
+    """Backup-Verwaltung (--list-backups, --restore, --prune-backups)"""
+    store = migrator.backup_store
+    
+    if args.list_backups:
+        for snapshot in store.list_snapshots():
+            stats = snapshot["stats"]
+            print(f"  • {snapshot['id']}: {stats['files']} Dateien, "
+                  f"{stats['new_bytes']}/{stats['bytes']} Bytes neu gespeichert")
+        for archive in store.list_archives():
+            stats = archive["stats"]
+            print(f"  • {archive['id']}: {stats['files']} Dateien, "
+                  f"{stats['compressed_bytes']}/{stats['bytes']} Bytes (Faktor {stats['compression_ratio']})")
+        return 0
+    
+    if args.restore:
+        archive = store.find_archive(args.restore)
+        source = archive.index["source"] if archive else None
+        target = args.restore_to or source or store.load_manifest(args.restore)["source"]
+        
+        if args.restore_file:
+            if archive is None:
+                print("❌ --restore-file funktioniert nur mit Backup-Archiven")
+                return 1
+            dest = archive.extract_file(args.restore_file, Path(target))
+            print(f"✅ {args.restore_file} wiederhergestellt -> {dest}")
+            return 0
+        
+        result = store.restore(args.restore, Path(target))
+        print(f"✅ Snapshot {result['snapshot']} wiederhergestellt: {result['files']} Dateien -> {result['target']}")
+        return 0
+    
+    if args.prune_backups is not None:
+        result = store.prune(keep_last=args.prune_backups)
+        print(f"🧹 {result['removed_snapshots']} Snapshots, {result['removed_archives']} Archive und "
+              f"{result['removed_blobs']} Blobs entfernt "
+              f"({result['freed_bytes']} Bytes)")
+        return 0
+    
+    return None
 
 
-def main():
+def print_dry_run(migrator: BMadProjectMigrator) -> int:
+    """Zeige geplante Änderungen aller Projekte"""
+    plans = migrator.plan_full_migration()
+    
+    for project_name, plan in plans["projects"].items():
+        summary = plan.summary()
+        print(f"\n📋 {project_name}: {summary['create']} neu, {summary['overwrite']} überschrieben, "
+              f"{summary['unchanged']} unverändert, {summary['missing_paths']} fehlende Template-Pfade, "
+              f"{summary['registry_updates']} Registry-Updates")
+        if plan.has_changes:
+            print(plan.diff())
+        else:
+            print("   Keine Änderungen - Migration würde übersprungen")
+    
+    for error in plans["errors"]:
+        print(f"❌ Planung fehlgeschlagen für {error['project']}: {error['error']}")
+    
+    return 1 if plans["errors"] else 0
+
+
+def main(argv: Optional[List[str]] = None):
     """Haupt-Migrations-Skript"""
+    args = parse_args(argv)
+    
     # Fix Windows Console Encoding
     if os.name == 'nt':
         os.system('chcp 65001 > nul')
@@ -464,13 +798,40 @@ def main():
     print("BMAD Project Migration Tool v2.0")
     print("=" * 50)
     
-    migrator = BMadProjectMigrator()
+    backup_ignore = (set(DEFAULT_IGNORE_NAMES) | set(args.backup_exclude)) - set(args.backup_include)
+    migrator = BMadProjectMigrator(
+        backup_ignore=sorted(backup_ignore),
+        max_backup_file_size=_megabytes(args.backup_max_file_mb),
+        max_backup_bytes=_megabytes(args.backup_max_total_mb),
+        backup_mode=args.backup_mode,
+        backup_compression=args.backup_compression
+    )
+    
+    exit_code = run_backup_command(migrator, args)
+    if exit_code is not None:
+        return exit_code
+    
+    if args.import_registry is not None:
+        imported = migrator.registry_store.import_registry_file(Path(args.import_registry) if args.import_registry else None)
+        print(f"✅ {imported} Projekte in {migrator.registry_store.db_path} importiert")
+        return 0
+    
+    if args.scan:
+        migrator.discover_projects([Path(root) for root in args.scan], max_depth=args.scan_depth,
+                                   max_workers=args.workers, use_cache=not args.no_scan_cache)
+        if not migrator.discovered_projects:
+            print("⚠️  Keine BMAD-Projekte gefunden")
+            return 1
+    
+    if args.dry_run:
+        return print_dry_run(migrator)
     
-    # Prüfe ob Projekte existieren
+    # Prüfe ob Projekte existieren (nur bekannte Pfade - gescannte existieren)
     missing_projects = []
-    for name, path in migrator.existing_projects.items():
-        if not path.exists():
-            missing_projects.append(f"{name}: {path}")
+    if not migrator.discovered_projects:
+        for name, path in migrator.existing_projects.items():
+            if not path.exists():
+                missing_projects.append(f"{name}: {path}")
     
     if missing_projects:
         print("⚠️  Folgende Projekte wurden nicht gefunden:")
@@ -480,7 +841,8 @@ def main():
     
     # Führe Migration durch
     try:
-        results = migrator.run_full_migration()
+        results = migrator.run_full_migration(parallel=args.parallel, max_workers=args.workers,
+                                              resume=args.resume)
         
         if results["summary"]["successful_migrations"] > 0:
             print("\n🎉 Migration erfolgreich!")
@@ -488,7 +850,7 @@ def main():
             print("1. Prüfe migrierte Projekt-Konfigurationen")
             print("2. Teste BMAD MCP Server: python -m src.bmad_mcp.server")
             print("3. Verwende neue Template-Tools: bmad_create_project")
-            print("4. Alte Backup-Dateien nach Bedarf löschen")
+            print("4. Alte Backups nach Bedarf aufräumen: --prune-backups N")
             
         return 0
         
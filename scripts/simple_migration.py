@@ -5,21 +5,26 @@ Einfache BMAD Migration ohne Unicode für Windows-Kompatibilität
 
 import os
 import sys
-import json
-import yaml
-import shutil
+import argparse
 from pathlib import Path
 from datetime import datetime
 
 # Füge src-Pfad hinzu
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from bmad_mcp.core.project_templates import template_manager
 from bmad_mcp.core.global_registry import global_registry
+from bmad_mcp.core.atomic_writer import atomic_writer
+from bmad_mcp.core.template_layout import create_template_structure
+from bmad_mcp.core.workspace_scanner import discover_projects
 
 
-def main():
+def main(argv=None):
     """Einfache Migration"""
+    parser = argparse.ArgumentParser(description="BMAD Project Migration Tool v2.0")
+    parser.add_argument("--scan", action="append", default=[], metavar="ROOT",
+                        help="Projekte unter ROOT suchen statt der bekannten Pfade")
+    args = parser.parse_args(argv)
+    
     print("BMAD Project Migration Tool v2.0")
     print("=" * 40)
     
@@ -30,6 +35,11 @@ def main():
         "Gutachter App": Path.home() / "AppData" / "Roaming" / "Claude" / "gutachter-app"
     }
     
+    # Gefundene Projekte ersetzen die bekannten Pfade
+    if args.scan:
+        projects = {str(project.path): project.path for project in discover_projects([Path(r) for r in args.scan])}
+        print(f"SCAN: {len(projects)} Projekte gefunden")
+    
     backup_dir = Path.home() / ".bmad-global" / "migration-backups"
     backup_dir.mkdir(parents=True, exist_ok=True)
     
@@ -51,9 +61,7 @@ def main():
                 bmad_core.mkdir(parents=True, exist_ok=True)
                 
                 # Standard-Struktur erstellen
-                template_config = template_manager._get_standard_template()
-                structure = template_config["structure"][".bmad-core"]
-                template_manager._create_directory_structure(bmad_core, structure)
+                create_template_structure(bmad_core, "standard")
                 
                 # Basis-Konfiguration
                 project_config = {
@@ -66,9 +74,8 @@ def main():
                     "bmad_version": "2.0.0"
                 }
                 
-                # Konfiguration schreiben
-                with open(bmad_core / "project.yaml", 'w', encoding='utf-8') as f:
-                    yaml.dump(project_config, f, default_flow_style=False, allow_unicode=True)
+                # Konfiguration schreiben (nur bei Änderung)
+                atomic_writer.write_yaml(bmad_core / "project.yaml", project_config)
                 
                 print("OK: .bmad-core erstellt")
                 migrated_count += 1
@@ -0,0 +1,3 @@
+"""
+BMAD MCP Server - Python-Paket
+"""
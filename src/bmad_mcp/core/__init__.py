@@ -0,0 +1,3 @@
+"""
+BMAD Core - Kernfunktionalität (Tasks, Registry, Templates, Migration)
+"""
@@ -0,0 +1,247 @@
+"""
+BMAD Agent Config Converter
+Batch-Konvertierung der Legacy-Agent-Settings (bmad-*-settings.json)
+
+Die model_preferences kommen aus config/bmad-global-config.yaml (bmad_agents),
+geparst über den gemeinsamen Cache des Config-Resolvers. Identische
+Legacy-Dateien - projektübergreifend häufig - werden über ihren Inhalts-Hash nur
+einmal geparst und serialisiert; geschrieben wird über den Write-if-changed
+AtomicWriter.
+"""
+
+import hashlib
+import json
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .atomic_writer import AtomicWriter, atomic_writer, render_yaml
+from .config_resolver import (
+    ConfigFileCache,
+    Signature,
+    config_resolver,
+    default_config_dir,
+)
+from .instrumentation import instrumentation
+from .serialization import YAMLError
+
+# Legacy-Datei -> Agent-Name (Ziel: .bmad-core/agents/<agent>.yaml)
+LEGACY_AGENT_FILES = {
+    "bmad-dev-settings.json": "dev",
+    "bmad-analyst-settings.json": "analyst",
+    "bmad-architect-settings.json": "architect",
+    "bmad-pm-settings.json": "pm",
+}
+
+# Fallback, wenn die globale Konfiguration fehlt oder den Agent nicht kennt
+DEFAULT_MODEL_PREFERENCES = {
+    "primary": "claude-3-sonnet",
+    "fallback": "claude-3-haiku",
+    "temperature": 0.1,
+}
+
+DEFAULT_PERMISSIONS = {"file_access": True, "api_access": True, "git_access": True}
+
+
+def default_global_config_file() -> Path:
+    return default_config_dir() / "bmad-global-config.yaml"
+
+
+def agent_defaults_from_config(config: Any) -> Dict[str, Dict[str, Any]]:
+    """model_preferences je Agent aus dem bmad_agents-Block der globalen Config"""
+    defaults = {}
+    agents = config.get("bmad_agents") if isinstance(config, dict) else None
+    for agent, settings in (agents or {}).items():
+        if not isinstance(settings, dict):
+            continue
+        preferences = dict(DEFAULT_MODEL_PREFERENCES)
+        if settings.get("model"):
+            preferences["primary"] = settings["model"]
+        if settings.get("temperature") is not None:
+            preferences["temperature"] = settings["temperature"]
+        defaults[agent] = preferences
+    return defaults
+
+
+def load_agent_defaults(
+    config_file: Optional[Path] = None, cache: Optional[ConfigFileCache] = None
+) -> Tuple[Signature, Dict[str, Dict[str, Any]]]:
+    """(Signatur, Defaults) - geparst wird über den gemeinsamen Config-Cache"""
+    config_file = Path(config_file) if config_file else default_global_config_file()
+    try:
+        signature, config = (cache or config_resolver.cache).load(config_file)
+    except (OSError, YAMLError):
+        return None, {}
+    return signature, agent_defaults_from_config(config)
+
+
+@dataclass
+class AgentConversion:
+    """Ergebnis für eine Legacy-Datei; content ist bereits gerendertes YAML"""
+
+    agent: str
+    legacy_path: Path
+    target_path: Path
+    content: Optional[bytes] = None
+    error: Optional[str] = None
+
+
+class AgentConfigConverter:
+    """Konvertiert Legacy-Agent-Settings vieler Projekte in einem Durchlauf"""
+
+    def __init__(self, global_config_file: Optional[Path] = None):
+        self.global_config_file = global_config_file
+        self._lock = threading.Lock()
+        # (Agent, Legacy-Datei, SHA-256 des Inhalts, Defaults-Signatur) -> YAML
+        self._rendered: Dict[Tuple[str, str, str, Signature], bytes] = {}
+        self.stats = {"files": 0, "converted": 0, "memo_hits": 0, "errors": 0}
+        # Fehlgeschlagene Dateien: {"file": Pfad, "error": Meldung}
+        self.failed: List[Dict[str, str]] = []
+
+    def defaults(self) -> Tuple[Signature, Dict[str, Dict[str, Any]]]:
+        """Aktuelle Defaults; eine geänderte globale Config wird neu geladen"""
+        return load_agent_defaults(self.global_config_file)
+
+    def model_preferences(self, agent: str) -> Dict[str, Any]:
+        return dict(self.defaults()[1].get(agent, DEFAULT_MODEL_PREFERENCES))
+
+    # ------------------------------------------------------------------
+    # Konvertierung
+    # ------------------------------------------------------------------
+
+    def build_agent_config(
+        self,
+        agent: str,
+        legacy_file: str,
+        legacy_config: Any,
+        model_preferences: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        if model_preferences is None:
+            model_preferences = self.model_preferences(agent)
+        return {
+            "name": f"bmad-{agent}",
+            "version": "2.0.0",
+            "enabled": True,
+            "migrated_from": legacy_file,
+            "legacy_config": legacy_config,
+            "model_preferences": dict(model_preferences),
+            "permissions": dict(DEFAULT_PERMISSIONS),
+        }
+
+    def convert_project(
+        self, project_path: Path, bmad_core: Optional[Path] = None
+    ) -> List[AgentConversion]:
+        """Alle Legacy-Agent-Settings eines Projekts konvertieren"""
+        project_path = Path(project_path)
+        agents_dir = (
+            Path(bmad_core) if bmad_core else project_path / ".bmad-core"
+        ) / "agents"
+        conversions = []
+        for legacy_file, agent in LEGACY_AGENT_FILES.items():
+            legacy_path = project_path / legacy_file
+            try:
+                with open(legacy_path, "rb") as f:
+                    raw = f.read()
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+            except OSError as e:
+                conversions.append(self._failed(agent, legacy_path, agents_dir, e))
+                continue
+            instrumentation.count(bytes_read=len(raw))
+
+            # Jede Datei für sich: ein kaputtes Legacy-File bricht den Batch nicht ab
+            try:
+                content = self._render(agent, legacy_file, raw)
+            except Exception as e:
+                conversions.append(self._failed(agent, legacy_path, agents_dir, e))
+                continue
+            conversions.append(
+                AgentConversion(
+                    agent=agent,
+                    legacy_path=legacy_path,
+                    target_path=agents_dir / f"{agent}.yaml",
+                    content=content,
+                )
+            )
+        return conversions
+
+    def convert_many(
+        self, project_paths: Iterable[Path]
+    ) -> Dict[Path, List[AgentConversion]]:
+        """Batch über mehrere Projekte; identische Settings nur einmal rendern"""
+        return {Path(path): self.convert_project(path) for path in project_paths}
+
+    def write(
+        self,
+        conversions: Iterable[AgentConversion],
+        writer: Optional[AtomicWriter] = None,
+    ) -> Dict[str, int]:
+        """Konvertierte Configs schreiben; unveränderte Dateien werden übersprungen"""
+        writer = writer or atomic_writer
+        counts = {"written": 0, "unchanged": 0, "errors": 0}
+        for conversion in conversions:
+            if conversion.content is None:
+                counts["errors"] += 1
+                continue
+            try:
+                written = writer.write_bytes(conversion.target_path, conversion.content)
+            except OSError as e:
+                conversion.error = str(e)
+                self._record_failure(conversion.target_path, conversion.error)
+                counts["errors"] += 1
+                continue
+            counts["written" if written else "unchanged"] += 1
+        return counts
+
+    def _render(self, agent: str, legacy_file: str, raw: bytes) -> bytes:
+        signature, defaults = self.defaults()
+        key = (agent, legacy_file, hashlib.sha256(raw).hexdigest(), signature)
+        with self._lock:
+            self.stats["files"] += 1
+            content = self._rendered.get(key)
+            if content is not None:
+                self.stats["memo_hits"] += 1
+                return content
+
+        legacy_config = json.loads(raw.decode("utf-8"))
+        preferences = defaults.get(agent, DEFAULT_MODEL_PREFERENCES)
+        content = render_yaml(
+            self.build_agent_config(agent, legacy_file, legacy_config, preferences)
+        )
+        with self._lock:
+            self._rendered[key] = content
+            self.stats["converted"] += 1
+        return content
+
+    def _failed(
+        self, agent: str, legacy_path: Path, agents_dir: Path, error: Exception
+    ) -> AgentConversion:
+        message = f"{type(error).__name__}: {error}"
+        with self._lock:
+            self.stats["errors"] += 1
+        self._record_failure(legacy_path, message)
+        return AgentConversion(
+            agent=agent,
+            legacy_path=legacy_path,
+            target_path=agents_dir / f"{agent}.yaml",
+            error=message,
+        )
+
+    def _record_failure(self, path: Path, message: str):
+        with self._lock:
+            self.failed.append({"file": str(path), "error": message})
+
+
+def convert_agent_configs(
+    project_paths: Iterable[Path],
+    writer: Optional[AtomicWriter] = None,
+    global_config_file: Optional[Path] = None,
+) -> Dict[str, Any]:
+    """Einmal-Aufruf: Legacy-Agent-Settings vieler Projekte konvertieren"""
+    converter = AgentConfigConverter(global_config_file)
+    batches = converter.convert_many(project_paths)
+    counts = converter.write(
+        [c for conversions in batches.values() for c in conversions], writer
+    )
+    return dict(counts, conversion=dict(converter.stats), failed=list(converter.failed))
@@ -0,0 +1,149 @@
+"""
+BMAD Atomic Writer
+Idempotente Schreibschicht für YAML/JSON-Dateien
+
+Inhalte werden im Speicher serialisiert und per Hash mit der bestehenden Datei
+verglichen. Nur bei Änderungen wird über Temp-Datei + Rename geschrieben, so dass
+mtimes stabil bleiben und IDEs/File-Watcher nicht unnötig anspringen.
+"""
+
+import hashlib
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from .instrumentation import instrumentation
+from .serialization import dump_json_bytes, dump_yaml_bytes
+
+_CHUNK_SIZE = 1024 * 1024
+
+# Eingesparte Syscalls pro übersprungenem Schreiben (mkstemp, write, chmod, replace)
+_WRITE_SYSCALLS = 4
+
+
+def _file_digest(path: Path) -> Optional[str]:
+    try:
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(_CHUNK_SIZE), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+    except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+        return None
+
+
+# Serialisierung kommt aus dem zentralen Backend (libyaml, falls verfügbar)
+render_yaml = dump_yaml_bytes
+render_json = dump_json_bytes
+
+
+def _default_mode() -> int:
+    # mkstemp legt 0600 an - neue Dateien sollen die übliche umask-Berechtigung bekommen
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+
+# Einmal beim Import ermitteln: os.umask() ist prozessweit und nicht thread-sicher
+_DEFAULT_MODE = _default_mode()
+
+
+class AtomicWriter:
+    """Write-if-changed mit atomarem Ersetzen und Laufzeit-Statistik"""
+
+    def __init__(self, fsync: bool = False):
+        self.fsync = fsync
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Zähler für einen neuen Lauf zurücksetzen"""
+        with self._lock:
+            self.stats = {
+                "files_written": 0,
+                "files_unchanged": 0,
+                "bytes_written": 0,
+                "bytes_unchanged": 0,
+            }
+
+    def report(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self.stats)
+
+    def write_bytes(self, path: Path, content: bytes) -> bool:
+        """Schreibe nur bei geändertem Inhalt; True wenn geschrieben wurde"""
+        path = Path(path)
+
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            st = None
+
+        # Größe unterschiedlich -> sicher geändert, Hash nur bei gleicher Größe nötig
+        if st is not None and st.st_size == len(content):
+            instrumentation.count(bytes_read=st.st_size)
+            if _file_digest(path) == hashlib.sha256(content).hexdigest():
+                self._count(written=False, size=len(content))
+                return False
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(
+            dir=path.parent, prefix=f".{path.name}.", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(content)
+                if self.fsync:
+                    f.flush()
+                    os.fsync(f.fileno())
+            os.chmod(
+                tmp_name, (st.st_mode & 0o777) if st is not None else _DEFAULT_MODE
+            )
+            os.replace(tmp_name, path)
+        except BaseException:
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+            raise
+
+        self._count(written=True, size=len(content))
+        return True
+
+    def record_unchanged(self, size: int):
+        """Bereits anderweitig als unverändert erkannte Datei mitzählen"""
+        self._count(written=False, size=size)
+
+    def write_text(self, path: Path, text: str, encoding: str = "utf-8") -> bool:
+        return self.write_bytes(path, text.encode(encoding))
+
+    def write_yaml(self, path: Path, data: Any) -> bool:
+        return self.write_bytes(path, render_yaml(data))
+
+    def write_json(
+        self,
+        path: Path,
+        data: Any,
+        indent: Optional[int] = 2,
+        ensure_ascii: bool = True,
+    ) -> bool:
+        return self.write_bytes(
+            path, render_json(data, indent=indent, ensure_ascii=ensure_ascii)
+        )
+
+    def _count(self, written: bool, size: int):
+        if written:
+            instrumentation.count(bytes_written=size, files_touched=1)
+        else:
+            instrumentation.count(syscalls_avoided=_WRITE_SYSCALLS)
+        with self._lock:
+            if written:
+                self.stats["files_written"] += 1
+                self.stats["bytes_written"] += size
+            else:
+                self.stats["files_unchanged"] += 1
+                self.stats["bytes_unchanged"] += size
+
+
+# Prozessweiter Writer für Skripte ohne eigene Instanz
+atomic_writer = AtomicWriter()
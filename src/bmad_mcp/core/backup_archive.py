@@ -0,0 +1,516 @@
+"""
+BMAD Backup Archive
+Komprimierte, streamend geschriebene Backup-Archive mit Index für Einzelzugriff
+
+Aufbau (.tar.gz bzw. .tar.zst):
+    [Block 1] ... [Block n]    gzip-Member / zstd-Frames mit je 1..n Tar-Einträgen
+    [Index]                    Tar-Eintrag .bmad-archive-index.json (Block-Offsets)
+    [Tar-Ende]                 zwei Null-Blöcke
+    [Footer]                   feste Größe: Magic + Offset/Länge des Index
+                               (gzip: stored-Member, zstd: Skippable Frame)
+
+Die Datei bleibt ein gültiges tar.gz / tar.zst (tar xf funktioniert). Dateien
+werden direkt aus dem Projekt in den Kompressor gestreamt - ohne Zwischenkopie.
+Eine einzelne Datei lässt sich über den Index per Seek entpacken.
+
+Kleine Dateien (YAML, Markdown - der Großteil eines BMAD-Projekts) teilen sich
+einen Block von etwa SOLID_BLOCK_SIZE unkomprimierten Bytes, damit die
+Kompression Wiederholungen über Dateigrenzen hinweg nutzt. Der Index speichert
+Offset/Länge des Blocks und die Position des Eintrags darin ("skip"); eine
+Einzeldatei kostet damit höchstens einen Block Dekompression. Dateien ab
+SOLID_BLOCK_SIZE bekommen einen eigenen Block, block_size=0 ergibt einen Block
+pro Datei (wie Format 1).
+"""
+
+import gzip
+import io
+import json
+import os
+import struct
+import tarfile
+import time
+import zlib
+from datetime import datetime
+from pathlib import Path
+from typing import IO, Any, BinaryIO, Callable, Dict, Iterable, List, Optional, cast
+
+try:
+    import zstandard
+
+    ZSTD_AVAILABLE = True
+except ImportError:
+    zstandard = None  # type: ignore[assignment]
+    ZSTD_AVAILABLE = False
+
+from .fs_walker import EVENT_BUDGET, EVENT_FILE, EVENT_SKIP, SKIP_UNREADABLE, WalkEvent
+from .instrumentation import instrumentation
+
+ARCHIVE_FORMAT = 2
+INDEX_NAME = ".bmad-archive-index.json"
+
+COMPRESSION_GZIP = "gzip"
+COMPRESSION_ZSTD = "zstd"
+SUFFIXES = {COMPRESSION_GZIP: ".tar.gz", COMPRESSION_ZSTD: ".tar.zst"}
+DEFAULT_LEVELS = {COMPRESSION_GZIP: 6, COMPRESSION_ZSTD: 3}
+
+_FOOTER_MAGIC = b"BMADIDX1"
+_FOOTER_PAYLOAD = struct.Struct("<8sQQ")  # Magic, Index-Offset, Index-Länge
+_ZSTD_SKIPPABLE_MAGIC = 0x184D2A5B
+_CHUNK_SIZE = 1024 * 1024
+SOLID_BLOCK_SIZE = 256 * 1024
+_BLOCK = tarfile.BLOCKSIZE
+
+
+def default_compression() -> str:
+    return COMPRESSION_ZSTD if ZSTD_AVAILABLE else COMPRESSION_GZIP
+
+
+def is_archive(path: Path) -> bool:
+    return any(str(path).endswith(suffix) for suffix in SUFFIXES.values())
+
+
+def compression_for(path: Path) -> str:
+    return (
+        COMPRESSION_ZSTD
+        if str(path).endswith(SUFFIXES[COMPRESSION_ZSTD])
+        else COMPRESSION_GZIP
+    )
+
+
+def _require_zstd():
+    if not ZSTD_AVAILABLE:
+        raise RuntimeError(
+            "zstd-Archive benötigen das Paket 'zstandard' (pip install zstandard)"
+        )
+
+
+# ----------------------------------------------------------------------
+# Kompression pro Block
+# ----------------------------------------------------------------------
+
+
+def _compressor(compression: str, level: int):
+    """Objekt mit compress()/flush(); flush() schließt einen eigenständigen Block ab"""
+    if compression == COMPRESSION_ZSTD:
+        _require_zstd()
+        return zstandard.ZstdCompressor(level=level).compressobj()
+    return zlib.compressobj(level, zlib.DEFLATED, 31)
+
+
+def _encode_footer(compression: str, index_offset: int, index_length: int) -> bytes:
+    payload = _FOOTER_PAYLOAD.pack(_FOOTER_MAGIC, index_offset, index_length)
+    if compression == COMPRESSION_ZSTD:
+        return struct.pack("<II", _ZSTD_SKIPPABLE_MAGIC, len(payload)) + payload
+    # Stored (Level 0) gzip-Member: feste Größe und für gzip/tar transparent
+    compressor = zlib.compressobj(0, zlib.DEFLATED, 31)
+    return compressor.compress(payload) + compressor.flush()
+
+
+FOOTER_SIZES = {
+    c: len(_encode_footer(c, 0, 0)) for c in (COMPRESSION_GZIP, COMPRESSION_ZSTD)
+}
+
+
+def _decode_footer(compression: str, data: bytes) -> Dict[str, int]:
+    try:
+        if compression == COMPRESSION_ZSTD:
+            payload = data[8:]
+        else:
+            payload = zlib.decompress(data, 31)
+        magic, offset, length = _FOOTER_PAYLOAD.unpack(payload)
+    except (zlib.error, struct.error):
+        magic = None
+    if magic != _FOOTER_MAGIC:
+        raise ValueError("Kein BMAD-Archiv (Footer fehlt oder beschädigt)")
+    return {"offset": offset, "length": length}
+
+
+# ----------------------------------------------------------------------
+# Schreiben
+# ----------------------------------------------------------------------
+
+
+class ArchiveWriter:
+    """Schreibt Tar-Einträge in unabhängig komprimierte Blöcke"""
+
+    def __init__(
+        self,
+        f: BinaryIO,
+        compression: str,
+        level: Optional[int] = None,
+        block_size: int = SOLID_BLOCK_SIZE,
+    ):
+        self.f = f
+        self.compression = compression
+        self.level = DEFAULT_LEVELS[compression] if level is None else level
+        self.block_size = block_size
+        self.offset = 0
+        self.entries: Dict[str, Dict[str, Any]] = {}
+
+        # Offener Block: Kompressor, Start-Offset, unkomprimierte Bytes, Einträge darin
+        self._compressor: Optional[Any] = None
+        self._block_start = 0
+        self._block_raw = 0
+        self._block_members: List[Dict[str, Any]] = []
+
+    def _write(self, data: bytes):
+        if data:
+            self.f.write(data)
+            self.offset += len(data)
+
+    def _feed(self, data: bytes):
+        if self._compressor is None:
+            raise RuntimeError("Kein offener Block")
+        self._write(self._compressor.compress(data))
+        self._block_raw += len(data)
+
+    def close_block(self):
+        """Offenen Block abschließen und dessen Länge bei allen Einträgen nachtragen"""
+        if self._compressor is None:
+            return
+        self._write(self._compressor.flush())
+        length = self.offset - self._block_start
+        for member in self._block_members:
+            member["length"] = length
+        self._compressor = None
+        self._block_members = []
+
+    def add_stream(
+        self, tarinfo: tarfile.TarInfo, stream: Optional[BinaryIO]
+    ) -> Dict[str, int]:
+        """Einen Tar-Eintrag komprimiert anhängen
+
+        Returns:
+            Offset/Länge des Blocks und Position des Eintrags darin (skip). Die
+            Länge steht erst fest, wenn der Block geschlossen ist.
+        """
+        if tarinfo.size >= self.block_size:
+            self.close_block()
+        if self._compressor is None:
+            self._compressor = _compressor(self.compression, self.level)
+            self._block_start = self.offset
+            self._block_raw = 0
+
+        member = {"offset": self._block_start, "length": 0, "skip": self._block_raw}
+        self._block_members.append(member)
+        self._feed(tarinfo.tobuf(tarfile.PAX_FORMAT, "utf-8", "surrogateescape"))
+
+        remaining = tarinfo.size
+        while stream is not None and remaining > 0:
+            chunk = stream.read(min(_CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            self._feed(chunk)
+        if remaining:
+            # Datei ist während des Backups geschrumpft - Archiv bleibt trotzdem lesbar
+            self._feed(b"\0" * remaining)
+
+        remainder = tarinfo.size % _BLOCK
+        if remainder:
+            self._feed(b"\0" * (_BLOCK - remainder))
+        if self._block_raw >= self.block_size:
+            self.close_block()
+        return member
+
+    def add_file(
+        self, stream: BinaryIO, rel_path: str, st: os.stat_result
+    ) -> Dict[str, Any]:
+        tarinfo = tarfile.TarInfo(rel_path)
+        tarinfo.size = st.st_size
+        tarinfo.mtime = int(st.st_mtime)
+        tarinfo.mode = st.st_mode & 0o777
+        entry = self.add_stream(tarinfo, stream)
+
+        entry.update(size=st.st_size, mtime_ns=st.st_mtime_ns, mode=st.st_mode & 0o777)
+        self.entries[rel_path] = entry
+        return entry
+
+    def finish(self, meta: Dict[str, Any]) -> int:
+        """Index, Tar-Ende und Footer schreiben; liefert die Archivgröße"""
+        self.close_block()
+        index = dict(
+            meta,
+            format=ARCHIVE_FORMAT,
+            compression=self.compression,
+            block_size=self.block_size,
+            files=self.entries,
+        )
+        data = json.dumps(index, ensure_ascii=False).encode("utf-8")
+        tarinfo = tarfile.TarInfo(INDEX_NAME)
+        tarinfo.size = len(data)
+        tarinfo.mtime = int(time.time())
+        member = self.add_stream(tarinfo, io.BytesIO(data))
+        self.close_block()
+
+        compressor = _compressor(self.compression, self.level)
+        self._write(compressor.compress(b"\0" * (2 * _BLOCK)) + compressor.flush())
+        self._write(
+            _encode_footer(self.compression, member["offset"], member["length"])
+        )
+        return self.offset
+
+
+def create_archive(
+    events: Iterable[WalkEvent],
+    archive_path: Path,
+    source: Path,
+    project_name: str,
+    compression: Optional[str] = None,
+    level: Optional[int] = None,
+    progress: Optional[Callable[[WalkEvent], None]] = None,
+    block_size: int = SOLID_BLOCK_SIZE,
+) -> Dict[str, Any]:
+    """Schreibe die Dateien eines Walks als Archiv (atomar über .tmp + replace)
+
+    Returns:
+        Index-Metadaten inkl. Statistik (Kompressionsrate, Durchsatz)
+    """
+    compression = compression or compression_for(archive_path)
+    if compression == COMPRESSION_ZSTD:
+        _require_zstd()
+    archive_path = Path(archive_path)
+    archive_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = archive_path.with_name(archive_path.name + ".tmp")
+
+    skipped: Dict[str, int] = {}
+    complete = True
+    started = time.perf_counter()
+
+    try:
+        with open(tmp_path, "wb") as f:
+            writer = ArchiveWriter(f, compression, level, block_size)
+            original_bytes = 0
+            for event in events:
+                if progress:
+                    progress(event)
+                reason = event.reason or event.kind
+                if event.kind == EVENT_SKIP:
+                    skipped[reason] = skipped.get(reason, 0) + 1
+                    continue
+                if event.kind == EVENT_BUDGET:
+                    complete = False
+                    skipped[reason] = skipped.get(reason, 0) + 1
+                    break
+                if event.kind != EVENT_FILE or Path(event.path) == tmp_path:
+                    continue
+                st = event.stat
+                if st is None:
+                    skipped[SKIP_UNREADABLE] = skipped.get(SKIP_UNREADABLE, 0) + 1
+                    continue
+                # Nur das Öffnen wird abgefangen: Datei seit dem Walk gelöscht oder
+                # nicht lesbar. Fehler beim Schreiben des Members brechen weiter ab.
+                try:
+                    stream = open(event.path, "rb")
+                except OSError:
+                    skipped[SKIP_UNREADABLE] = skipped.get(SKIP_UNREADABLE, 0) + 1
+                    continue
+                with stream:
+                    writer.add_file(stream, event.rel_path, st)
+                original_bytes += st.st_size
+
+            seconds = time.perf_counter() - started
+            meta: Dict[str, Any] = {
+                "project": project_name,
+                "source": str(source),
+                "created_at": datetime.now().isoformat(),
+                "complete": complete,
+                "skipped": skipped,
+                "stats": _archive_stats(
+                    len(writer.entries), original_bytes, writer.offset, seconds
+                ),
+            }
+            archive_size = writer.finish(meta)
+            f.flush()
+        os.replace(tmp_path, archive_path)
+    except BaseException:
+        if tmp_path.exists():
+            tmp_path.unlink()
+        raise
+
+    meta["stats"]["archive_bytes"] = archive_size
+    instrumentation.count(
+        bytes_read=original_bytes, bytes_written=archive_size, files_touched=1
+    )
+    return meta
+
+
+def _archive_stats(
+    files: int, original_bytes: int, compressed_bytes: int, seconds: float
+) -> Dict[str, Any]:
+    return {
+        "files": files,
+        "bytes": original_bytes,
+        "compressed_bytes": compressed_bytes,
+        "compression_ratio": (
+            round(original_bytes / compressed_bytes, 3) if compressed_bytes else 0.0
+        ),
+        "seconds": round(seconds, 4),
+        "throughput_mb_s": (
+            round(original_bytes / seconds / (1024 * 1024), 2) if seconds > 0 else 0.0
+        ),
+    }
+
+
+# ----------------------------------------------------------------------
+# Lesen
+# ----------------------------------------------------------------------
+
+
+class _RangeReader(io.RawIOBase):
+    """Lesezugriff auf einen Byte-Bereich einer Datei"""
+
+    def __init__(self, f: BinaryIO, offset: int, length: int):
+        self.f = f
+        self.remaining = length
+        f.seek(offset)
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        size = min(len(buffer), self.remaining)
+        if size <= 0:
+            return 0
+        data = self.f.read(size)
+        buffer[: len(data)] = data
+        self.remaining -= len(data)
+        return len(data)
+
+
+class BackupArchive:
+    """Lesezugriff auf ein Backup-Archiv über den Index am Dateiende"""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.compression = compression_for(self.path)
+        self._index: Optional[Dict[str, Any]] = None
+
+    @property
+    def index(self) -> Dict[str, Any]:
+        if self._index is None:
+            footer_size = FOOTER_SIZES[self.compression]
+            with open(self.path, "rb") as f:
+                f.seek(-footer_size, os.SEEK_END)
+                footer = _decode_footer(self.compression, f.read(footer_size))
+                buffer = io.BytesIO()
+                self._copy_member_at(f, footer["offset"], footer["length"], 0, buffer)
+                self._index = json.loads(buffer.getvalue().decode("utf-8"))
+        return self._index
+
+    def list_files(self) -> List[str]:
+        return list(self.index["files"])
+
+    def read_file(self, rel_path: str) -> bytes:
+        buffer = io.BytesIO()
+        self._copy_member(rel_path, buffer)
+        return buffer.getvalue()
+
+    def extract_file(self, rel_path: str, target: Path) -> Path:
+        """Eine Datei per Seek entpacken (target = Zielverzeichnis)"""
+        entry = self._entry(rel_path)
+        dest = _safe_destination(Path(target), rel_path)
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        with open(dest, "wb") as out:
+            self._copy_member(rel_path, out)
+        _restore_metadata(dest, entry)
+        return dest
+
+    def extract_all(self, target: Path) -> Dict[str, Any]:
+        """Archiv sequenziell in ein Zielverzeichnis entpacken"""
+        index = self.index
+        target = Path(target)
+        restored_bytes = 0
+
+        with open(self.path, "rb") as raw:
+            stream = self._decompressed_stream(raw)
+            with tarfile.open(fileobj=stream, mode="r|") as tar:
+                for member in tar:
+                    if member.name == INDEX_NAME or not member.isfile():
+                        continue
+                    src = tar.extractfile(member)
+                    if src is None:
+                        continue
+                    dest = _safe_destination(target, member.name)
+                    dest.parent.mkdir(parents=True, exist_ok=True)
+                    with open(dest, "wb") as out:
+                        _copy(src, out)
+                    entry = index["files"].get(member.name)
+                    if entry:
+                        _restore_metadata(dest, entry)
+                    restored_bytes += member.size
+
+        return {
+            "snapshot": self.path.name,
+            "target": str(target),
+            "files": len(index["files"]),
+            "bytes": restored_bytes,
+        }
+
+    def _entry(self, rel_path: str) -> Dict[str, Any]:
+        entry = self.index["files"].get(rel_path)
+        if entry is None:
+            raise FileNotFoundError(f"Datei nicht im Archiv: {rel_path}")
+        return entry
+
+    def _copy_member(self, rel_path: str, out: BinaryIO):
+        entry = self._entry(rel_path)
+        with open(self.path, "rb") as f:
+            # Format 1: ein Member pro Datei, kein "skip"
+            self._copy_member_at(
+                f, entry["offset"], entry["length"], entry.get("skip", 0), out
+            )
+
+    def _copy_member_at(
+        self, f: BinaryIO, offset: int, length: int, skip: int, out: BinaryIO
+    ):
+        """Einen Block dekomprimieren und den Eintrag ab Position skip kopieren"""
+        stream = self._decompressed_stream(
+            io.BufferedReader(_RangeReader(f, offset, length))
+        )
+        while skip > 0:
+            chunk = stream.read(min(_CHUNK_SIZE, skip))
+            if not chunk:
+                raise ValueError("Archiv-Block kürzer als im Index angegeben")
+            skip -= len(chunk)
+        try:
+            tar = tarfile.open(fileobj=stream, mode="r|")
+        except tarfile.ReadError as exc:
+            raise ValueError(
+                f"Archiv-Index zeigt auf keinen Tar-Eintrag: {exc}"
+            ) from exc
+        with tar:
+            member = tar.next()
+            src = tar.extractfile(member) if member is not None else None
+            if src is None:
+                raise ValueError("Archiv-Index zeigt auf keinen Dateieintrag")
+            _copy(src, out)
+
+    def _decompressed_stream(self, raw: IO[bytes]) -> IO[bytes]:
+        if self.compression == COMPRESSION_ZSTD:
+            _require_zstd()
+            return zstandard.ZstdDecompressor().stream_reader(
+                raw, read_across_frames=True
+            )
+        return cast(IO[bytes], gzip.GzipFile(fileobj=raw, mode="rb"))
+
+
+def _copy(src: IO[bytes], dst: IO[bytes]):
+    while True:
+        chunk = src.read(_CHUNK_SIZE)
+        if not chunk:
+            break
+        dst.write(chunk)
+
+
+def _safe_destination(target: Path, rel_path: str) -> Path:
+    dest = (target / rel_path).resolve()
+    if not str(dest).startswith(str(target.resolve()) + os.sep):
+        raise ValueError(f"Unzulässiger Pfad im Archiv: {rel_path}")
+    return dest
+
+
+def _restore_metadata(dest: Path, entry: Dict[str, Any]):
+    os.chmod(dest, entry.get("mode", 0o644))
+    if "mtime_ns" in entry:
+        os.utime(dest, ns=(entry["mtime_ns"], entry["mtime_ns"]))
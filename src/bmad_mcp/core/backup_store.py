@@ -0,0 +1,570 @@
+"""
+BMAD Backup Store
+Inhaltsadressierte, deduplizierte Backups für Projekt-Migrationen
+
+Layout unter dem Store-Verzeichnis:
+    objects/ab/cdef...   Datei-Inhalte, benannt nach SHA-256 (einmalig gespeichert)
+    snapshots/<id>.json  Manifest pro Backup: relativer Pfad -> Hash, Größe, mtime, mode
+    refs/<project>       ID des letzten vollständigen Snapshots (statt Manifest-Scan)
+    archives/<id>.tar.*  Alternativ: komprimiertes Archiv mit Index (backup_archive)
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from .backup_archive import (
+    SUFFIXES,
+    BackupArchive,
+    create_archive,
+    default_compression,
+    is_archive,
+)
+from .fs_walker import (
+    EVENT_BUDGET,
+    EVENT_FILE,
+    EVENT_SKIP,
+    SKIP_UNREADABLE,
+    WalkEvent,
+    walk_files,
+)
+from .instrumentation import instrumentation
+
+# Standard-Ausschlüsse (nicht node_modules, etc.) - pro Store überschreibbar
+DEFAULT_IGNORE_NAMES = frozenset(
+    {
+        "node_modules",
+        "__pycache__",
+        ".git",
+        ".vscode",
+        ".idea",
+        "venv",
+        "env",
+        "dist",
+        "build",
+        ".cache",
+        "logs",
+        "temp",
+        "tmp",
+        ".DS_Store",
+        "Thumbs.db",
+    }
+)
+
+MANIFEST_FORMAT = 1
+_CHUNK_SIZE = 1024 * 1024
+TMP_PREFIX = ".tmp-"
+# Unreferenzierte Blobs erst nach dieser Zeit löschen - ein laufender Snapshot
+# hat sein Manifest evtl. noch nicht geschrieben
+GC_GRACE_SECONDS = 3600
+
+
+def hash_file(path: Path) -> str:
+    """SHA-256 einer Datei, blockweise gelesen"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class BackupStore:
+    """Deduplizierter Backup-Speicher mit Snapshot-Manifesten"""
+
+    def __init__(
+        self,
+        root: Path,
+        ignore_names: Optional[Iterable[str]] = None,
+        use_ignore_files: bool = True,
+        max_file_size: Optional[int] = None,
+        max_total_bytes: Optional[int] = None,
+        max_seconds: Optional[float] = None,
+    ):
+        self.root = Path(root)
+        self.objects_dir = self.root / "objects"
+        self.snapshots_dir = self.root / "snapshots"
+        self.archives_dir = self.root / "archives"
+        self.refs_dir = self.root / "refs"
+        self.ignore_names = frozenset(
+            DEFAULT_IGNORE_NAMES if ignore_names is None else ignore_names
+        )
+
+        # Walker-Optionen (.gitignore/.bmadignore, Größen- und Zeitbudgets)
+        self.use_ignore_files = use_ignore_files
+        self.max_file_size = max_file_size
+        self.max_total_bytes = max_total_bytes
+        self.max_seconds = max_seconds
+
+        self.objects_dir.mkdir(parents=True, exist_ok=True)
+        self.snapshots_dir.mkdir(parents=True, exist_ok=True)
+
+    # ------------------------------------------------------------------
+    # Snapshots erstellen
+    # ------------------------------------------------------------------
+
+    def create_snapshot(
+        self,
+        project_path: Path,
+        project_name: str,
+        progress: Optional[Callable[[WalkEvent], None]] = None,
+    ) -> Path:
+        """Sichere ein Projekt - nur geänderte Inhalte werden kopiert
+
+        Dateien außerhalb der Budgets werden übersprungen; das Manifest vermerkt
+        dies unter "skipped" bzw. "complete": False.
+
+        Returns:
+            Pfad zum Snapshot-Manifest
+        """
+        project_path = Path(project_path)
+        snapshot_id = self._new_snapshot_id(project_name)
+
+        # Hashes des letzten Snapshots wiederverwenden, wenn Größe und mtime gleich
+        previous = self.latest_snapshot(project_name)
+        known = previous["files"] if previous else {}
+
+        files: Dict[str, Dict[str, Any]] = {}
+        skipped: Dict[str, int] = {}
+        complete = True
+        stats = {
+            "files": 0,
+            "bytes": 0,
+            "hashed_files": 0,
+            "new_blobs": 0,
+            "new_bytes": 0,
+        }
+
+        for event in self.walk(project_path):
+            if progress:
+                progress(event)
+            reason = event.reason or event.kind
+            if event.kind == EVENT_SKIP:
+                skipped[reason] = skipped.get(reason, 0) + 1
+                continue
+            if event.kind == EVENT_BUDGET:
+                complete = False
+                skipped[reason] = skipped.get(reason, 0) + 1
+                break
+            if event.kind != EVENT_FILE:
+                continue
+            if event.stat is None:
+                # Der Walker liefert Dateien immer mit stat - defensiv überspringen
+                skipped[SKIP_UNREADABLE] = skipped.get(SKIP_UNREADABLE, 0) + 1
+                continue
+
+            rel_path, file_path, st = event.rel_path, event.path, event.stat
+            entry = known.get(rel_path)
+            if (
+                entry
+                and entry["size"] == st.st_size
+                and entry["mtime_ns"] == st.st_mtime_ns
+                and self._reuse_blob(entry["hash"])
+            ):
+                digest = entry["hash"]
+                # Hash aus dem Vorgänger übernommen: kein open/read nötig. Der Blob
+                # bekommt eine frische mtime, damit ein paralleles prune ihn in
+                # der Schonfrist lässt, bevor dieses Manifest geschrieben ist.
+                instrumentation.count(syscalls_avoided=2)
+            else:
+                # Hashen und Kopieren in einem Lesedurchgang
+                digest, stored = self._store_file(file_path, st.st_size)
+                stats["hashed_files"] += 1
+                instrumentation.count(bytes_read=st.st_size)
+                if stored:
+                    stats["new_blobs"] += 1
+                    stats["new_bytes"] += st.st_size
+                    instrumentation.count(bytes_written=st.st_size, files_touched=1)
+
+            files[rel_path] = {
+                "hash": digest,
+                "size": st.st_size,
+                "mtime_ns": st.st_mtime_ns,
+                "mode": st.st_mode & 0o777,
+            }
+            stats["files"] += 1
+            stats["bytes"] += st.st_size
+
+        manifest = {
+            "format": MANIFEST_FORMAT,
+            "id": snapshot_id,
+            "project": project_name,
+            "source": str(project_path),
+            "created_at": datetime.now().isoformat(),
+            "parent": previous["id"] if previous else None,
+            "complete": complete,
+            "skipped": skipped,
+            "stats": stats,
+            "files": files,
+        }
+
+        manifest_path = self.snapshots_dir / f"{snapshot_id}.json"
+        tmp_path = manifest_path.with_suffix(".json.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=1, ensure_ascii=False)
+        os.replace(tmp_path, manifest_path)
+        instrumentation.count(files_touched=1)
+        if complete:
+            self._write_ref(project_name, snapshot_id)
+        return manifest_path
+
+    def create_archive(
+        self,
+        project_path: Path,
+        project_name: str,
+        compression: Optional[str] = None,
+        level: Optional[int] = None,
+        progress: Optional[Callable[[WalkEvent], None]] = None,
+    ) -> Path:
+        """Sichere ein Projekt als komprimiertes Archiv (gzip, oder zstd wenn verfügbar)
+
+        Returns:
+            Pfad zum Archiv
+        """
+        compression = compression or default_compression()
+        archive_id = self._new_snapshot_id(project_name)
+        archive_path = self.archives_dir / f"{archive_id}{SUFFIXES[compression]}"
+        create_archive(
+            self.walk(Path(project_path)),
+            archive_path,
+            Path(project_path),
+            project_name,
+            compression=compression,
+            level=level,
+            progress=progress,
+        )
+        return archive_path
+
+    def walk(self, root: Path) -> Iterator[WalkEvent]:
+        """Streamender Scan mit den Optionen dieses Stores"""
+        return walk_files(
+            root,
+            ignore_names=self.ignore_names,
+            use_ignore_files=self.use_ignore_files,
+            max_file_size=self.max_file_size,
+            max_total_bytes=self.max_total_bytes,
+            max_seconds=self.max_seconds,
+        )
+
+    def _blob_path(self, digest: str) -> Path:
+        return self.objects_dir / digest[:2] / digest[2:]
+
+    def _store_file(self, source: Path, size: int) -> Tuple[str, bool]:
+        """Datei einmal lesen, dabei hashen und in den Object-Store kopieren
+
+        Kleine Dateien (bis _CHUNK_SIZE) werden im Speicher gehasht und nur
+        geschrieben, wenn der Blob fehlt. Größere werden in eine temporäre
+        Datei gestreamt, die nach dem Hashen umbenannt oder - bei bereits
+        vorhandenem Blob - verworfen wird. Temporäre Dateien liegen immer
+        direkt unter objects/ (nie in einem Präfix-Verzeichnis).
+
+        Returns:
+            (SHA-256, True wenn der Blob neu angelegt wurde)
+        """
+        data = None
+        if size <= _CHUNK_SIZE:
+            with open(source, "rb") as f:
+                data = f.read(_CHUNK_SIZE + 1)
+            if len(data) <= _CHUNK_SIZE:
+                digest = hashlib.sha256(data).hexdigest()
+                if self._reuse_blob(digest):
+                    return digest, False
+            else:
+                data = None  # Beim Lesen gewachsen - gestreamt weiter
+
+        fd, tmp_name = tempfile.mkstemp(dir=self.objects_dir, prefix=TMP_PREFIX)
+        try:
+            with os.fdopen(fd, "wb") as dst:
+                if data is not None:
+                    dst.write(data)
+                else:
+                    hasher = hashlib.sha256()
+                    with open(source, "rb") as src:
+                        for chunk in iter(lambda: src.read(_CHUNK_SIZE), b""):
+                            hasher.update(chunk)
+                            dst.write(chunk)
+                    digest = hasher.hexdigest()
+            if data is None and self._reuse_blob(digest):
+                os.unlink(tmp_name)
+                return digest, False
+            blob = self._blob_path(digest)
+            blob.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(tmp_name, blob)
+        except BaseException:
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+            raise
+        return digest, True
+
+    def _reuse_blob(self, digest: str) -> bool:
+        """Vorhandenen Blob wiederverwenden
+
+        mtime auffrischen, damit prune ihn in der Schonfrist lässt.
+        """
+        try:
+            os.utime(self._blob_path(digest))
+        except FileNotFoundError:
+            return False
+        return True
+
+    def _new_snapshot_id(self, project_name: str) -> str:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        snapshot_id = f"{project_name}_{timestamp}"
+        counter = 1
+        while self._id_taken(snapshot_id):
+            counter += 1
+            snapshot_id = f"{project_name}_{timestamp}_{counter}"
+        return snapshot_id
+
+    def _id_taken(self, snapshot_id: str) -> bool:
+        if (self.snapshots_dir / f"{snapshot_id}.json").exists():
+            return True
+        return any(
+            (self.archives_dir / f"{snapshot_id}{suffix}").exists()
+            for suffix in SUFFIXES.values()
+        )
+
+    # ------------------------------------------------------------------
+    # Snapshots lesen / wiederherstellen
+    # ------------------------------------------------------------------
+
+    def list_snapshots(
+        self, project_name: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Snapshot-Übersicht (ohne Dateiliste), älteste zuerst"""
+        snapshots = []
+        for manifest in self._iter_manifests():
+            if project_name and manifest.get("project") != project_name:
+                continue
+            summary = {k: v for k, v in manifest.items() if k != "files"}
+            snapshots.append(summary)
+        snapshots.sort(key=lambda s: (s["created_at"], s["id"]))
+        return snapshots
+
+    def list_archives(self, project_name: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Archiv-Übersicht (Index-Metadaten ohne Dateiliste), älteste zuerst"""
+        archives = []
+        for archive_path in self._iter_archive_paths():
+            try:
+                index = BackupArchive(archive_path).index
+            except (OSError, ValueError):
+                continue
+            if project_name and index.get("project") != project_name:
+                continue
+            summary = {k: v for k, v in index.items() if k != "files"}
+            summary["id"] = archive_path.name
+            summary["path"] = str(archive_path)
+            archives.append(summary)
+        archives.sort(key=lambda a: (a["created_at"], a["id"]))
+        return archives
+
+    def find_archive(self, archive: str) -> Optional[BackupArchive]:
+        """Archiv über Pfad, Dateiname oder ID (ohne Endung)"""
+        candidates = [Path(archive), self.archives_dir / archive]
+        candidates += [
+            self.archives_dir / f"{archive}{suffix}" for suffix in SUFFIXES.values()
+        ]
+        for candidate in candidates:
+            if is_archive(candidate) and candidate.exists():
+                return BackupArchive(candidate)
+        return None
+
+    def _iter_archive_paths(self) -> Iterator[Path]:
+        if not self.archives_dir.exists():
+            return
+        for archive_path in self.archives_dir.iterdir():
+            if is_archive(archive_path):
+                yield archive_path
+
+    def latest_snapshot(self, project_name: str) -> Optional[Dict[str, Any]]:
+        """Letztes vollständiges Manifest eines Projekts
+
+        Snapshots mit "complete": False (Budget überschritten) fehlen Dateien -
+        sie taugen weder als Parent noch als Wiederherstellungsstand. Gelesen
+        wird nur das Manifest aus refs/<project>; fehlt der Verweis oder ist er
+        veraltet (ältere Stores, prune), wird einmal gescannt und er neu gesetzt.
+        """
+        ref = self._read_ref(project_name)
+        if ref:
+            try:
+                manifest = self.load_manifest(ref)
+            except (OSError, ValueError):
+                manifest = None
+            if (
+                manifest
+                and manifest.get("project") == project_name
+                and manifest.get("complete", True)
+            ):
+                return manifest
+
+        snapshots = [
+            s for s in self.list_snapshots(project_name) if s.get("complete", True)
+        ]
+        if not snapshots:
+            return None
+        self._write_ref(project_name, snapshots[-1]["id"])
+        return self.load_manifest(snapshots[-1]["id"])
+
+    def _read_ref(self, project_name: str) -> Optional[str]:
+        try:
+            return (self.refs_dir / project_name).read_text(
+                encoding="utf-8"
+            ).strip() or None
+        except OSError:
+            return None
+
+    def _write_ref(self, project_name: str, snapshot_id: str):
+        """Verweis atomar ersetzen - ein Fehler kostet nur den nächsten Scan"""
+        try:
+            self.refs_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=self.refs_dir, prefix=TMP_PREFIX)
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(snapshot_id)
+            os.replace(tmp_name, self.refs_dir / project_name)
+        except OSError:
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+
+    def load_manifest(self, snapshot: str) -> Dict[str, Any]:
+        """Lade Manifest über Snapshot-ID oder Pfad"""
+        manifest_path = Path(snapshot)
+        if not manifest_path.suffix == ".json" or not manifest_path.exists():
+            manifest_path = self.snapshots_dir / f"{snapshot}.json"
+        if not manifest_path.exists():
+            raise FileNotFoundError(f"Snapshot nicht gefunden: {snapshot}")
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def restore(self, snapshot: str, target: Path) -> Dict[str, Any]:
+        """Stelle einen Snapshot (oder ein Archiv) in einem Zielordner wieder her"""
+        archive = self.find_archive(snapshot)
+        if archive is not None:
+            return archive.extract_all(Path(target))
+
+        manifest = self.load_manifest(snapshot)
+        target = Path(target)
+        restored_bytes = 0
+
+        for rel_path, entry in manifest["files"].items():
+            blob = self._blob_path(entry["hash"])
+            if not blob.exists():
+                raise FileNotFoundError(f"Blob fehlt für {rel_path}: {entry['hash']}")
+
+            dest = target / rel_path
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(blob, dest)
+            os.chmod(dest, entry.get("mode", 0o644))
+            os.utime(dest, ns=(entry["mtime_ns"], entry["mtime_ns"]))
+            restored_bytes += entry["size"]
+
+        return {
+            "snapshot": manifest["id"],
+            "target": str(target),
+            "files": len(manifest["files"]),
+            "bytes": restored_bytes,
+        }
+
+    # ------------------------------------------------------------------
+    # Aufräumen
+    # ------------------------------------------------------------------
+
+    def prune(
+        self,
+        keep_last: int = 5,
+        project_name: Optional[str] = None,
+        grace_seconds: float = GC_GRACE_SECONDS,
+    ) -> Dict[str, int]:
+        """Behalte die letzten N vollständigen Snapshots pro Projekt
+
+        Danach werden unreferenzierte Blobs entfernt.
+        Unvollständige Snapshots (Budget erschöpft) zählen nicht mit; sie bleiben
+        nur, solange sie neuer als der älteste behaltene vollständige sind.
+        Blobs, die jünger als grace_seconds sind, bleiben stehen.
+        """
+        by_project: Dict[str, List[Dict[str, Any]]] = {}
+        for snapshot in self.list_snapshots(project_name):
+            by_project.setdefault(snapshot["project"], []).append(snapshot)
+
+        removed_snapshots = 0
+        for snapshots in by_project.values():
+            complete = [s for s in snapshots if s.get("complete", True)]
+            kept = complete[-keep_last:] if keep_last > 0 else []
+            oldest_kept = (kept[0]["created_at"], kept[0]["id"]) if kept else None
+            obsolete = [
+                s
+                for s in snapshots
+                if s not in kept
+                and (
+                    oldest_kept is None
+                    or s.get("complete", True)
+                    or (s["created_at"], s["id"]) < oldest_kept
+                )
+            ]
+            for snapshot in obsolete:
+                (self.snapshots_dir / f"{snapshot['id']}.json").unlink()
+                removed_snapshots += 1
+
+        # Archive sind eigenständig - gleiche Aufbewahrung, kein Blob-GC nötig
+        archives_by_project: Dict[str, List[Dict[str, Any]]] = {}
+        for archive in self.list_archives(project_name):
+            archives_by_project.setdefault(archive["project"], []).append(archive)
+
+        removed_archives = 0
+        archive_bytes = 0
+        for archives in archives_by_project.values():
+            obsolete = archives[:-keep_last] if keep_last > 0 else archives
+            for archive in obsolete:
+                archive_path = Path(archive["path"])
+                archive_bytes += archive_path.stat().st_size
+                archive_path.unlink()
+                removed_archives += 1
+
+        # Garbage Collection über alle verbleibenden Manifeste
+        referenced: Set[str] = set()
+        for manifest in self._iter_manifests():
+            referenced.update(entry["hash"] for entry in manifest["files"].values())
+
+        removed_blobs = 0
+        freed_bytes = 0
+        cutoff = time.time() - grace_seconds
+        for prefix_dir in self.objects_dir.iterdir():
+            if not prefix_dir.is_dir():
+                continue
+            for blob in prefix_dir.iterdir():
+                if (
+                    blob.name.startswith(TMP_PREFIX)
+                    or prefix_dir.name + blob.name in referenced
+                ):
+                    continue
+                try:
+                    st = blob.stat()
+                    if st.st_mtime > cutoff:
+                        continue
+                    blob.unlink()
+                except FileNotFoundError:
+                    continue
+                freed_bytes += st.st_size
+                removed_blobs += 1
+
+        return {
+            "removed_snapshots": removed_snapshots,
+            "removed_archives": removed_archives,
+            "removed_blobs": removed_blobs,
+            "freed_bytes": freed_bytes + archive_bytes,
+        }
+
+    def _iter_manifests(self) -> Iterator[Dict[str, Any]]:
+        for manifest_path in self.snapshots_dir.glob("*.json"):
+            try:
+                with open(manifest_path, "r", encoding="utf-8") as f:
+                    yield json.load(f)
+            except (OSError, ValueError):
+                continue
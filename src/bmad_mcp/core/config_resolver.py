@@ -0,0 +1,220 @@
+"""
+BMAD Config Resolver
+Geschichtete, gecachte Auflösung von Global-, Core-, Projekt- und Agent-Konfiguration
+
+Ebenen (niedrigste Priorität zuerst):
+    global   config/bmad-global-config.yaml (bmad_agents.<agent> für Agents)
+    core     config/bmad-core/core-config.yaml (nur Projekt-Auflösung)
+    project  <projekt>/.bmad-core/project.yaml (agents.<agent> für Agents)
+    agent    <projekt>/.bmad-core/agents/<agent>.yaml
+
+Jede Datei wird einmal geparst und mit (mtime_ns, size, inode) gecacht. Ändert
+sich eine Datei, wird nur diese Ebene neu geladen; gemergte Ergebnisse sind an
+die Signaturen ihrer Ebenen gebunden. Der Merge ist deterministisch: Dicts
+werden rekursiv gemergt (Reihenfolge: bestehende Keys, dann neue), Listen und
+Skalare der höheren Ebene ersetzen die niedrigere.
+"""
+
+import copy
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from .serialization import load_yaml_file
+
+LAYER_GLOBAL = "global"
+LAYER_CORE = "core"
+LAYER_PROJECT = "project"
+LAYER_AGENT = "agent"
+LAYERS = (LAYER_GLOBAL, LAYER_CORE, LAYER_PROJECT, LAYER_AGENT)
+
+Signature = Optional[Tuple[int, int, int]]
+
+
+def default_config_dir() -> Path:
+    return Path(__file__).resolve().parents[3] / "config"
+
+
+def file_signature(path: Path) -> Signature:
+    """(mtime_ns, size, inode) oder None, wenn die Datei fehlt"""
+    try:
+        st = path.stat()
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def deep_merge(base: Any, override: Any) -> Any:
+    """Rekursiver Merge ohne die Eingaben zu verändern"""
+    if not isinstance(base, dict) or not isinstance(override, dict):
+        return copy.deepcopy(override)
+    merged = {key: copy.deepcopy(value) for key, value in base.items()}
+    for key, value in override.items():
+        merged[key] = (
+            deep_merge(merged[key], value) if key in merged else copy.deepcopy(value)
+        )
+    return merged
+
+
+class ConfigFileCache:
+    """Geparste YAML-Dateien, invalidiert über die Datei-Signatur"""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: Dict[Path, Tuple[Signature, Any]] = {}
+        self.stats = {"hits": 0, "parses": 0}
+
+    def load(self, path: Path) -> Tuple[Signature, Any]:
+        """(Signatur, Daten) - Daten sind geteilt und dürfen nicht verändert werden"""
+        path = Path(path)
+        signature = file_signature(path)
+        if signature is None:
+            with self._lock:
+                self._entries.pop(path, None)
+            return None, None
+
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and entry[0] == signature:
+                self.stats["hits"] += 1
+                return entry
+
+        data = load_yaml_file(path)
+        with self._lock:
+            self._entries[path] = (signature, data)
+            self.stats["parses"] += 1
+        return signature, data
+
+    def invalidate(self, path: Optional[Path] = None):
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(Path(path), None)
+
+
+@dataclass
+class ConfigLayer:
+    name: str
+    path: Path
+    signature: Signature
+    data: Dict[str, Any]
+
+
+class ConfigResolver:
+    """Mergt die Konfigurationsebenen und cacht Ergebnisse je Ebenen-Signatur"""
+
+    def __init__(
+        self, config_dir: Optional[Path] = None, cache: Optional[ConfigFileCache] = None
+    ):
+        config_dir = Path(config_dir) if config_dir else default_config_dir()
+        self.global_config_file = config_dir / "bmad-global-config.yaml"
+        self.core_config_file = config_dir / "bmad-core" / "core-config.yaml"
+        self.cache = cache or ConfigFileCache()
+        self._lock = threading.Lock()
+        # Schlüssel -> (Ebenen-Pfade, Ebenen-Signaturen, Merge-Ergebnis)
+        self._resolved: Dict[
+            Tuple, Tuple[Tuple[Path, ...], Tuple[Signature, ...], Dict[str, Any]]
+        ] = {}
+
+    # ------------------------------------------------------------------
+    # Ebenen
+    # ------------------------------------------------------------------
+
+    def load(self, path: Path) -> Dict[str, Any]:
+        """Einzelne Datei (gecacht, Kopie)"""
+        _, data = self.cache.load(path)
+        return copy.deepcopy(data) if isinstance(data, dict) else {}
+
+    def layers(
+        self, project_path: Optional[Path] = None, agent: Optional[str] = None
+    ) -> List[ConfigLayer]:
+        """Ebenen in Merge-Reihenfolge; fehlende Dateien liefern leere Ebenen
+
+        Mit agent werden nur die Agent-Abschnitte betrachtet (die Core-Ebene
+        enthält keine Agent-Einstellungen und entfällt).
+        """
+        sources = [(LAYER_GLOBAL, self.global_config_file)]
+        if not agent:
+            sources.append((LAYER_CORE, self.core_config_file))
+        if project_path is not None:
+            bmad_core = Path(project_path) / ".bmad-core"
+            sources.append((LAYER_PROJECT, bmad_core / "project.yaml"))
+            if agent:
+                sources.append((LAYER_AGENT, bmad_core / "agents" / f"{agent}.yaml"))
+
+        layers = []
+        for name, path in sources:
+            signature, data = self.cache.load(path)
+            if agent and name == LAYER_GLOBAL:
+                data = _section(data, "bmad_agents", agent)
+            elif agent and name == LAYER_PROJECT:
+                data = _section(data, "agents", agent)
+            layers.append(
+                ConfigLayer(
+                    name=name,
+                    path=path,
+                    signature=signature,
+                    data=data if isinstance(data, dict) else {},
+                )
+            )
+        return layers
+
+    # ------------------------------------------------------------------
+    # Auflösung
+    # ------------------------------------------------------------------
+
+    def resolve(self, project_path: Optional[Path] = None) -> Dict[str, Any]:
+        """Gemergte Konfiguration global < core < project"""
+        return self._merge(("project", str(project_path)), self.layers(project_path))
+
+    def resolve_agent(
+        self, agent: str, project_path: Optional[Path] = None
+    ) -> Dict[str, Any]:
+        """Gemergte Agent-Konfiguration
+
+        bmad_agents.<agent> < project.agents.<agent> < agents/<agent>.yaml
+        """
+        return self._merge(
+            ("agent", agent, str(project_path)), self.layers(project_path, agent)
+        )
+
+    def _merge(self, key: Tuple, layers: List[ConfigLayer]) -> Dict[str, Any]:
+        signatures = tuple(layer.signature for layer in layers)
+        with self._lock:
+            cached = self._resolved.get(key)
+        if cached is None or cached[1] != signatures:
+            merged: Dict[str, Any] = {}
+            for layer in layers:
+                merged = deep_merge(merged, layer.data)
+            cached = (tuple(layer.path for layer in layers), signatures, merged)
+            with self._lock:
+                self._resolved[key] = cached
+        return copy.deepcopy(cached[2])
+
+    def invalidate(self, path: Optional[Path] = None):
+        """Einzelne Datei (oder alles) verwerfen - nur Ergebnisse mit dieser Ebene"""
+        self.cache.invalidate(path)
+        with self._lock:
+            if path is None:
+                self._resolved.clear()
+            else:
+                path = Path(path)
+                self._resolved = {
+                    key: value
+                    for key, value in self._resolved.items()
+                    if path not in value[0]
+                }
+
+
+def _section(data: Any, *keys: str) -> Any:
+    for key in keys:
+        if not isinstance(data, dict):
+            return {}
+        data = data.get(key) or {}
+    return data
+
+
+# Globale Instanz
+config_resolver = ConfigResolver()
@@ -0,0 +1,569 @@
+"""
+BMAD Event Simulator
+Diskrete Ereignis-Simulation für Arbeitstage, Projektverläufe und Krisen-Szenarien
+
+Statt Wanduhr-Zeit per speed_factor zu skalieren, springt die virtuelle Uhr
+direkt zum nächsten Ereignis (Task fertig, Blockade aufgehoben, Agent wieder
+verfügbar). Die Uhr zählt Arbeitsstunden; erst das Ergebnis wird über den
+Arbeitskalender (hours_per_day, Werktage) in Daten umgerechnet. Jeder Lauf
+nutzt ein eigenes random.Random(seed) und ist damit reproduzierbar.
+
+monte_carlo() verteilt viele Läufe auf einen Prozess-Pool und liefert die
+Verteilung der Fertigstellungstermine:
+
+    report = monte_carlo(tasks, runs=2000, seed=7, start=date(2025, 3, 3))
+    report["completion"]["p90"]     # '2025-05-12'
+"""
+
+import heapq
+import math
+import os
+import random
+from concurrent.futures import BrokenExecutor, ProcessPoolExecutor
+from dataclasses import dataclass, field, replace
+from datetime import date, timedelta
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
+
+from .task_graph import FINAL_STATUSES, PRIORITY_ORDER, TaskGraph
+
+# Ereignis-Arten; bei gleichem Zeitpunkt in dieser Reihenfolge bearbeitet
+EV_FINISH = 0
+EV_UNBLOCK = 1
+EV_AGENT_UP = 2
+EV_AGENT_DOWN = 3
+
+# Unterhalb dieser Laufzahl lohnt der Prozess-Start nicht
+MIN_PARALLEL_RUNS = 200
+PERCENTILES = (10, 50, 80, 90)
+EPSILON = 1e-9
+
+
+@dataclass(frozen=True)
+class SimulationConfig:
+    """Parameter eines Laufs (Zeitangaben in Arbeitsstunden)"""
+
+    hours_per_day: float = 8.0
+    workdays: Tuple[int, ...] = (0, 1, 2, 3, 4)
+    workers_per_agent: int = 1
+    # Schätzfehler: Aufwand = Rest * lognormal(Mittel 1, Streuung sigma)
+    estimate_sigma: float = 0.25
+    # Blockade beim Start eines Tasks (einmal je Task)
+    block_probability: float = 0.0
+    block_hours: Tuple[float, float] = (4.0, 16.0)
+    # Nacharbeit nach Abschluss (Anteil des Aufwands)
+    rework_probability: float = 0.0
+    rework_fraction: float = 0.3
+    # Ausfall eines Agenten (je Agent und Lauf); laufende Tasks pausieren
+    outage_probability: float = 0.0
+    outage_hours: Tuple[float, float] = (8.0, 24.0)
+
+
+# bmad_simulate_crisis_scenario: crisis_type -> Abweichungen von der Basis
+CRISIS_SCENARIOS: Dict[str, Dict[str, Any]] = {
+    "blocked_task": {"block_probability": 0.2, "block_hours": (8.0, 40.0)},
+    "resource_conflict": {"outage_probability": 0.5, "outage_hours": (16.0, 40.0)},
+    "deadline_pressure": {
+        "hours_per_day": 10.0,
+        "estimate_sigma": 0.4,
+        "rework_probability": 0.25,
+        "rework_fraction": 0.3,
+    },
+}
+
+
+def scenario_config(
+    crisis_type: str, base: Optional[SimulationConfig] = None
+) -> SimulationConfig:
+    if crisis_type not in CRISIS_SCENARIOS:
+        raise ValueError(
+            f"Unbekanntes Krisen-Szenario: {crisis_type} "
+            f"(erlaubt: {', '.join(sorted(CRISIS_SCENARIOS))})"
+        )
+    return replace(base or SimulationConfig(), **CRISIS_SCENARIOS[crisis_type])
+
+
+class WorkCalendar(NamedTuple):
+    """Arbeitsstunden ab Start -> Kalenderdatum"""
+
+    start: date
+    hours_per_day: float = 8.0
+    workdays: Tuple[int, ...] = (0, 1, 2, 3, 4)
+
+    @classmethod
+    def for_config(
+        cls, config: SimulationConfig, start: Optional[date] = None
+    ) -> "WorkCalendar":
+        return cls(start or date.today(), config.hours_per_day, tuple(config.workdays))
+
+    def date_at(self, hours: float) -> date:
+        """Arbeitstag, in dem die Stunde hours endet (0 = erster Arbeitstag)"""
+        day = self.start
+        while day.weekday() not in self.workdays:
+            day += timedelta(days=1)
+        index = max(math.ceil(hours / self.hours_per_day - EPSILON) - 1, 0)
+        weeks, rest = divmod(index, len(self.workdays))
+        day += timedelta(weeks=weeks)
+        while rest:
+            day += timedelta(days=1)
+            if day.weekday() in self.workdays:
+                rest -= 1
+        return day
+
+
+class SimulationPlan(NamedTuple):
+    """Kompakte, picklebare Form der Tasks (Index = topologische Reihenfolge)"""
+
+    task_ids: Tuple[str, ...]
+    agents: Tuple[str, ...]
+    remaining: Tuple[float, ...]
+    rank: Tuple[int, ...]
+    done: Tuple[bool, ...]
+    succs: Tuple[Tuple[int, ...], ...]
+    open_preds: Tuple[int, ...]
+
+
+def compile_plan(tasks: Iterable[Dict[str, Any]]) -> SimulationPlan:
+    """Tasks einmal in Index-Arrays übersetzen; Zyklen verwirft der TaskGraph"""
+    tasks = [task for task in tasks if task.get("task_id")]
+    by_id = {task["task_id"]: task for task in tasks}
+    graph = TaskGraph(tasks)
+    order = graph.topological_order()
+    index = {task_id: i for i, task_id in enumerate(order)}
+
+    agents, remaining, rank, done = [], [], [], []
+    succs: List[List[int]] = [[] for _ in order]
+    open_preds = [0] * len(order)
+    for i, task_id in enumerate(order):
+        task = by_id[task_id]
+        finished = str(task.get("status") or "todo") in FINAL_STATUSES
+        agents.append(str(task.get("agent") or "unassigned"))
+        rest = float(task.get("allocated_hours") or 0) - float(
+            task.get("completed_hours") or 0
+        )
+        remaining.append(0.0 if finished else max(rest, 0.0))
+        rank.append(
+            PRIORITY_ORDER.get(str(task.get("priority") or "medium"), 2) * len(order)
+            + i
+        )
+        done.append(finished)
+        for pred in graph.dependencies(task_id):
+            succs[index[pred]].append(i)
+            if str(by_id[pred].get("status") or "todo") not in FINAL_STATUSES:
+                open_preds[i] += 1
+    return SimulationPlan(
+        tuple(order),
+        tuple(agents),
+        tuple(remaining),
+        tuple(rank),
+        tuple(done),
+        tuple(tuple(s) for s in succs),
+        tuple(open_preds),
+    )
+
+
+@dataclass
+class SimulationResult:
+    """Ergebnis eines Laufs; Zeiten in Arbeitsstunden ab Start"""
+
+    seed: Optional[int]
+    hours: float
+    finished: Dict[str, float] = field(default_factory=dict)
+    worked: Dict[str, float] = field(default_factory=dict)
+    agent_hours: Dict[str, float] = field(default_factory=dict)
+    unfinished: List[str] = field(default_factory=list)
+    events: int = 0
+    blocked: int = 0
+    reworked: int = 0
+    outages: int = 0
+
+    def to_dict(self, calendar: WorkCalendar) -> Dict[str, Any]:
+        return {
+            "seed": self.seed,
+            "hours": round(self.hours, 2),
+            "completion_date": (
+                None if self.unfinished else calendar.date_at(self.hours).isoformat()
+            ),
+            "finished": {
+                task_id: calendar.date_at(hours).isoformat()
+                for task_id, hours in self.finished.items()
+            },
+            "worked_hours": {
+                task_id: round(hours, 2) for task_id, hours in self.worked.items()
+            },
+            "agent_hours": {
+                agent: round(hours, 2)
+                for agent, hours in sorted(self.agent_hours.items())
+            },
+            "unfinished": self.unfinished,
+            "events": self.events,
+            "blocked": self.blocked,
+            "reworked": self.reworked,
+            "outages": self.outages,
+        }
+
+
+def simulate(
+    plan: SimulationPlan,
+    config: SimulationConfig,
+    seed: Optional[int] = None,
+    until: Optional[float] = None,
+) -> SimulationResult:
+    """Ein Lauf; until begrenzt die Simulation auf so viele Arbeitsstunden"""
+    rng = random.Random(seed)
+    n = len(plan.task_ids)
+    agents = plan.agents
+    sigma = config.estimate_sigma
+    mu = -sigma * sigma / 2
+
+    open_preds = list(plan.open_preds)
+    effort = [0.0] * n  # verbleibender Aufwand des laufenden Abschnitts
+    due: List[Optional[float]] = [None] * n
+    resumed = [0.0] * n
+    worked = [0.0] * n
+    finished: Dict[int, float] = {}
+    was_blocked = [False] * n
+    was_reworked = [False] * n
+
+    ready: Dict[str, List[int]] = {agent: [] for agent in agents}
+    free = {agent: config.workers_per_agent for agent in ready}
+    running: Dict[str, set] = {agent: set() for agent in ready}
+    down: Dict[str, bool] = {agent: False for agent in ready}
+    heap: List[Tuple[float, int, int, Any]] = []
+    seq = 0
+    stats = {"events": 0, "blocked": 0, "reworked": 0, "outages": 0}
+
+    def push(at: float, kind: int, ref: Any):
+        nonlocal seq
+        seq += 1
+        heapq.heappush(heap, (at, kind, seq, ref))
+
+    def make_ready(i: int):
+        # rank = Priorität * n + Index - kleinster zuerst, Index per rank % n
+        heapq.heappush(ready[agents[i]], plan.rank[i])
+
+    def dispatch(agent: str, now: float):
+        queue = ready[agent]
+        while queue and free[agent] > 0 and not down[agent]:
+            i = heapq.heappop(queue) % n
+            if (
+                config.block_probability
+                and not was_blocked[i]
+                and rng.random() < config.block_probability
+            ):
+                was_blocked[i] = True
+                stats["blocked"] += 1
+                push(now + rng.uniform(*config.block_hours), EV_UNBLOCK, i)
+                continue
+            free[agent] -= 1
+            running[agent].add(i)
+            factor = rng.lognormvariate(mu, sigma) if sigma else 1.0
+            start_segment(i, now, plan.remaining[i] * factor)
+
+    def start_segment(i: int, now: float, hours: float):
+        finish = now + hours
+        effort[i], resumed[i], due[i] = hours, now, finish
+        push(finish, EV_FINISH, i)
+
+    for i in range(n):
+        if plan.done[i]:
+            finished[i] = 0.0
+        elif open_preds[i] == 0:
+            make_ready(i)
+    if config.outage_probability:
+        load: Dict[str, float] = {}
+        for i in range(n):
+            load[agents[i]] = load.get(agents[i], 0.0) + plan.remaining[i]
+        for agent in sorted(ready):
+            if load.get(agent) and rng.random() < config.outage_probability:
+                push(rng.uniform(0, load[agent]), EV_AGENT_DOWN, agent)
+    for agent in sorted(ready):
+        dispatch(agent, 0.0)
+
+    now = 0.0
+    while heap:
+        at, kind, _, ref = heap[0]
+        if until is not None and at > until:
+            break
+        heapq.heappop(heap)
+        if kind == EV_FINISH and due[ref] != at:
+            continue  # überholt (pausiert oder verlängert)
+        now = at
+        stats["events"] += 1
+
+        if kind == EV_FINISH:
+            i, agent = ref, agents[ref]
+            worked[i] += now - resumed[i]
+            if (
+                config.rework_probability
+                and not was_reworked[i]
+                and rng.random() < config.rework_probability
+            ):
+                was_reworked[i] = True
+                stats["reworked"] += 1
+                start_segment(i, now, plan.remaining[i] * config.rework_fraction)
+                continue
+            due[i] = None
+            finished[i] = now
+            running[agent].discard(i)
+            free[agent] += 1
+            touched = {agent}
+            for s in plan.succs[i]:
+                open_preds[s] -= 1
+                if open_preds[s] == 0:
+                    make_ready(s)
+                    touched.add(agents[s])
+            for other in sorted(touched):
+                dispatch(other, now)
+        elif kind == EV_UNBLOCK:
+            make_ready(ref)
+            dispatch(agents[ref], now)
+        elif kind == EV_AGENT_DOWN:
+            stats["outages"] += 1
+            down[ref] = True
+            for i in running[ref]:
+                # Laufende Arbeit pausiert; Rest wird beim Wiederanlauf neu terminiert
+                worked[i] += now - resumed[i]
+                effort[i] = due[i] - now
+                due[i] = None
+            push(now + rng.uniform(*config.outage_hours), EV_AGENT_UP, ref)
+        elif kind == EV_AGENT_UP:
+            down[ref] = False
+            for i in sorted(running[ref]):
+                start_segment(i, now, effort[i])
+            dispatch(ref, now)
+
+    end = until if until is not None else max(finished.values(), default=0.0)
+    for agent_tasks in running.values():
+        for i in agent_tasks:
+            if due[i] is not None:
+                worked[i] += end - resumed[i]
+
+    agent_hours: Dict[str, float] = {}
+    for i in range(n):
+        if worked[i]:
+            agent_hours[agents[i]] = agent_hours.get(agents[i], 0.0) + worked[i]
+    return SimulationResult(
+        seed=seed,
+        hours=end,
+        finished={
+            plan.task_ids[i]: hours
+            for i, hours in sorted(finished.items())
+            if not plan.done[i]
+        },
+        worked={plan.task_ids[i]: hours for i, hours in enumerate(worked) if hours},
+        agent_hours=agent_hours,
+        unfinished=[plan.task_ids[i] for i in range(n) if i not in finished],
+        **stats,
+    )
+
+
+class EventSimulator:
+    """Simulation eines Task-Plans
+
+    Für bmad_simulate_work_day und bmad_simulate_agent_workday.
+    """
+
+    def __init__(
+        self,
+        tasks: Union[SimulationPlan, Iterable[Dict[str, Any]]],
+        config: Optional[SimulationConfig] = None,
+        start: Optional[date] = None,
+    ):
+        self.plan = tasks if isinstance(tasks, SimulationPlan) else compile_plan(tasks)
+        self.config = config or SimulationConfig()
+        self.calendar = WorkCalendar.for_config(self.config, start)
+
+    def run(
+        self, seed: Optional[int] = None, until: Optional[float] = None
+    ) -> SimulationResult:
+        return simulate(self.plan, self.config, seed, until)
+
+    def work_day(
+        self,
+        seed: Optional[int] = None,
+        agent: Optional[str] = None,
+        hours: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Einen Arbeitstag (Standard: hours_per_day) vorspulen
+
+        Mit agent enthält der Bericht nur diesen Agenten.
+        """
+        hours = self.config.hours_per_day if hours is None else hours
+        result = self.run(seed, until=hours)
+        agents = dict(zip(self.plan.task_ids, self.plan.agents))
+        selected = [
+            task_id
+            for task_id in self.plan.task_ids
+            if agent is None or agents[task_id] == agent
+        ]
+        reported = [a for a in sorted(set(agents.values())) if agent in (None, a)]
+        busy = sum(result.agent_hours.get(a, 0.0) for a in reported)
+        capacity = hours * self.config.workers_per_agent * len(reported)
+        return {
+            "seed": seed,
+            "hours": hours,
+            "agent": agent,
+            "progress": {
+                task_id: round(result.worked[task_id], 2)
+                for task_id in selected
+                if task_id in result.worked
+            },
+            "completed": [
+                task_id for task_id in selected if task_id in result.finished
+            ],
+            "agent_hours": {
+                a: round(result.agent_hours.get(a, 0.0), 2) for a in reported
+            },
+            "utilization": round(busy / capacity, 3) if capacity else 0.0,
+            "events": result.events,
+        }
+
+    def monte_carlo(
+        self,
+        runs: int = 1000,
+        seed: int = 0,
+        workers: Optional[int] = None,
+        deadline: Optional[date] = None,
+    ) -> Dict[str, Any]:
+        return monte_carlo(
+            self.plan, runs, self.config, seed, self.calendar.start, workers, deadline
+        )
+
+
+# ----------------------------------------------------------------------
+# Monte Carlo
+# ----------------------------------------------------------------------
+
+
+def _run_chunk(
+    plan: SimulationPlan, config: SimulationConfig, seeds: List[int]
+) -> List[Tuple[float, int, int, int]]:
+    results = []
+    for seed in seeds:
+        result = simulate(plan, config, seed)
+        results.append((result.hours, result.blocked, result.reworked, result.outages))
+    return results
+
+
+def percentile(values: List[float], q: float) -> float:
+    """Linear interpoliertes Perzentil einer sortierten Liste"""
+    if not values:
+        return 0.0
+    position = (len(values) - 1) * q / 100
+    low = int(position)
+    high = min(low + 1, len(values) - 1)
+    return values[low] + (values[high] - values[low]) * (position - low)
+
+
+def monte_carlo(
+    tasks: Union[SimulationPlan, Iterable[Dict[str, Any]]],
+    runs: int = 1000,
+    config: Optional[SimulationConfig] = None,
+    seed: int = 0,
+    start: Optional[date] = None,
+    workers: Optional[int] = None,
+    deadline: Optional[date] = None,
+) -> Dict[str, Any]:
+    """Verteilung der Fertigstellung über runs Läufe
+
+    Die Seeds der Einzelläufe werden aus seed abgeleitet - das Ergebnis hängt
+    nicht von der Zahl der Prozesse ab.
+    """
+    plan = tasks if isinstance(tasks, SimulationPlan) else compile_plan(tasks)
+    config = config or SimulationConfig()
+    calendar = WorkCalendar.for_config(config, start)
+    seeder = random.Random(seed)
+    seeds = [seeder.getrandbits(63) for _ in range(runs)]
+
+    workers = workers or os.cpu_count() or 1
+    results: Optional[List[Tuple[float, int, int, int]]] = None
+    if workers > 1 and runs >= MIN_PARALLEL_RUNS:
+        size = max(math.ceil(runs / (workers * 4)), 1)
+        chunks = [seeds[i : i + size] for i in range(0, runs, size)]
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                parts = pool.map(
+                    _run_chunk, [plan] * len(chunks), [config] * len(chunks), chunks
+                )
+                results = [item for part in parts for item in part]
+        except (OSError, NotImplementedError, BrokenExecutor):
+            # Kein Prozess-Pool verfügbar (z.B. Sandbox) - sequentiell weiter
+            results = None
+    if results is None:
+        results = _run_chunk(plan, config, seeds)
+
+    hours = sorted(result[0] for result in results)
+    mean = sum(hours) / len(hours) if hours else 0.0
+    histogram: Dict[str, int] = {}
+    for value in hours:
+        day = calendar.date_at(value).isoformat()
+        histogram[day] = histogram.get(day, 0) + 1
+
+    report: Dict[str, Any] = {
+        "runs": runs,
+        "seed": seed,
+        "start": calendar.start.isoformat(),
+        "hours": {
+            "mean": round(mean, 2),
+            "min": round(hours[0], 2) if hours else 0.0,
+            "max": round(hours[-1], 2) if hours else 0.0,
+        },
+        # Arbeitstage mit der Tageslänge dieses Laufs (vergleichbar bei Überstunden)
+        "days": {"mean": round(mean / config.hours_per_day, 2)},
+        "completion": {},
+        "histogram": histogram,
+        "blocked_per_run": round(sum(r[1] for r in results) / max(runs, 1), 3),
+        "reworked_per_run": round(sum(r[2] for r in results) / max(runs, 1), 3),
+        "outages_per_run": round(sum(r[3] for r in results) / max(runs, 1), 3),
+    }
+    for q in PERCENTILES:
+        value = percentile(hours, q)
+        report["hours"][f"p{q}"] = round(value, 2)
+        report["days"][f"p{q}"] = round(value / config.hours_per_day, 2)
+        report["completion"][f"p{q}"] = calendar.date_at(value).isoformat()
+    if deadline is not None:
+        on_time = sum(
+            count for day, count in histogram.items() if day <= deadline.isoformat()
+        )
+        report["deadline"] = deadline.isoformat()
+        report["on_time_probability"] = round(on_time / max(runs, 1), 3)
+    return report
+
+
+def simulate_crisis(
+    tasks: Iterable[Dict[str, Any]],
+    crisis_type: str,
+    runs: int = 500,
+    seed: int = 0,
+    base: Optional[SimulationConfig] = None,
+    start: Optional[date] = None,
+    workers: Optional[int] = None,
+) -> Dict[str, Any]:
+    """bmad_simulate_crisis_scenario: Basis und Krise mit denselben Seeds vergleichen
+
+    Die Uhr zählt Arbeitsstunden; bei Überstunden (deadline_pressure) ist ein
+    Arbeitstag länger. Die Verzögerung wird deshalb in Arbeitstagen und
+    Kalendertagen der Fertigstellung verglichen, nicht in Stunden.
+    """
+    base = base or SimulationConfig()
+    plan = compile_plan(tasks)
+    baseline = monte_carlo(plan, runs, base, seed, start, workers)
+    crisis = monte_carlo(
+        plan, runs, scenario_config(crisis_type, base), seed, start, workers
+    )
+    return {
+        "crisis_type": crisis_type,
+        "baseline": baseline,
+        "crisis": crisis,
+        "delay_days": {
+            key: round(crisis["days"][key] - baseline["days"][key], 2)
+            for key in ("mean",) + tuple(f"p{q}" for q in PERCENTILES)
+        },
+        "delay_calendar_days": {
+            key: (
+                date.fromisoformat(crisis["completion"][key])
+                - date.fromisoformat(baseline["completion"][key])
+            ).days
+            for key in baseline["completion"]
+        },
+    }
@@ -0,0 +1,359 @@
+"""
+BMAD Filesystem Walker
+Streamender Verzeichnis-Scan auf Basis von os.scandir
+
+- beachtet .gitignore und .bmadignore (pro Verzeichnis, vererbt an Unterordner)
+- feste Ausschluss-Namen (node_modules, .git, ...)
+- Budgets für Dateigröße, Gesamtbytes und Laufzeit
+- folgt Symlinks wie shutil.copytree (Schleifen über Vorfahren werden erkannt)
+- liefert Fortschritt als Generator von WalkEvents
+"""
+
+import os
+import re
+import stat
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import FrozenSet, Iterable, Iterator, List, Optional, Tuple
+
+IGNORE_FILES = (".gitignore", ".bmadignore")
+
+# Event-Typen
+EVENT_FILE = "file"
+EVENT_SKIP = "skip"
+EVENT_BUDGET = "budget_exhausted"
+
+# Skip-Gründe
+SKIP_IGNORED_NAME = "ignored_name"
+SKIP_IGNORE_RULE = "ignore_rule"
+SKIP_TOO_LARGE = "too_large"
+SKIP_UNREADABLE = "unreadable"
+SKIP_SYMLINK = "symlink"
+SKIP_SYMLINK_LOOP = "symlink_loop"
+SKIP_NOT_REGULAR = "not_regular"
+
+
+@dataclass
+class WalkEvent:
+    """Ein Schritt des Walkers inkl. laufender Zähler"""
+
+    kind: str
+    path: Path
+    rel_path: str
+    size: int = 0
+    stat: Optional[os.stat_result] = None
+    reason: Optional[str] = None
+    files: int = 0
+    bytes: int = 0
+
+
+class IgnoreRules:
+    """Ignore-Regeln im .gitignore-Format, relativ zu einem Basisverzeichnis"""
+
+    def __init__(
+        self,
+        base: str = "",
+        rules: Optional[List[Tuple[re.Pattern, bool, bool]]] = None,
+    ):
+        # base: relativer POSIX-Pfad des Ordners mit der Ignore-Datei ("" = Wurzel)
+        self.base = base
+        self.rules = rules or []
+
+    @classmethod
+    def parse(cls, lines: Iterable[str], base: str = "") -> "IgnoreRules":
+        rules = []
+        for raw in lines:
+            line = raw.rstrip("\n").rstrip()
+            if not line or line.startswith("#"):
+                continue
+            negate = line.startswith("!")
+            if negate:
+                line = line[1:]
+            elif line.startswith("\\"):
+                line = line[1:]
+            dir_only = line.endswith("/")
+            line = line.rstrip("/")
+            # Muster mit "/" am Anfang oder in der Mitte sind an base verankert
+            anchored = "/" in line
+            line = line.lstrip("/")
+            if not line:
+                continue
+            rules.append((_compile_pattern(line, anchored), negate, dir_only))
+        return cls(base, rules)
+
+    def match(self, rel_path: str, is_dir: bool) -> Optional[bool]:
+        """True = ignorieren, False = explizit erlaubt, None = keine Regel trifft"""
+        if self.base:
+            if not rel_path.startswith(self.base + "/"):
+                return None
+            rel_path = rel_path[len(self.base) + 1 :]
+
+        result = None
+        for pattern, negate, dir_only in self.rules:
+            if dir_only and not is_dir:
+                continue
+            if pattern.match(rel_path):
+                result = not negate
+        return result
+
+
+def _compile_pattern(pattern: str, anchored: bool) -> re.Pattern:
+    """Übersetze ein gitignore-Muster in einen regulären Ausdruck"""
+    regex = []
+    i = 0
+    while i < len(pattern):
+        c = pattern[i]
+        if pattern.startswith("**/", i):
+            regex.append("(?:.*/)?")
+            i += 3
+            continue
+        if pattern.startswith("/**", i) and i + 3 == len(pattern):
+            regex.append("/.*")
+            i += 3
+            continue
+        if pattern.startswith("**", i):
+            regex.append(".*")
+            i += 2
+            continue
+        if c == "*":
+            regex.append("[^/]*")
+        elif c == "?":
+            regex.append("[^/]")
+        elif c == "[":
+            end = pattern.find("]", i + 1)
+            if end == -1:
+                regex.append(re.escape(c))
+            else:
+                body = pattern[i + 1 : end]
+                if body.startswith("!"):
+                    body = "^" + body[1:]
+                regex.append(f"[{body}]")
+                i = end
+        else:
+            regex.append(re.escape(c))
+        i += 1
+
+    prefix = "" if anchored else "(?:.*/)?"
+    return re.compile(f"^{prefix}{''.join(regex)}$")
+
+
+def _load_ignore_rules(dir_path: str, rel_dir: str) -> List[IgnoreRules]:
+    rules = []
+    for name in IGNORE_FILES:
+        try:
+            with open(
+                os.path.join(dir_path, name), "r", encoding="utf-8", errors="replace"
+            ) as f:
+                rules.append(IgnoreRules.parse(f, base=rel_dir))
+        except OSError:
+            continue
+    return rules
+
+
+def _is_ignored(rule_sets: List[IgnoreRules], rel_path: str, is_dir: bool) -> bool:
+    ignored = False
+    for rules in rule_sets:
+        result = rules.match(rel_path, is_dir)
+        if result is not None:
+            ignored = result
+    return ignored
+
+
+def walk_files(
+    root: Path,
+    ignore_names: Iterable[str] = (),
+    use_ignore_files: bool = True,
+    max_file_size: Optional[int] = None,
+    max_total_bytes: Optional[int] = None,
+    max_seconds: Optional[float] = None,
+    follow_symlinks: bool = True,
+) -> Iterator[WalkEvent]:
+    """Streame alle regulären Dateien unterhalb von root als WalkEvents
+
+    Übersprungene Dateien/Ordner werden als EVENT_SKIP gemeldet. Wird ein Budget
+    (Gesamtbytes oder Laufzeit) erreicht, folgt ein EVENT_BUDGET und der Walk endet.
+    Symlinks werden wie von shutil.copytree aufgelöst; ein Link auf einen
+    Vorfahren wird als SKIP_SYMLINK_LOOP gemeldet. follow_symlinks=False meldet
+    alle Symlinks als SKIP_SYMLINK.
+    """
+    root_str = os.fspath(root)
+    ignore_names = frozenset(ignore_names)
+    deadline = time.monotonic() + max_seconds if max_seconds is not None else None
+
+    files = 0
+    total = 0
+    try:
+        root_stat = os.stat(root_str)
+        root_key = frozenset([(root_stat.st_dev, root_stat.st_ino)])
+    except OSError:
+        root_key = frozenset()
+    # Stack: (absoluter Pfad, relativer POSIX-Pfad, geerbte Ignore-Regeln,
+    #         (dev, ino) der Vorfahren)
+    stack: List[Tuple[str, str, List[IgnoreRules], FrozenSet[Tuple[int, int]]]] = [
+        (root_str, "", [], root_key)
+    ]
+
+    while stack:
+        dir_path, rel_dir, inherited, ancestors = stack.pop()
+        rule_sets = (
+            inherited + _load_ignore_rules(dir_path, rel_dir)
+            if use_ignore_files
+            else inherited
+        )
+
+        try:
+            entries = os.scandir(dir_path)
+        except OSError:
+            yield WalkEvent(
+                EVENT_SKIP,
+                Path(dir_path),
+                rel_dir,
+                reason=SKIP_UNREADABLE,
+                files=files,
+                bytes=total,
+            )
+            continue
+
+        with entries:
+            for entry in entries:
+                rel_path = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+                try:
+                    is_link = entry.is_symlink()
+                    is_dir = entry.is_dir(follow_symlinks=follow_symlinks)
+                except OSError:
+                    is_link, is_dir = False, False
+
+                if entry.name in ignore_names:
+                    yield WalkEvent(
+                        EVENT_SKIP,
+                        Path(entry.path),
+                        rel_path,
+                        reason=SKIP_IGNORED_NAME,
+                        files=files,
+                        bytes=total,
+                    )
+                    continue
+                if rule_sets and _is_ignored(rule_sets, rel_path, is_dir):
+                    yield WalkEvent(
+                        EVENT_SKIP,
+                        Path(entry.path),
+                        rel_path,
+                        reason=SKIP_IGNORE_RULE,
+                        files=files,
+                        bytes=total,
+                    )
+                    continue
+
+                if is_link and not follow_symlinks:
+                    yield WalkEvent(
+                        EVENT_SKIP,
+                        Path(entry.path),
+                        rel_path,
+                        reason=SKIP_SYMLINK,
+                        files=files,
+                        bytes=total,
+                    )
+                    continue
+
+                if is_dir:
+                    # Jedes Verzeichnis wird Vorfahre seiner Unterordner, auch
+                    # ohne Symlink. os.stat statt entry.stat: DirEntry liefert
+                    # unter Windows st_ino = 0.
+                    try:
+                        target = os.stat(entry.path)
+                    except OSError:
+                        yield WalkEvent(
+                            EVENT_SKIP,
+                            Path(entry.path),
+                            rel_path,
+                            reason=SKIP_UNREADABLE,
+                            files=files,
+                            bytes=total,
+                        )
+                        continue
+                    key = (target.st_dev, target.st_ino)
+                    if key in ancestors:
+                        yield WalkEvent(
+                            EVENT_SKIP,
+                            Path(entry.path),
+                            rel_path,
+                            reason=SKIP_SYMLINK_LOOP,
+                            files=files,
+                            bytes=total,
+                        )
+                        continue
+                    stack.append((entry.path, rel_path, rule_sets, ancestors | {key}))
+                    continue
+
+                try:
+                    # Bei Symlinks das Ziel (defekter Link -> OSError)
+                    st = entry.stat(follow_symlinks=is_link)
+                except OSError:
+                    yield WalkEvent(
+                        EVENT_SKIP,
+                        Path(entry.path),
+                        rel_path,
+                        reason=SKIP_UNREADABLE,
+                        files=files,
+                        bytes=total,
+                    )
+                    continue
+                if not stat.S_ISREG(st.st_mode):
+                    yield WalkEvent(
+                        EVENT_SKIP,
+                        Path(entry.path),
+                        rel_path,
+                        stat=st,
+                        reason=SKIP_NOT_REGULAR,
+                        files=files,
+                        bytes=total,
+                    )
+                    continue
+
+                if max_file_size is not None and st.st_size > max_file_size:
+                    yield WalkEvent(
+                        EVENT_SKIP,
+                        Path(entry.path),
+                        rel_path,
+                        size=st.st_size,
+                        stat=st,
+                        reason=SKIP_TOO_LARGE,
+                        files=files,
+                        bytes=total,
+                    )
+                    continue
+
+                if max_total_bytes is not None and total + st.st_size > max_total_bytes:
+                    yield WalkEvent(
+                        EVENT_BUDGET,
+                        Path(entry.path),
+                        rel_path,
+                        size=st.st_size,
+                        reason="max_total_bytes",
+                        files=files,
+                        bytes=total,
+                    )
+                    return
+                if deadline is not None and time.monotonic() > deadline:
+                    yield WalkEvent(
+                        EVENT_BUDGET,
+                        Path(entry.path),
+                        rel_path,
+                        reason="max_seconds",
+                        files=files,
+                        bytes=total,
+                    )
+                    return
+
+                files += 1
+                total += st.st_size
+                yield WalkEvent(
+                    EVENT_FILE,
+                    Path(entry.path),
+                    rel_path,
+                    size=st.st_size,
+                    stat=st,
+                    files=files,
+                    bytes=total,
+                )
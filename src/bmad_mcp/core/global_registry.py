@@ -0,0 +1,63 @@
+"""
+BMAD Global Registry
+Projekt-Registry für bmad_register_project / bmad_list_projects
+
+Einziger Speicher ist die SQLite-Registry (registry_store.SQLiteRegistry,
+~/.bmad-global/registry.db). Eine vorhandene JSON-Registry wird beim ersten
+Zugriff einmalig importiert, solange die Datenbank noch leer ist.
+"""
+
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .registry_store import SQLiteRegistry
+
+
+class GlobalRegistry:
+    """Dünne Fassade über SQLiteRegistry; die Datenbank wird erst bei Bedarf geöffnet"""
+
+    def __init__(self, db_path: Optional[Path] = None, import_legacy: bool = True):
+        self.db_path = db_path
+        self.import_legacy = import_legacy
+        self._store: Optional[SQLiteRegistry] = None
+        self._lock = threading.Lock()
+
+    @property
+    def store(self) -> SQLiteRegistry:
+        with self._lock:
+            if self._store is None:
+                store = SQLiteRegistry(self.db_path)
+                if self.import_legacy and store.count() == 0:
+                    store.import_registry_file()
+                self._store = store
+            return self._store
+
+    def register_project(
+        self, project_path: str, config: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        return self.store.register_project(project_path, config)
+
+    def register_projects(self, projects: Iterable[Tuple[str, Dict[str, Any]]]) -> int:
+        return self.store.register_projects(projects)
+
+    def get_project(self, project_path: str) -> Optional[Dict[str, Any]]:
+        return self.store.get_project(project_path)
+
+    def find_projects(
+        self,
+        name: Optional[str] = None,
+        project_type: Optional[str] = None,
+        template: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        return self.store.find_projects(name, project_type, template)
+
+    def list_projects(self) -> List[Dict[str, Any]]:
+        return self.store.list_projects()
+
+    def remove_project(self, project_path: str) -> bool:
+        return self.store.remove_project(project_path)
+
+
+# Globale Instanz
+global_registry = GlobalRegistry()
@@ -0,0 +1,142 @@
+"""
+BMAD Instrumentation
+Leichtgewichtige Zeit- und I/O-Messung pro Projekt und Stufe
+
+    with instrumentation.project("Gutachter App"):
+        with instrumentation.stage("backup"):
+            ...
+            instrumentation.count(bytes_read=size, files_touched=1)
+
+    @instrumentation.measure("yaml_dump")
+    def write_config(...): ...
+
+Projekt und Stufe werden thread-lokal gehalten; Komponenten rufen nur count()
+auf und müssen nicht wissen, wer misst. Ohne aktive Stufe ist count() ein No-op.
+Stufen dürfen verschachtelt werden - Zähler landen in der innersten Stufe,
+die Wall-Time wird für jede Ebene erfasst.
+"""
+
+import functools
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+COUNTERS = ("bytes_read", "bytes_written", "files_touched", "syscalls_avoided")
+NO_PROJECT = "_global"
+
+
+class Instrumentation:
+    """Sammelt Zähler je (Projekt, Stufe) über alle Threads"""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._stats: Dict[str, Dict[str, Dict[str, float]]] = {}
+
+    def reset(self):
+        with self._lock:
+            self._stats = {}
+
+    # ------------------------------------------------------------------
+    # Kontext
+    # ------------------------------------------------------------------
+
+    @contextmanager
+    def project(self, name: str) -> Iterator[None]:
+        """Projekt für alle Stufen dieses Threads setzen"""
+        previous = getattr(self._local, "project", None)
+        self._local.project = name
+        try:
+            yield
+        finally:
+            self._local.project = previous
+
+    @contextmanager
+    def stage(self, name: str, project: Optional[str] = None) -> Iterator[None]:
+        """Wall-Time und Zähler einer Stufe erfassen"""
+        project = project or getattr(self._local, "project", None) or NO_PROJECT
+        stack: List[Tuple[str, str]] = self._stack()
+        stack.append((project, name))
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            stack.pop()
+            with self._lock:
+                entry = self._entry(project, name)
+                entry["calls"] += 1
+                entry["wall_time"] += elapsed
+
+    def measure(self, name: str) -> Callable:
+        """Decorator-Variante von stage()"""
+
+        def decorator(func: Callable) -> Callable:
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.stage(name):
+                    return func(*args, **kwargs)
+
+            return wrapper
+
+        return decorator
+
+    def count(self, **counters: float):
+        """Zähler der aktuellen Stufe erhöhen (bytes_read, bytes_written, ...)"""
+        stack = getattr(self._local, "stack", None)
+        if not stack:
+            return
+        project, name = stack[-1]
+        with self._lock:
+            entry = self._entry(project, name)
+            for key, value in counters.items():
+                entry[key] = entry.get(key, 0) + value
+
+    def current_stage(self) -> Optional[Tuple[str, str]]:
+        stack = getattr(self._local, "stack", None)
+        return stack[-1] if stack else None
+
+    # ------------------------------------------------------------------
+    # Auswertung
+    # ------------------------------------------------------------------
+
+    def report(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """{projekt: {stufe: {calls, wall_time, bytes_read, ...}}}"""
+        with self._lock:
+            return {
+                project: {
+                    name: dict(entry, wall_time=round(entry["wall_time"], 6))
+                    for name, entry in stages.items()
+                }
+                for project, stages in self._stats.items()
+            }
+
+    def totals_by_stage(self) -> Dict[str, Dict[str, Any]]:
+        """Summen je Stufe über alle Projekte"""
+        totals: Dict[str, Dict[str, Any]] = {}
+        for stages in self.report().values():
+            for name, entry in stages.items():
+                total = totals.setdefault(name, {})
+                for key, value in entry.items():
+                    total[key] = total.get(key, 0) + value
+        return totals
+
+    def _stack(self) -> List[Tuple[str, str]]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _entry(self, project: str, name: str) -> Dict[str, float]:
+        stages = self._stats.setdefault(project, {})
+        entry = stages.get(name)
+        if entry is None:
+            entry = stages[name] = dict(
+                {"calls": 0, "wall_time": 0.0}, **{c: 0 for c in COUNTERS}
+            )
+        return entry
+
+
+# Globale Instanz
+instrumentation = Instrumentation()
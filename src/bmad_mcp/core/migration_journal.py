@@ -0,0 +1,195 @@
+"""
+BMAD Migration Journal
+Checkpoint-Journal für wiederaufnehmbare Migrationsläufe
+
+Jeder abgeschlossene Schritt (backup, structure, config, agents, tasks, registry)
+wird pro Projekt als eine Zeile an ~/.bmad-global/migration-journal.jsonl
+angehängt. Bricht ein Lauf ab, setzt --resume den letzten offenen Lauf fort und
+überspringt bereits erledigte Schritte und Projekte.
+"""
+
+import json
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+# Schritte in Ausführungsreihenfolge
+STEP_BACKUP = "backup"
+STEP_STRUCTURE = "structure"
+STEP_CONFIG = "config"
+STEP_AGENTS = "agents"
+STEP_TASKS = "tasks"
+STEP_REGISTRY = "registry"
+STEPS = (
+    STEP_BACKUP,
+    STEP_STRUCTURE,
+    STEP_CONFIG,
+    STEP_AGENTS,
+    STEP_TASKS,
+    STEP_REGISTRY,
+)
+
+# Record-Typen
+REC_RUN_START = "run_start"
+REC_STEP = "step"
+REC_RESULT = "result"
+REC_RUN_COMPLETE = "run_complete"
+
+
+def default_journal_file() -> Path:
+    return Path.home() / ".bmad-global" / "migration-journal.jsonl"
+
+
+class MigrationJournal:
+    """Append-only Journal der erledigten Migrationsschritte (thread-safe)"""
+
+    def __init__(self, journal_file: Optional[Path] = None, fsync: bool = False):
+        self.journal_file = (
+            Path(journal_file) if journal_file else default_journal_file()
+        )
+        self.fsync = fsync
+        self.run_id: Optional[str] = None
+        self.resumed = False
+
+        self._lock = threading.Lock()
+        self._steps: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self._results: Dict[str, Dict[str, Any]] = {}
+
+    # ------------------------------------------------------------------
+    # Läufe
+    # ------------------------------------------------------------------
+
+    def start_run(self, resume: bool = False) -> Tuple[str, bool]:
+        """Neuen Lauf beginnen oder (resume=True) den letzten offenen fortsetzen"""
+        with self._lock:
+            self._repair_tail()
+            self._steps, self._results = {}, {}
+            open_run = self._last_open_run() if resume else None
+
+            if open_run is not None:
+                self.run_id, self.resumed = open_run, True
+                for record in self._iter_records():
+                    if record.get("run") == open_run:
+                        self._apply(record)
+            else:
+                self.run_id = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+                self.resumed = False
+                self._append({"type": REC_RUN_START})
+            return self.run_id, self.resumed
+
+    def finish_run(self, **summary: Any):
+        """Lauf als abgeschlossen markieren - --resume ignoriert ihn danach"""
+        with self._lock:
+            self._append({"type": REC_RUN_COMPLETE, "data": summary})
+
+    def _last_open_run(self) -> Optional[str]:
+        open_runs: List[str] = []
+        for record in self._iter_records():
+            if record.get("type") == REC_RUN_START:
+                open_runs.append(record["run"])
+            elif (
+                record.get("type") == REC_RUN_COMPLETE
+                and record.get("run") in open_runs
+            ):
+                open_runs.remove(record["run"])
+        return open_runs[-1] if open_runs else None
+
+    # ------------------------------------------------------------------
+    # Schritte
+    # ------------------------------------------------------------------
+
+    def is_done(self, project: str, step: str) -> bool:
+        with self._lock:
+            return step in self._steps.get(project, {})
+
+    def done_steps(self, project: str) -> Set[str]:
+        with self._lock:
+            return set(self._steps.get(project, {}))
+
+    def step_data(self, project: str, step: str) -> Dict[str, Any]:
+        with self._lock:
+            return dict(self._steps.get(project, {}).get(step, {}))
+
+    def mark_done(self, project: str, step: str, **data: Any):
+        with self._lock:
+            record = {"type": REC_STEP, "project": project, "step": step, "data": data}
+            self._append(record)
+            self._apply(record)
+
+    def record_result(
+        self, project: str, result: Dict[str, Any], needs_registry: bool = True
+    ):
+        """Projektergebnis speichern; erledigt erst, wenn die Registry steht"""
+        with self._lock:
+            record = {
+                "type": REC_RESULT,
+                "project": project,
+                "data": {"result": result, "needs_registry": needs_registry},
+            }
+            self._append(record)
+            self._apply(record)
+
+    def completed_result(self, project: str) -> Optional[Dict[str, Any]]:
+        """Ergebnis eines vollständig erledigten Projekts (sonst None)"""
+        with self._lock:
+            entry = self._results.get(project)
+            if entry is None:
+                return None
+            if entry["needs_registry"] and STEP_REGISTRY not in self._steps.get(
+                project, {}
+            ):
+                return None
+            return entry["result"]
+
+    # ------------------------------------------------------------------
+    # Datei
+    # ------------------------------------------------------------------
+
+    def _apply(self, record: Dict[str, Any]):
+        if record.get("type") == REC_STEP:
+            self._steps.setdefault(record["project"], {})[record["step"]] = (
+                record.get("data") or {}
+            )
+        elif record.get("type") == REC_RESULT:
+            self._results[record["project"]] = record["data"]
+
+    def _append(self, record: Dict[str, Any]):
+        record = dict(record, run=self.run_id, ts=datetime.now().isoformat())
+        self.journal_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.journal_file, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+            f.flush()
+            if self.fsync:
+                os.fsync(f.fileno())
+
+    def _repair_tail(self):
+        """Abgebrochene letzte Zeile entfernen, damit neue Records sauber anschließen"""
+        try:
+            with open(self.journal_file, "rb+") as f:
+                size = f.seek(0, os.SEEK_END)
+                if not size:
+                    return
+                f.seek(max(0, size - 64 * 1024))
+                tail_start = f.tell()
+                tail = f.read()
+                if not tail.endswith(b"\n"):
+                    f.truncate(tail_start + tail.rfind(b"\n") + 1)
+        except FileNotFoundError:
+            pass
+
+    def _iter_records(self):
+        try:
+            f = open(self.journal_file, "r", encoding="utf-8")
+        except FileNotFoundError:
+            return
+        with f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    continue
@@ -0,0 +1,285 @@
+"""
+BMAD Migration Plan
+Berechnet die Dateisystem-Operationen einer Migration im Speicher (Dry-Run)
+
+Ein Plan klassifiziert jede Zieldatei als create / overwrite / unchanged,
+kennt fehlende Template-Pfade und geplante Registry-Updates. Er lässt sich
+als Diff gegen den aktuellen Zustand ausgeben und wendet beim apply() nur
+echte Änderungen an.
+"""
+
+import difflib
+from dataclasses import dataclass, field
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from .atomic_writer import AtomicWriter, atomic_writer, render_json, render_yaml
+from .instrumentation import instrumentation
+from .migration_journal import STEP_CONFIG, STEP_REGISTRY, STEP_STRUCTURE, STEPS
+from .serialization import YAMLError, load_yaml
+from .template_layout import TemplateLayout, materialize_layout
+
+OP_CREATE = "create"
+OP_OVERWRITE = "overwrite"
+OP_UNCHANGED = "unchanged"
+
+# Felder, die sich bei jedem Lauf ändern und allein keine Migration auslösen
+VOLATILE_KEYS = ("migrated_at", "backup_location")
+
+
+def _read_bytes(path: Path) -> Optional[bytes]:
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+        instrumentation.count(bytes_read=len(data))
+        return data
+    except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+        return None
+
+
+@dataclass
+class FileOperation:
+    """Geplanter Schreibvorgang; Inhalt wird erst bei Bedarf gerendert"""
+
+    path: Path
+    render: Callable[[], bytes]
+    action: str = OP_CREATE
+    current: Optional[bytes] = None
+    step: str = STEP_CONFIG
+
+    @property
+    def content(self) -> bytes:
+        return self.render()
+
+    def diff(self) -> str:
+        if self.action == OP_UNCHANGED:
+            return ""
+        old = (
+            (self.current or b"")
+            .decode("utf-8", errors="replace")
+            .splitlines(keepends=True)
+        )
+        new = self.content.decode("utf-8", errors="replace").splitlines(keepends=True)
+        from_file = str(self.path) if self.current is not None else "/dev/null"
+        return "".join(
+            difflib.unified_diff(old, new, fromfile=from_file, tofile=str(self.path))
+        )
+
+
+@dataclass
+class StructureOperation:
+    """Template-Verzeichnisstruktur; nur fehlende Pfade lösen eine Anlage aus"""
+
+    base: Path
+    missing: List[str]
+    # Liefert die Statistik von materialize_layout
+    create: Callable[[], Dict[str, int]]
+
+    @property
+    def action(self) -> str:
+        return OP_CREATE if self.missing else OP_UNCHANGED
+
+
+@dataclass
+class RegistryUpdate:
+    project_path: str
+    config: Dict[str, Any]
+
+
+@dataclass
+class MigrationPlan:
+    """In-Memory-Plan einer Projekt-Migration"""
+
+    project: str
+    project_path: Path
+    files: List[FileOperation] = field(default_factory=list)
+    structures: List[StructureOperation] = field(default_factory=list)
+    registry_updates: List[RegistryUpdate] = field(default_factory=list)
+
+    # ------------------------------------------------------------------
+    # Planung
+    # ------------------------------------------------------------------
+
+    def add_file(
+        self, path: Path, content: bytes, step: str = STEP_CONFIG
+    ) -> FileOperation:
+        return self._add(
+            path, lambda: content, lambda current: current == content, step
+        )
+
+    def add_yaml(
+        self,
+        path: Path,
+        data: Dict[str, Any],
+        volatile_keys: Iterable[str] = (),
+        step: str = STEP_CONFIG,
+    ) -> FileOperation:
+        """YAML-Datei planen; volatile_keys werden beim Vergleich ignoriert"""
+        volatile_keys = tuple(volatile_keys)
+
+        def unchanged(current: bytes) -> bool:
+            if not volatile_keys:
+                return current == render_yaml(data)
+            try:
+                existing = load_yaml(current)
+            except YAMLError:
+                return False
+            if not isinstance(existing, dict):
+                return False
+
+            def strip(d: Dict[str, Any]) -> Dict[str, Any]:
+                return {k: v for k, v in d.items() if k not in volatile_keys}
+
+            return strip(existing) == strip(data)
+
+        return self._add(path, lambda: render_yaml(data), unchanged, step)
+
+    def add_json(
+        self,
+        path: Path,
+        data: Any,
+        indent: Optional[int] = 2,
+        ensure_ascii: bool = True,
+        step: str = STEP_CONFIG,
+    ) -> FileOperation:
+        def render() -> bytes:
+            return render_json(data, indent=indent, ensure_ascii=ensure_ascii)
+
+        return self._add(path, render, lambda current: current == render(), step)
+
+    def _add(
+        self,
+        path: Path,
+        render: Callable[[], bytes],
+        unchanged: Callable[[bytes], bool],
+        step: str = STEP_CONFIG,
+    ) -> FileOperation:
+        path = Path(path)
+        current = _read_bytes(path)
+        if current is None:
+            action = OP_CREATE
+        elif unchanged(current):
+            action = OP_UNCHANGED
+        else:
+            action = OP_OVERWRITE
+        op = FileOperation(
+            path=path, render=render, action=action, current=current, step=step
+        )
+        self.files.append(op)
+        return op
+
+    def add_layout(self, base: Path, layout: TemplateLayout) -> StructureOperation:
+        """Vorkompiliertes Template-Layout planen (siehe template_layout)"""
+        base = Path(base)
+        op = StructureOperation(
+            base=base,
+            missing=layout.missing(base),
+            create=lambda: materialize_layout(base, layout),
+        )
+        self.structures.append(op)
+        return op
+
+    def add_registry_update(
+        self, project_path: Path, config: Dict[str, Any]
+    ) -> RegistryUpdate:
+        update = RegistryUpdate(project_path=str(project_path), config=config)
+        self.registry_updates.append(update)
+        return update
+
+    # ------------------------------------------------------------------
+    # Auswertung
+    # ------------------------------------------------------------------
+
+    @property
+    def changed_files(self) -> List[FileOperation]:
+        return [op for op in self.files if op.action != OP_UNCHANGED]
+
+    @property
+    def has_changes(self) -> bool:
+        return bool(self.changed_files) or any(op.missing for op in self.structures)
+
+    def summary(self) -> Dict[str, int]:
+        counts = {OP_CREATE: 0, OP_OVERWRITE: 0, OP_UNCHANGED: 0}
+        for op in self.files:
+            counts[op.action] += 1
+        counts["missing_paths"] = sum(len(op.missing) for op in self.structures)
+        counts["registry_updates"] = (
+            len(self.registry_updates) if self.has_changes else 0
+        )
+        return counts
+
+    def diff(self) -> str:
+        """Unified Diff aller geplanten Änderungen"""
+        parts = []
+        for op in self.structures:
+            for rel_path in op.missing:
+                parts.append(f"+ {op.base / rel_path}\n")
+        for file_op in self.changed_files:
+            parts.append(file_op.diff())
+        return "".join(parts)
+
+    # ------------------------------------------------------------------
+    # Anwendung
+    # ------------------------------------------------------------------
+
+    def apply(
+        self,
+        register: Optional[Callable[[Path, Dict[str, Any]], None]] = None,
+        writer: Optional[AtomicWriter] = None,
+        skip_steps: Iterable[str] = (),
+        on_step: Optional[Callable[[str], None]] = None,
+    ) -> Dict[str, int]:
+        """Wende nur die Änderungen an; ohne Änderungen passiert nichts
+
+        Die Operationen laufen schrittweise (structure, config, agents, tasks,
+        registry). Erledigte Schritte aus skip_steps werden übersprungen, nach
+        jedem ausgeführten Schritt wird on_step(step) aufgerufen (Checkpoint).
+        """
+        writer = writer or atomic_writer
+        skip = set(skip_steps)
+        for op in self.files:
+            if op.action == OP_UNCHANGED:
+                writer.record_unchanged(len(op.current or b""))
+
+        if not self.has_changes:
+            return self.summary()
+
+        def run_step(step: str, action: Callable[[], None]):
+            if step in skip:
+                return
+            with instrumentation.stage(step):
+                action()
+            if on_step:
+                on_step(step)
+
+        def create_structures():
+            for op in self.structures:
+                if op.missing:
+                    op.create()
+
+        run_step(STEP_STRUCTURE, create_structures)
+
+        changed = self.changed_files
+        file_steps = sorted(
+            {op.step for op in changed},
+            key=lambda step: STEPS.index(step) if step in STEPS else len(STEPS),
+        )
+
+        def write_files(step: str):
+            for op in changed:
+                if op.step == step:
+                    writer.write_bytes(op.path, op.content)
+
+        for file_step in file_steps:
+            run_step(file_step, partial(write_files, file_step))
+
+        if register:
+
+            def register_all():
+                for update in self.registry_updates:
+                    register(Path(update.project_path), update.config)
+
+            run_step(STEP_REGISTRY, register_all)
+
+        return self.summary()
@@ -0,0 +1,320 @@
+"""
+BMAD Monitor Scheduler
+Asyncio-Scheduler für Fortschritts-Checks, Reminder und Tagesberichte
+
+Statt alle Tasks per Timer zu scannen, hält der Scheduler einen Heap mit der
+nächsten Fälligkeit je (Art, Projekt, Task) und schläft bis zum frühesten
+Eintrag - ohne fällige Einträge wartet er ohne Timeout (kein Idle-CPU).
+Fällige Einträge werden pro (Art, Projekt) zu einem Handler-Aufruf mit allen
+Task-IDs zusammengefasst; läuft für dieselbe Gruppe noch ein Check, wird der
+nächste angehängt statt parallel gestartet.
+
+    scheduler = MonitorScheduler()
+    scheduler.register_handler(KIND_PROGRESS, check_progress)   # (project, task_ids)
+    scheduler.watch(TaskEventLog(), project="gutachter-app")
+    scheduler.add_daily(KIND_DAILY_REPORT, "gutachter-app", "18:00")
+    await scheduler.start()
+"""
+
+import asyncio
+import heapq
+import inspect
+import logging
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from .task_event_log import OP_CREATE, OP_DELETE, OP_STATUS, TaskEventLog
+
+KIND_PROGRESS = "progress_check"
+KIND_REMINDER = "reminder_check"
+KIND_DAILY_REPORT = "daily_report"
+
+PROGRESS_CHECK_INTERVAL = 30 * 60
+DAILY_REPORT_TIME = "18:00"
+
+# Tasks in diesen Status brauchen keine Checks mehr
+FINAL_STATUSES = ("completed", "done", "cancelled")
+
+logger = logging.getLogger(__name__)
+
+# Schlüssel eines Eintrags: (Art, Projekt, Task-ID oder None für Projekt-Jobs)
+JobKey = Tuple[str, str, Optional[str]]
+Handler = Callable[[str, List[str]], Any]
+
+
+def next_daily(at: str, now: float) -> float:
+    """Nächster Zeitpunkt HH:MM (lokale Zeit) nach now"""
+    hour, minute = (int(part) for part in at.split(":"))
+    current = datetime.fromtimestamp(now)
+    due = current.replace(hour=hour, minute=minute, second=0, microsecond=0)
+    if due.timestamp() <= now:
+        due += timedelta(days=1)
+    return due.timestamp()
+
+
+class MonitorScheduler:
+    """Deadline-Heap mit Coalescing; ein Scheduler bedient beliebig viele Projekte
+
+    Jobs dürfen aus beliebigen Threads eingeplant werden (TaskEventLog-Listener
+    laufen im Thread des Schreibers): Heap und Fälligkeiten sind per Lock
+    geschützt, das Wecken der Schleife läuft über call_soon_threadsafe.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.time):
+        self.clock = clock
+        self._heap: List[Tuple[float, int, JobKey]] = []
+        self._due: Dict[JobKey, float] = {}
+        # Wiederholung je Schlüssel: ("interval", Sekunden) oder ("daily", "HH:MM")
+        self._repeat: Dict[JobKey, Tuple[str, Any]] = {}
+        self._seq = 0
+        self._lock = threading.RLock()
+        self._handlers: Dict[str, Handler] = {}
+        self._running: Dict[Tuple[str, str], asyncio.Task] = {}
+        self._queued: Dict[Tuple[str, str], Set[Optional[str]]] = {}
+        self._wakeup: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_task: Optional[asyncio.Task] = None
+        self._stopping = False
+        self.stats = {"wakeups": 0, "runs": 0, "jobs": 0, "coalesced": 0, "errors": 0}
+
+    # ------------------------------------------------------------------
+    # Jobs
+    # ------------------------------------------------------------------
+
+    def register_handler(self, kind: str, handler: Handler):
+        """handler(project, task_ids) - sync oder async"""
+        self._handlers[kind] = handler
+
+    def schedule(
+        self,
+        kind: str,
+        project: str,
+        task_id: Optional[str] = None,
+        due: Optional[float] = None,
+    ):
+        """Einmalig einplanen; ein bereits früher fälliger Eintrag bleibt bestehen"""
+        key = (kind, project, task_id)
+        due = self.clock() if due is None else due
+        with self._lock:
+            current = self._due.get(key)
+            if current is not None and current <= due:
+                self.stats["coalesced"] += 1
+                return
+            self._push(key, due)
+
+    def track_task(
+        self,
+        project: str,
+        task_id: str,
+        interval: float = PROGRESS_CHECK_INTERVAL,
+        kind: str = KIND_PROGRESS,
+    ):
+        """Wiederkehrender Check für einen Task"""
+        key = (kind, project, task_id)
+        with self._lock:
+            self._repeat[key] = ("interval", interval)
+            if key not in self._due:
+                self._push(key, self.clock() + interval)
+
+    def add_interval(self, kind: str, project: str, interval: float):
+        """Wiederkehrender Projekt-Job (z.B. Reminder-Check)"""
+        key = (kind, project, None)
+        with self._lock:
+            self._repeat[key] = ("interval", interval)
+            self._push(key, self.clock() + interval)
+
+    def add_daily(self, kind: str, project: str, at: str = DAILY_REPORT_TIME):
+        """Täglicher Projekt-Job (z.B. Tagesbericht um 18:00)"""
+        key = (kind, project, None)
+        with self._lock:
+            self._repeat[key] = ("daily", at)
+            self._push(key, next_daily(at, self.clock()))
+
+    def untrack(self, kind: Optional[str], project: str, task_id: Optional[str] = None):
+        """Einträge entfernen (kind=None: alle Arten); der Heap bereinigt sich lazy"""
+        with self._lock:
+            for key in [
+                k
+                for k in self._due
+                if (kind is None or k[0] == kind) and k[1:] == (project, task_id)
+            ]:
+                self._due.pop(key, None)
+                self._repeat.pop(key, None)
+
+    def trigger(self, kind: str, project: str):
+        """Manueller Check (bmad_manual_*): sofort, mit laufendem Check vereint"""
+        self.schedule(kind, project, None, self.clock())
+
+    def watch(
+        self,
+        event_log: TaskEventLog,
+        project: str,
+        interval: float = PROGRESS_CHECK_INTERVAL,
+    ):
+        """Offene Tasks eines Logs überwachen und per Event nachführen"""
+
+        def on_event(event: Dict[str, Any]):
+            task_id, data = event.get("task_id"), event.get("data") or {}
+            if not task_id:
+                return  # sonst träfe untrack die Projekt-Jobs (task_id None)
+            if event["op"] == OP_CREATE:
+                self.track_task(project, task_id, interval)
+            elif event["op"] == OP_DELETE or (
+                event["op"] == OP_STATUS and data.get("status") in FINAL_STATUSES
+            ):
+                self.untrack(None, project, task_id)
+
+        for task_id, task in event_log.attach(on_event).items():
+            if task.get("status") not in FINAL_STATUSES:
+                self.track_task(project, task_id, interval)
+
+    def next_due(self) -> Optional[float]:
+        with self._lock:
+            self._discard_stale()
+            return self._heap[0][0] if self._heap else None
+
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._due)
+
+    def _push(self, key: JobKey, due: float):
+        """Nur unter self._lock aufrufen"""
+        self._due[key] = due
+        self._seq += 1
+        heapq.heappush(self._heap, (due, self._seq, key))
+        # Nur wecken, wenn der neue Eintrag der früheste ist
+        if self._heap[0][2] == key:
+            self._notify()
+
+    def _notify(self):
+        """Schleife wecken - aus dem Loop-Thread direkt, sonst threadsafe"""
+        loop, wakeup = self._loop, self._wakeup
+        if loop is None or wakeup is None or loop.is_closed():
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            wakeup.set()
+        else:
+            loop.call_soon_threadsafe(wakeup.set)
+
+    def _discard_stale(self):
+        while self._heap and self._due.get(self._heap[0][2]) != self._heap[0][0]:
+            heapq.heappop(self._heap)
+
+    # ------------------------------------------------------------------
+    # Ausführung
+    # ------------------------------------------------------------------
+
+    async def start(self):
+        """Scheduler-Schleife als Hintergrund-Task starten"""
+        if self._loop_task is None or self._loop_task.done():
+            self._loop = asyncio.get_running_loop()
+            self._stopping = False
+            self._wakeup = asyncio.Event()
+            self._loop_task = asyncio.ensure_future(self._run())
+
+    async def stop(self):
+        if self._loop_task is not None:
+            # Flag zusätzlich zu cancel(): wait_for() kann ein cancel() verschlucken,
+            # wenn das Wakeup-Event im selben Moment gesetzt wird (Python < 3.12)
+            self._stopping = True
+            self._loop_task.cancel()
+            try:
+                await self._loop_task
+            except asyncio.CancelledError:
+                pass
+            self._loop_task = None
+        self._loop = None
+        for task in list(self._running.values()):
+            task.cancel()
+        self._running.clear()
+        self._queued.clear()
+
+    @property
+    def running(self) -> bool:
+        return self._loop_task is not None and not self._loop_task.done()
+
+    async def _run(self):
+        while not self._stopping:
+            due = self.next_due()
+            timeout = None if due is None else max(due - self.clock(), 0.0)
+            if timeout is None or timeout > 0:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+                self._wakeup.clear()
+            if self._stopping:
+                break
+            self.stats["wakeups"] += 1
+            self.run_due()
+            # Dem Event-Loop Zeit für gestartete Checks geben
+            await asyncio.sleep(0)
+
+    def run_due(self, now: Optional[float] = None) -> int:
+        """Alle fälligen Einträge gruppiert starten; liefert die Zahl der Gruppen"""
+        now = self.clock() if now is None else now
+        groups: Dict[Tuple[str, str], Set[Optional[str]]] = {}
+        with self._lock:
+            while True:
+                self._discard_stale()
+                if not self._heap or self._heap[0][0] > now:
+                    break
+                _, _, key = heapq.heappop(self._heap)
+                del self._due[key]
+                groups.setdefault(key[:2], set()).add(key[2])
+                self.stats["jobs"] += 1
+                self._reschedule(key, now)
+
+        for group, task_ids in groups.items():
+            if group in self._running:
+                # Laufender Check derselben Gruppe - danach einmal nachziehen
+                self._queued.setdefault(group, set()).update(task_ids)
+                self.stats["coalesced"] += 1
+            else:
+                self._start_group(group, task_ids)
+        return len(groups)
+
+    def _reschedule(self, key: JobKey, now: float):
+        repeat = self._repeat.get(key)
+        if repeat is None:
+            return
+        mode, value = repeat
+        self._push(key, now + value if mode == "interval" else next_daily(value, now))
+
+    def _start_group(self, group: Tuple[str, str], task_ids: Set[Optional[str]]):
+        handler = self._handlers.get(group[0])
+        if handler is None:
+            return
+        ids = sorted(task_id for task_id in task_ids if task_id is not None)
+        self._running[group] = asyncio.ensure_future(self._call(group, handler, ids))
+
+    async def _call(
+        self, group: Tuple[str, str], handler: Handler, task_ids: List[str]
+    ):
+        try:
+            if inspect.iscoroutinefunction(handler):
+                await handler(group[1], task_ids)
+            else:
+                # Synchrone Handler (Datei-I/O) blockieren nicht den Event-Loop
+                await asyncio.get_running_loop().run_in_executor(
+                    None, handler, group[1], task_ids
+                )
+            self.stats["runs"] += 1
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.stats["errors"] += 1
+            logger.exception(
+                "Monitor-Handler %s für Projekt %s fehlgeschlagen", group[0], group[1]
+            )
+        finally:
+            self._running.pop(group, None)
+            queued = self._queued.pop(group, None)
+            if queued is not None and self._loop_task is not None:
+                self._start_group(group, queued)
@@ -0,0 +1,196 @@
+"""
+BMAD Records
+Kompakte Task- und WorkSession-Records mit __slots__
+
+Ein Task als dict kostet mehrere hundert Bytes (Hash-Tabelle plus eigene
+Strings je Eintrag). Die Records speichern die bekannten Felder in Slots,
+internieren wiederkehrende Werte (Agent, Status, Phase, Projekt, Datum) und
+legen unbekannte Felder in einem optionalen _extra-dict ab. to_dict()/from_dict()
+sind verlustfrei: fehlende Felder bleiben fehlend (Sentinel MISSING), explizite
+None-Werte bleiben erhalten, Zahlen behalten ihren Typ.
+(slots=True für Dataclasses gibt es erst ab Python 3.10.) Die Slot-Felder sind
+auf Klassenebene annotiert, damit mypy Zugriffe prüfen kann; fehlende Felder
+enthalten MISSING (typisiert als Any).
+"""
+
+import json
+import sys
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Union
+
+from .task_store import iter_json_array
+
+# Felder mit wenigen unterschiedlichen Werten - werden interniert
+INTERNED_TASK_FIELDS = ("agent", "status", "phase", "project", "start_date")
+
+
+class _Missing:
+    """Markiert ein im Quell-dict fehlendes Feld (falsy, damit `x or 0` funktioniert)"""
+
+    __slots__ = ()
+
+    def __bool__(self) -> bool:
+        return False
+
+    def __repr__(self) -> str:
+        return "MISSING"
+
+    def __reduce__(self):
+        return "MISSING"
+
+
+MISSING: Any = _Missing()
+
+# Stunden behalten ihren JSON-Typ (int oder float)
+Hours = Optional[Union[int, float]]
+
+
+def _intern(value: Any) -> Any:
+    return sys.intern(value) if type(value) is str else value
+
+
+class _Record:
+    """Gemeinsame dict-Konvertierung für Slot-Records"""
+
+    __slots__ = ("_extra",)
+    FIELDS: tuple = ()
+    INTERNED: frozenset = frozenset()
+
+    _extra: Optional[Dict[str, Any]]
+
+    def __init__(self, **fields: Any):
+        self._load(fields)
+
+    def _load(self, fields: Dict[str, Any]):
+        for name in self.FIELDS:
+            value = fields.pop(name, MISSING)
+            setattr(self, name, _intern(value) if name in self.INTERNED else value)
+        self._extra = fields or None
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]):
+        """Auch für Schlüssel, die keine gültigen Keyword-Argumente wären"""
+        record = cls.__new__(cls)
+        record._load(dict(data))
+        return record
+
+    def to_dict(self) -> Dict[str, Any]:
+        result = {}
+        for name in self.FIELDS:
+            value = getattr(self, name)
+            if value is not MISSING:
+                result[name] = value
+        if self._extra:
+            result.update(self._extra)
+        return result
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """dict-kompatibler Zugriff für bestehende Auswertungen"""
+        if key in self.FIELDS:
+            value = getattr(self, key)
+            return default if value is MISSING else value
+        return (self._extra or {}).get(key, default)
+
+    def __eq__(self, other: Any) -> bool:
+        return type(other) is type(self) and self.to_dict() == other.to_dict()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+
+class Task(_Record):
+    FIELDS = (
+        "task_id",
+        "name",
+        "title",
+        "agent",
+        "status",
+        "phase",
+        "project",
+        "allocated_hours",
+        "completed_hours",
+        "start_date",
+        "created_at",
+        "updated_at",
+    )
+    INTERNED = frozenset(INTERNED_TASK_FIELDS)
+    __slots__ = FIELDS
+
+    task_id: Optional[str]
+    name: Optional[str]
+    title: Optional[str]
+    agent: Optional[str]
+    status: Optional[str]
+    phase: Optional[str]
+    project: Optional[str]
+    allocated_hours: Hours
+    completed_hours: Hours
+    start_date: Optional[str]
+    created_at: Optional[str]
+    updated_at: Optional[str]
+
+    @property
+    def remaining_hours(self) -> float:
+        return max(
+            float(self.allocated_hours or 0) - float(self.completed_hours or 0), 0.0
+        )
+
+
+class WorkSession(_Record):
+    FIELDS = (
+        "task_id",
+        "agent",
+        "started_at",
+        "ended_at",
+        "hours_worked",
+        "description",
+    )
+    INTERNED = frozenset(("agent",))
+    __slots__ = FIELDS
+
+    task_id: Optional[str]
+    agent: Optional[str]
+    started_at: Optional[str]
+    ended_at: Optional[str]
+    hours_worked: Hours
+    description: Optional[str]
+
+
+# ----------------------------------------------------------------------
+# JSON
+# ----------------------------------------------------------------------
+
+_encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+
+def encode_tasks(tasks: Iterable[Task]) -> str:
+    """Kompaktes JSON-Array"""
+    return _encoder.encode([task.to_dict() for task in tasks])
+
+
+def decode_tasks(text: str) -> List[Task]:
+    return [Task.from_dict(item) for item in json.loads(text) if isinstance(item, dict)]
+
+
+def encode_sessions(sessions: Iterable[WorkSession]) -> str:
+    return _encoder.encode([session.to_dict() for session in sessions])
+
+
+def decode_sessions(text: str) -> List[WorkSession]:
+    return [
+        WorkSession.from_dict(item)
+        for item in json.loads(text)
+        if isinstance(item, dict)
+    ]
+
+
+def iter_task_records(f: IO[str], key: str = "tasks") -> Iterator[Task]:
+    """Tasks eines tasks.json-Dokuments gestreamt als Records"""
+    for item in iter_json_array(f, key):
+        if isinstance(item, dict):
+            yield Task.from_dict(item)
+
+
+def iter_session_records(f: IO[str], key: str = "sessions") -> Iterator[WorkSession]:
+    for item in iter_json_array(f, key):
+        if isinstance(item, dict):
+            yield WorkSession.from_dict(item)
@@ -0,0 +1,208 @@
+"""
+BMAD Registry Store
+Indizierter Projekt-Registry-Speicher auf SQLite-Basis (WAL-Modus)
+
+Projekte werden nach Pfad (Primärschlüssel) sowie über Indizes nach Name,
+Typ und Template gefunden - ohne die komplette Registry zu laden.
+"""
+
+import json
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# Mögliche Dateinamen der bisherigen JSON-Registry (für den einmaligen Import)
+LEGACY_REGISTRY_FILES = ("registry.json", "project-registry.json", "projects.json")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS projects (
+    path          TEXT PRIMARY KEY,
+    name          TEXT,
+    type          TEXT,
+    template      TEXT,
+    config        TEXT NOT NULL,
+    registered_at TEXT NOT NULL,
+    updated_at    TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_projects_name ON projects(name);
+CREATE INDEX IF NOT EXISTS idx_projects_type ON projects(type);
+CREATE INDEX IF NOT EXISTS idx_projects_template ON projects(template);
+"""
+
+_UPSERT = """
+INSERT INTO projects (path, name, type, template, config, registered_at, updated_at)
+VALUES (?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(path) DO UPDATE SET
+    name = excluded.name,
+    type = excluded.type,
+    template = excluded.template,
+    config = excluded.config,
+    updated_at = excluded.updated_at
+"""
+
+
+class SQLiteRegistry:
+    """Projekt-Registry mit O(log n) Lookups über SQLite-Indizes"""
+
+    def __init__(self, db_path: Optional[Path] = None):
+        self.db_path = (
+            Path(db_path) if db_path else Path.home() / ".bmad-global" / "registry.db"
+        )
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+
+        conn = self._connection()
+        conn.execute("PRAGMA journal_mode=WAL")
+        with conn:
+            conn.executescript(_SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        """Eine Verbindung pro Thread (WAL erlaubt parallele Leser)"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(str(self.db_path), timeout=30)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def close(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    # ------------------------------------------------------------------
+    # Schreiben
+    # ------------------------------------------------------------------
+
+    def register_project(
+        self, project_path: str, config: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Registriere oder aktualisiere ein Projekt"""
+        self.register_projects([(project_path, config)])
+        project = self.get_project(project_path)
+        if project is None:
+            raise RuntimeError(
+                f"Projekt nach Registrierung nicht lesbar: {project_path}"
+            )
+        return project
+
+    def register_projects(self, projects: Iterable[Tuple[str, Dict[str, Any]]]) -> int:
+        """Registriere viele Projekte in einer einzigen Transaktion"""
+        now = datetime.now().isoformat()
+        rows = [self._row_values(path, config, now) for path, config in projects]
+        if not rows:
+            return 0
+
+        conn = self._connection()
+        with conn:
+            conn.executemany(_UPSERT, rows)
+        return len(rows)
+
+    def remove_project(self, project_path: str) -> bool:
+        conn = self._connection()
+        with conn:
+            cursor = conn.execute(
+                "DELETE FROM projects WHERE path = ?", (str(project_path),)
+            )
+        return cursor.rowcount > 0
+
+    @staticmethod
+    def _row_values(project_path: str, config: Dict[str, Any], now: str) -> Tuple:
+        config = config or {}
+        return (
+            str(project_path),
+            config.get("name"),
+            config.get("type"),
+            config.get("template"),
+            json.dumps(config, ensure_ascii=False, default=str),
+            now,
+            now,
+        )
+
+    # ------------------------------------------------------------------
+    # Lesen
+    # ------------------------------------------------------------------
+
+    def get_project(self, project_path: str) -> Optional[Dict[str, Any]]:
+        row = (
+            self._connection()
+            .execute("SELECT * FROM projects WHERE path = ?", (str(project_path),))
+            .fetchone()
+        )
+        return self._to_dict(row) if row else None
+
+    def find_projects(
+        self,
+        name: Optional[str] = None,
+        project_type: Optional[str] = None,
+        template: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """Suche über die indizierten Spalten (alle Filter UND-verknüpft)"""
+        clauses, params = [], []
+        for column, value in (
+            ("name", name),
+            ("type", project_type),
+            ("template", template),
+        ):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+
+        query = "SELECT * FROM projects"
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        query += " ORDER BY path"
+        return [self._to_dict(row) for row in self._connection().execute(query, params)]
+
+    def list_projects(self) -> List[Dict[str, Any]]:
+        return self.find_projects()
+
+    def count(self) -> int:
+        return self._connection().execute("SELECT COUNT(*) FROM projects").fetchone()[0]
+
+    @staticmethod
+    def _to_dict(row: sqlite3.Row) -> Dict[str, Any]:
+        project = dict(row)
+        project["config"] = json.loads(project["config"])
+        return project
+
+    # ------------------------------------------------------------------
+    # Import
+    # ------------------------------------------------------------------
+
+    def import_registry_file(self, registry_file: Optional[Path] = None) -> int:
+        """Einmaliger Import der bisherigen JSON-Registry
+
+        Unterstützt {"projects": {pfad: config}}, {"projects": [{"path": ...}]}
+        sowie ein direktes {pfad: config}-Mapping.
+        """
+        if registry_file is None:
+            candidates = [
+                Path.home() / ".bmad-global" / name for name in LEGACY_REGISTRY_FILES
+            ]
+            registry_file = next((c for c in candidates if c.exists()), None)
+            if registry_file is None:
+                return 0
+
+        with open(registry_file, "r", encoding="utf-8") as f:
+            data = json.load(f)
+
+        projects = data.get("projects", data) if isinstance(data, dict) else data
+        if isinstance(projects, dict):
+            items = [
+                (path, config)
+                for path, config in projects.items()
+                if isinstance(config, dict)
+            ]
+        else:
+            items = [
+                (entry["path"], entry)
+                for entry in projects
+                if isinstance(entry, dict) and entry.get("path")
+            ]
+
+        return self.register_projects(items)
@@ -0,0 +1,68 @@
+"""
+BMAD Serialization
+Zentrales YAML/JSON-Backend für Konfigurationsdateien
+
+Nutzt die libyaml C-Implementierung (CSafeLoader/CSafeDumper), wenn PyYAML
+damit gebaut wurde, und fällt sonst auf die reinen Python-Klassen zurück.
+Alle Migrations- und Konfigurationspfade sollen hierüber laden und schreiben.
+"""
+
+import json
+from pathlib import Path
+from typing import IO, Any, Optional, Union
+
+import yaml
+
+try:
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+
+    LIBYAML_AVAILABLE = True
+except ImportError:
+    from yaml import SafeDumper, SafeLoader
+
+    LIBYAML_AVAILABLE = False
+
+YAMLError = yaml.YAMLError
+
+
+def load_yaml(stream: Union[str, bytes, IO]) -> Any:
+    """Sicheres Laden (entspricht yaml.safe_load)"""
+    return yaml.load(stream, Loader=SafeLoader)
+
+
+def load_yaml_file(path: Path) -> Any:
+    with open(path, "rb") as f:
+        return load_yaml(f)
+
+
+def dump_yaml(data: Any) -> str:
+    """YAML im Format der BMAD-Konfigurationen (block style, Unicode, sortierte Keys)"""
+    return yaml.dump(
+        data, Dumper=SafeDumper, default_flow_style=False, allow_unicode=True
+    )
+
+
+def dump_yaml_bytes(data: Any) -> bytes:
+    return dump_yaml(data).encode("utf-8")
+
+
+def load_json_file(path: Path) -> Any:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def dump_json_bytes(
+    data: Any, indent: Optional[int] = 2, ensure_ascii: bool = True
+) -> bytes:
+    return json.dumps(data, indent=indent, ensure_ascii=ensure_ascii).encode("utf-8")
+
+
+def backend_info() -> dict:
+    """Welche YAML-Implementierung aktiv ist"""
+    return {
+        "libyaml": LIBYAML_AVAILABLE,
+        "loader": SafeLoader.__name__,
+        "dumper": SafeDumper.__name__,
+        "pyyaml_version": yaml.__version__,
+    }
@@ -0,0 +1,286 @@
+"""
+BMAD Task Analytics
+Spaltenbasierte Task-Tabelle für Zusammenfassungen, Agent- und Projekt-Status
+
+Agent, Status, Phase und Projekt werden als Integer-Codes gespeichert, Stunden
+in array('d')-Spalten. Gruppierte Summen (Stunden je Agent/Status/Phase) laufen
+mit NumPy vektorisiert über np.bincount auf Zero-Copy-Views der Spalten; ohne
+NumPy über eine einfache Schleife mit identischem Ergebnis.
+
+An ein TaskEventLog angehängt (attach) wird die Tabelle pro Event inkrementell
+aktualisiert statt neu aufgebaut. Gelöschte Zeilen werden als Tombstones
+markiert und bei Bedarf kompaktiert.
+"""
+
+import threading
+from array import array
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .task_event_log import (
+    OP_CREATE,
+    OP_DELETE,
+    OP_PROGRESS,
+    OP_STATUS,
+    TaskEventLog,
+    status_after_progress,
+)
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+# Gruppierbare Dimensionen -> Task-Feld und Ersatzwert
+DIMENSIONS = {
+    "agent": ("agent", "unassigned"),
+    "status": ("status", "unknown"),
+    "phase": ("phase", "unphased"),
+    "project": ("project", "unassigned"),
+}
+
+
+class _Codes:
+    """Dictionary-Encoding eines String-Feldes"""
+
+    __slots__ = ("values", "index")
+
+    def __init__(self) -> None:
+        self.values: List[str] = []
+        self.index: Dict[str, int] = {}
+
+    def encode(self, value: str) -> int:
+        code = self.index.get(value)
+        if code is None:
+            code = self.index[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+
+class TaskTable:
+    """Columnar Task-Tabelle mit inkrementellen Updates"""
+
+    def __init__(
+        self, tasks: Iterable[Dict[str, Any]] = (), use_numpy: bool = NUMPY_AVAILABLE
+    ):
+        self.use_numpy = use_numpy and NUMPY_AVAILABLE
+        self._lock = threading.RLock()
+        self._codes = {dim: _Codes() for dim in DIMENSIONS}
+        self._columns = {dim: array("i") for dim in DIMENSIONS}
+        self._allocated = array("d")
+        self._completed = array("d")
+        self._alive = array("b")
+        self._rows: Dict[str, int] = {}
+        self._task_ids: List[Optional[str]] = []
+        self._dead = 0
+        for task in tasks:
+            self.upsert(task)
+
+    @classmethod
+    def attach(cls, event_log: TaskEventLog, **options: Any) -> "TaskTable":
+        """Tabelle aus dem aktuellen Zustand bauen und danach per Event pflegen"""
+        table = cls(**options)
+        with table._lock:
+            for task in event_log.attach(table.apply_event).values():
+                table.upsert(task)
+        return table
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    # ------------------------------------------------------------------
+    # Mutationen
+    # ------------------------------------------------------------------
+
+    def upsert(self, task: Dict[str, Any]):
+        task_id = task.get("task_id")
+        if not task_id:
+            return
+        with self._lock:
+            row = self._rows.get(task_id)
+            if row is None:
+                row = self._rows[task_id] = len(self._task_ids)
+                self._task_ids.append(task_id)
+                for dim in DIMENSIONS:
+                    self._columns[dim].append(0)
+                self._allocated.append(0.0)
+                self._completed.append(0.0)
+                self._alive.append(1)
+            for dim, (field, default) in DIMENSIONS.items():
+                self._columns[dim][row] = self._codes[dim].encode(
+                    str(task.get(field) or default)
+                )
+            self._allocated[row] = float(task.get("allocated_hours") or 0)
+            self._completed[row] = float(task.get("completed_hours") or 0)
+
+    def delete(self, task_id: str):
+        with self._lock:
+            row = self._rows.pop(task_id, None)
+            if row is None:
+                return
+            self._alive[row] = 0
+            self._task_ids[row] = None
+            self._dead += 1
+            if self._dead > 1024 and self._dead * 2 > len(self._alive):
+                self.compact()
+
+    def apply_event(self, event: Dict[str, Any]):
+        """Listener für TaskEventLog - entspricht task_event_log.apply_event"""
+        op, task_id = event["op"], event.get("task_id")
+        data = event.get("data") or {}
+        with self._lock:
+            if op == OP_CREATE:
+                task = dict(data, task_id=task_id)
+                task.setdefault("status", "todo")
+                self.upsert(task)
+                return
+            if not task_id:
+                return
+            row = self._rows.get(task_id)
+            if row is None:
+                return
+            if op == OP_PROGRESS:
+                completed = float(data["completed_hours"])
+                self._completed[row] = completed
+                status = self._value("status", row)
+                new_status = (
+                    status_after_progress(status, self._allocated[row], completed)
+                    or status
+                )
+                if new_status != status:
+                    self._columns["status"][row] = self._codes["status"].encode(
+                        new_status
+                    )
+            elif op == OP_STATUS:
+                self._columns["status"][row] = self._codes["status"].encode(
+                    str(data["status"])
+                )
+            elif op == OP_DELETE:
+                self.delete(task_id)
+
+    def compact(self):
+        """Tombstones entfernen (Codes bleiben stabil)"""
+        with self._lock:
+            keep = [row for row, alive in enumerate(self._alive) if alive]
+            for dim in DIMENSIONS:
+                column = self._columns[dim]
+                self._columns[dim] = array("i", (column[row] for row in keep))
+            self._allocated = array("d", (self._allocated[row] for row in keep))
+            self._completed = array("d", (self._completed[row] for row in keep))
+            self._alive = array("b", [1]) * len(keep)
+            self._task_ids = [self._task_ids[row] for row in keep]
+            self._rows = {task_id: row for row, task_id in enumerate(self._task_ids)}
+            self._dead = 0
+
+    def _value(self, dim: str, row: int) -> str:
+        return self._codes[dim].values[self._columns[dim][row]]
+
+    # ------------------------------------------------------------------
+    # Aggregation
+    # ------------------------------------------------------------------
+
+    def group_by(self, dim: str, **filters: str) -> Dict[str, Dict[str, float]]:
+        """{wert: {tasks, allocated_hours, completed_hours}} je Dimension"""
+        if dim not in DIMENSIONS:
+            raise ValueError(f"Unbekannte Dimension: {dim}")
+        with self._lock:
+            labels = self._codes[dim].values
+            if self.use_numpy:
+                counts, allocated, completed = self._group_numpy(dim, filters)
+            else:
+                counts, allocated, completed = self._group_python(dim, filters)
+        return {
+            labels[code]: {
+                "tasks": int(counts[code]),
+                "allocated_hours": float(allocated[code]),
+                "completed_hours": float(completed[code]),
+            }
+            for code in range(len(labels))
+            if counts[code]
+        }
+
+    def _filter_codes(self, filters: Dict[str, str]) -> Optional[Dict[str, int]]:
+        """Filterwerte in Codes übersetzen; None = unbekannter Wert (leeres Ergebnis)"""
+        codes = {}
+        for dim, value in filters.items():
+            if value is None:
+                continue
+            if dim not in DIMENSIONS:
+                raise ValueError(f"Unbekannte Dimension: {dim}")
+            code = self._codes[dim].index.get(value)
+            if code is None:
+                return None
+            codes[dim] = code
+        return codes
+
+    def _group_numpy(self, dim: str, filters: Dict[str, str]) -> Tuple[Any, Any, Any]:
+        size = len(self._codes[dim].values)
+        codes = self._filter_codes(filters)
+        if codes is None or not self._alive:
+            return [0] * size, [0.0] * size, [0.0] * size
+        mask = np.frombuffer(self._alive, dtype=np.int8).astype(bool)
+        for filter_dim, code in codes.items():
+            mask &= np.frombuffer(self._columns[filter_dim], dtype=np.int32) == code
+        keys = np.frombuffer(self._columns[dim], dtype=np.int32)[mask]
+        allocated = np.frombuffer(self._allocated, dtype=np.float64)[mask]
+        completed = np.frombuffer(self._completed, dtype=np.float64)[mask]
+        return (
+            np.bincount(keys, minlength=size),
+            np.bincount(keys, weights=allocated, minlength=size),
+            np.bincount(keys, weights=completed, minlength=size),
+        )
+
+    def _group_python(self, dim: str, filters: Dict[str, str]) -> Tuple[Any, Any, Any]:
+        size = len(self._codes[dim].values)
+        counts, allocated, completed = [0] * size, [0.0] * size, [0.0] * size
+        codes = self._filter_codes(filters)
+        if codes is None:
+            return counts, allocated, completed
+        keys = self._columns[dim]
+        filter_columns = [(self._columns[d], c) for d, c in codes.items()]
+        for row, alive in enumerate(self._alive):
+            if not alive or any(column[row] != code for column, code in filter_columns):
+                continue
+            key = keys[row]
+            counts[key] += 1
+            allocated[key] += self._allocated[row]
+            completed[key] += self._completed[row]
+        return counts, allocated, completed
+
+    def summary(self, **filters: str) -> Dict[str, Any]:
+        """Kennzahlen wie TaskStoreReader.summary(), optional gefiltert (agent=, ...)"""
+        by_agent = self.group_by("agent", **filters)
+        by_status = self.group_by("status", **filters)
+        allocated = sum(entry["allocated_hours"] for entry in by_agent.values())
+        completed = sum(entry["completed_hours"] for entry in by_agent.values())
+        return {
+            "total_tasks": sum(entry["tasks"] for entry in by_agent.values()),
+            "by_status": {
+                status: entry["tasks"] for status, entry in by_status.items()
+            },
+            "by_agent": by_agent,
+            "by_phase": self.group_by("phase", **filters),
+            "allocated_hours": allocated,
+            "completed_hours": completed,
+            "completion_rate": (completed / allocated * 100) if allocated else 0.0,
+            "generated_at": datetime.now().isoformat(),
+        }
+
+    def agent_summary(self, agent: str) -> Dict[str, Any]:
+        return self.summary(agent=agent)
+
+    def project_status(self, project: str) -> Dict[str, Any]:
+        """Fortschritt je Phase eines Projekts"""
+        summary = self.summary(project=project)
+        summary["phase_progress"] = {
+            phase: (
+                (entry["completed_hours"] / entry["allocated_hours"] * 100)
+                if entry["allocated_hours"]
+                else 0.0
+            )
+            for phase, entry in summary["by_phase"].items()
+        }
+        return summary
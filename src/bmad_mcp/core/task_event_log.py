@@ -0,0 +1,412 @@
+"""
+BMAD Task Event Log
+Append-only JSONL-Log für Task-Mutationen mit periodischer Kompaktierung
+
+Jede Mutation (create, progress, status, delete, session_end) wird als eine
+Zeile an tasks.events.jsonl angehängt - O(1) Disk-I/O pro Update statt das
+gesamte tasks.json neu zu schreiben. tasks.json bleibt der Snapshot; sein
+"meta"-Block steht am Dokumentanfang und enthält u.a. task_count und die
+Sequenznummer des letzten eingearbeiteten Events. Der Zustand wird erst beim
+ersten Zugriff aus Snapshot + Log-Tail rekonstruiert.
+"""
+
+import json
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from .atomic_writer import AtomicWriter, atomic_writer
+from .task_store import TaskStoreReader, read_json_key
+
+SNAPSHOT_FORMAT = "bmad-task-snapshot/1"
+DEFAULT_COMPACT_EVERY = 1000
+
+# Event-Typen
+OP_CREATE = "create"
+OP_PROGRESS = "progress"
+OP_STATUS = "status"
+OP_DELETE = "delete"
+OP_SESSION_END = "session_end"
+
+
+def status_after_progress(
+    status: Optional[str], allocated_hours: Any, completed_hours: float
+) -> Optional[str]:
+    """Status nach einer Fortschrittsmeldung (voll gebucht = completed)"""
+    allocated = float(allocated_hours or 0)
+    if allocated and completed_hours >= allocated:
+        return "completed"
+    if completed_hours > 0 and status in (None, "todo", "backlog"):
+        return "in_progress"
+    return status
+
+
+def apply_event(
+    tasks: Dict[str, Dict[str, Any]],
+    sessions: List[Dict[str, Any]],
+    event: Dict[str, Any],
+):
+    """Wende ein Event auf den In-Memory-Zustand an (auch für Replays)"""
+    op = event["op"]
+    task_id = event.get("task_id")
+    data = event.get("data") or {}
+
+    if op == OP_SESSION_END:
+        sessions.append(dict(data, ended_at=data.get("ended_at", event["ts"])))
+        return
+    if task_id is None:
+        # Task-Events ohne ID sind nicht adressierbar
+        return
+
+    if op == OP_CREATE:
+        task = dict(data)
+        task.setdefault("task_id", task_id)
+        task.setdefault("status", "todo")
+        task.setdefault("completed_hours", 0.0)
+        task.setdefault("created_at", event["ts"])
+        tasks[task_id] = task
+    elif op == OP_PROGRESS and task_id in tasks:
+        task = tasks[task_id]
+        task["completed_hours"] = data["completed_hours"]
+        status = status_after_progress(
+            task.get("status"), task.get("allocated_hours"), data["completed_hours"]
+        )
+        if status != task.get("status"):
+            task["status"] = status
+        if "notes" in data:
+            task.setdefault("progress_notes", []).append(
+                {"at": event["ts"], "note": data["notes"]}
+            )
+        task["updated_at"] = event["ts"]
+    elif op == OP_STATUS and task_id in tasks:
+        tasks[task_id]["status"] = data["status"]
+        tasks[task_id]["updated_at"] = event["ts"]
+    elif op == OP_DELETE:
+        tasks.pop(task_id, None)
+
+
+class TaskEventLog:
+    """Task-Zustand als Snapshot (tasks.json) + Event-Log (tasks.events.jsonl)"""
+
+    def __init__(
+        self,
+        base_dir: Optional[Path] = None,
+        compact_every: int = DEFAULT_COMPACT_EVERY,
+        writer: Optional[AtomicWriter] = None,
+        fsync: bool = False,
+    ):
+        base_dir = Path(base_dir) if base_dir else Path.home() / ".bmad-global"
+        self.snapshot_file = base_dir / "tasks.json"
+        self.log_file = base_dir / "tasks.events.jsonl"
+        self.compact_every = compact_every
+        self.writer = writer or atomic_writer
+        self.fsync = fsync
+
+        self._lock = threading.RLock()
+        self._tasks: Optional[Dict[str, Dict[str, Any]]] = None
+        self._sessions: List[Dict[str, Any]] = []
+        self._extra: Dict[str, Any] = {}
+        # Snapshot-Einträge ohne task_id (ältere tasks.json): nicht adressierbar,
+        # werden aber unverändert mitgeschrieben
+        self._opaque_tasks: List[Any] = []
+        self._seq: Optional[int] = None
+        self._tail_events = 0
+        self._listeners: List[Callable[[Dict[str, Any]], None]] = []
+        # Beim letzten Replay übersprungene (unlesbare) Zeilen
+        self.skipped_lines = 0
+
+    # ------------------------------------------------------------------
+    # Mutationen (je eine angehängte Zeile)
+    # ------------------------------------------------------------------
+
+    def create_task(self, task_id: str, **fields: Any) -> Dict[str, Any]:
+        # Eindeutige IDs: ein create im Log ist immer ein neuer Task (siehe task_count)
+        with self._lock:
+            if task_id in self.tasks:
+                raise ValueError(f"Task existiert bereits: {task_id}")
+            return self._append(OP_CREATE, task_id, fields)
+
+    def update_task_progress(
+        self, task_id: str, completed_hours: float, notes: Optional[str] = None
+    ) -> Dict[str, Any]:
+        data: Dict[str, Any] = {"completed_hours": float(completed_hours)}
+        if notes:
+            data["notes"] = notes
+        return self._append(OP_PROGRESS, task_id, data)
+
+    def set_task_status(self, task_id: str, status: str) -> Dict[str, Any]:
+        return self._append(OP_STATUS, task_id, {"status": status})
+
+    def delete_task(self, task_id: str) -> Dict[str, Any]:
+        with self._lock:
+            if task_id not in self.tasks:
+                raise KeyError(f"Task nicht gefunden: {task_id}")
+            return self._append(OP_DELETE, task_id, {})
+
+    def end_work_session(self, session: Dict[str, Any]) -> Dict[str, Any]:
+        return self._append(OP_SESSION_END, session.get("task_id"), session)
+
+    def subscribe(self, listener: Callable[[Dict[str, Any]], None]):
+        """Listener erhalten jedes neu angehängte Event (z.B. für Indizes)"""
+        self._listeners.append(listener)
+
+    def attach(
+        self, listener: Callable[[Dict[str, Any]], None]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Zustand laden und Listener atomar registrieren - kein Event geht verloren"""
+        with self._lock:
+            tasks = self._ensure_loaded()
+            self._listeners.append(listener)
+            return tasks
+
+    def follow(
+        self, listener: Callable[[Dict[str, Any]], None], since: int
+    ) -> Optional[int]:
+        """Events nach Sequenz since nachspielen und Listener registrieren
+
+        Ohne den Snapshot zu laden. Liefert die aktuelle Sequenznummer oder None,
+        wenn Events nach since bereits in den Snapshot kompaktiert wurden - dann
+        muss der Aufrufer neu aufbauen (z.B. per attach()).
+        """
+        with self._lock:
+            meta = self.snapshot_meta()
+            if meta is not None and meta["log_sequence"] > since:
+                return None
+            sequence = self._load_log_position()
+            if since > sequence:
+                return None
+            for event in self._iter_log(since):
+                listener(event)
+            self._listeners.append(listener)
+            return sequence
+
+    def _append(
+        self, op: str, task_id: Optional[str], data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        with self._lock:
+            sequence = self._load_log_position() + 1
+            self._seq = sequence
+            event = {
+                "seq": sequence,
+                "ts": datetime.now().isoformat(),
+                "op": op,
+                "task_id": task_id,
+                "data": data,
+            }
+
+            self.log_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.log_file, "a+b") as f:
+                self._repair_tail(f)
+                f.write((json.dumps(event, ensure_ascii=False) + "\n").encode("utf-8"))
+                if self.fsync:
+                    f.flush()
+                    os.fsync(f.fileno())
+            self._tail_events += 1
+
+            # Zustand nur pflegen, wenn er bereits geladen ist (lazy)
+            if self._tasks is not None:
+                apply_event(self._tasks, self._sessions, event)
+
+            for listener in self._listeners:
+                listener(event)
+
+            if self.compact_every and self._tail_events >= self.compact_every:
+                self.compact()
+            return event
+
+    # ------------------------------------------------------------------
+    # Zustand
+    # ------------------------------------------------------------------
+
+    @property
+    def tasks(self) -> Dict[str, Dict[str, Any]]:
+        return self._ensure_loaded()
+
+    @property
+    def sessions(self) -> List[Dict[str, Any]]:
+        self._ensure_loaded()
+        return self._sessions
+
+    def get_task(self, task_id: str) -> Optional[Dict[str, Any]]:
+        return self.tasks.get(task_id)
+
+    def snapshot_meta(self) -> Optional[Dict[str, Any]]:
+        """Nur den meta-Block vom Anfang des Snapshots lesen"""
+        try:
+            with open(self.snapshot_file, "r", encoding="utf-8") as f:
+                meta = read_json_key(f, "meta")
+        except (FileNotFoundError, ValueError):
+            return None
+        if isinstance(meta, dict) and meta.get("format") == SNAPSHOT_FORMAT:
+            return meta
+        return None
+
+    @property
+    def sequence(self) -> int:
+        """Sequenznummer des letzten Events"""
+        with self._lock:
+            return self._load_log_position()
+
+    def task_count(self) -> int:
+        """Anzahl der Tasks ohne den Snapshot vollständig zu laden
+
+        Snapshot-Metadaten plus Creates/Deletes aus dem Log-Tail. Für ältere
+        tasks.json ohne meta-Block wird gestreamt gezählt. Wiederholte Creates
+        bzw. Deletes derselben ID im Tail zählen wie beim Replay nur einmal.
+        """
+        with self._lock:
+            if self._tasks is not None:
+                return len(self._tasks) + len(self._opaque_tasks)
+
+            meta = self.snapshot_meta()
+            if meta is not None:
+                count, since = meta["task_count"], meta["log_sequence"]
+            else:
+                count, since = TaskStoreReader(self.snapshot_file).count(), 0
+
+            # Zustand der im Tail berührten IDs; unbekannt = erstes Vorkommen
+            present: Dict[str, bool] = {}
+            for event in self._iter_log(since):
+                op, task_id = event["op"], event.get("task_id")
+                if task_id is None:
+                    continue
+                if op == OP_CREATE:
+                    # create_task lehnt vorhandene IDs ab: erstes Create = neuer Task
+                    if not present.get(task_id, False):
+                        count += 1
+                    present[task_id] = True
+                elif op == OP_DELETE:
+                    # delete_task verlangt eine vorhandene ID: erstes Delete = Snapshot
+                    if present.get(task_id, True):
+                        count -= 1
+                    present[task_id] = False
+            return max(count, 0)
+
+    def _ensure_loaded(self) -> Dict[str, Dict[str, Any]]:
+        """Zustand beim ersten Zugriff laden; liefert die Tasks"""
+        with self._lock:
+            if self._tasks is not None:
+                return self._tasks
+
+            tasks: Dict[str, Dict[str, Any]] = {}
+            sessions: List[Dict[str, Any]] = []
+            extra: Dict[str, Any] = {}
+            opaque: List[Any] = []
+            since = 0
+
+            if self.snapshot_file.exists():
+                with open(self.snapshot_file, "r", encoding="utf-8") as f:
+                    document = json.load(f)
+                if isinstance(document, dict):
+                    meta = document.get("meta") or {}
+                    if meta.get("format") == SNAPSHOT_FORMAT:
+                        since = meta.get("log_sequence", 0)
+                    for task in document.get("tasks", []):
+                        if isinstance(task, dict) and task.get("task_id"):
+                            tasks[task["task_id"]] = task
+                        else:
+                            opaque.append(task)
+                    sessions = list(document.get("sessions", []))
+                    # Unbekannte Top-Level-Felder beim Kompaktieren erhalten
+                    extra = {
+                        k: v
+                        for k, v in document.items()
+                        if k not in ("meta", "tasks", "sessions")
+                    }
+
+            sequence = since
+            self._tail_events = 0
+            for event in self._iter_log(since):
+                apply_event(tasks, sessions, event)
+                sequence = event["seq"]
+                self._tail_events += 1
+
+            self._seq = sequence
+            self._tasks, self._sessions, self._extra = tasks, sessions, extra
+            self._opaque_tasks = opaque
+            return tasks
+
+    def _load_log_position(self) -> int:
+        """Letzte Sequenznummer ermitteln, ohne den Snapshot zu laden"""
+        if self._seq is not None:
+            return self._seq
+        meta = self.snapshot_meta()
+        since: int = meta["log_sequence"] if meta else 0
+        sequence = since
+        self._tail_events = 0
+        for event in self._iter_log(since):
+            sequence = event["seq"]
+            self._tail_events += 1
+        self._seq = sequence
+        return sequence
+
+    @staticmethod
+    def _repair_tail(f):
+        """Abgebrochene letzte Zeile entfernen, damit neue Events sauber anschließen"""
+        size = f.seek(0, os.SEEK_END)
+        if not size:
+            return
+        f.seek(size - 1)
+        if f.read(1) == b"\n":
+            return
+        f.seek(max(0, size - 64 * 1024))
+        tail_start = f.tell()
+        tail = f.read()
+        f.truncate(tail_start + tail.rfind(b"\n") + 1)
+
+    def _iter_log(self, since: int) -> Iterator[Dict[str, Any]]:
+        try:
+            f = open(self.log_file, "r", encoding="utf-8")
+        except FileNotFoundError:
+            return
+        skipped = 0
+        with f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    event = json.loads(line)
+                except ValueError:
+                    # Abgebrochener Schreibvorgang - nur diese Zeile verwerfen
+                    skipped += 1
+                    continue
+                if not isinstance(event, dict) or "op" not in event:
+                    skipped += 1
+                    continue
+                if event.get("seq", 0) > since:
+                    yield event
+        self.skipped_lines = skipped
+
+    # ------------------------------------------------------------------
+    # Kompaktierung
+    # ------------------------------------------------------------------
+
+    def compact(self) -> Dict[str, Any]:
+        """Schreibe Snapshot (atomar) und leere das Log"""
+        with self._lock:
+            loaded = self._ensure_loaded()
+            meta = {
+                "format": SNAPSHOT_FORMAT,
+                "task_count": len(loaded) + len(self._opaque_tasks),
+                "session_count": len(self._sessions),
+                "log_sequence": self._load_log_position(),
+                "compacted_at": datetime.now().isoformat(),
+            }
+            # meta zuerst, damit snapshot_meta() nur den Dokumentanfang lesen muss
+            tasks = list(loaded.values()) + self._opaque_tasks
+            document = {"meta": meta, "tasks": tasks, "sessions": self._sessions}
+            document.update(self._extra)
+            self.writer.write_json(
+                self.snapshot_file, document, indent=2, ensure_ascii=False
+            )
+
+            # Erst nach erfolgreichem Snapshot kürzen; Events <= log_sequence werden
+            # beim Replay ohnehin übersprungen
+            if self.log_file.exists():
+                with open(self.log_file, "w", encoding="utf-8"):
+                    pass
+            self._tail_events = 0
+            return meta
@@ -0,0 +1,597 @@
+"""
+BMAD Task Graph
+Abhängigkeits-DAG mit inkrementellem kritischem Pfad, Slack und Agent-Auslastung
+
+Tasks verweisen über depends_on (oder dependencies) auf Vorgänger. Dauer eines
+Tasks ist sein Rest (allocated_hours - completed_hours, erledigt = 0). Je Task
+werden gehalten:
+
+    head  frühester Start  = max(head + dauer der Vorgänger)
+    tail  längster Rest-Pfad nach dem Task = max(dauer + tail der Nachfolger)
+
+Projektdauer L = max(dauer + tail) über die Quellen, Slack = L - (head + dauer + tail).
+Eine Fortschrittsmeldung ändert nur die Dauer eines Tasks: head wird vorwärts
+über die Nachfolger, tail rückwärts über die Vorgänger nachgeführt - jeweils in
+topologischer Reihenfolge und nur solange sich Werte ändern. Strukturänderungen
+(neue Tasks/Kanten, Löschen) bauen Reihenfolge und Werte beim nächsten Zugriff
+einmal neu auf (O(n + e)).
+"""
+
+import heapq
+import threading
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from .task_event_log import (
+    OP_CREATE,
+    OP_DELETE,
+    OP_PROGRESS,
+    OP_STATUS,
+    TaskEventLog,
+    status_after_progress,
+)
+
+DEPENDENCY_FIELDS = ("depends_on", "dependencies")
+FINAL_STATUSES = ("completed", "done", "cancelled")
+PRIORITY_ORDER = {"critical": 0, "high": 1, "medium": 2, "low": 3}
+EPSILON = 1e-9
+
+
+class GraphError(ValueError):
+    """Ungültige Abhängigkeit (Zyklus oder unbekannter Task)"""
+
+
+class _Node:
+    __slots__ = (
+        "task_id",
+        "agent",
+        "priority",
+        "status",
+        "allocated",
+        "completed",
+        "preds",
+        "succs",
+        "head",
+        "tail",
+        "order",
+        "open_preds",
+    )
+
+    def __init__(self, task_id: str):
+        self.task_id = task_id
+        self.agent = "unassigned"
+        self.priority = "medium"
+        self.status = "todo"
+        self.allocated = 0.0
+        self.completed = 0.0
+        self.preds: Set[str] = set()
+        self.succs: Set[str] = set()
+        self.head = 0.0
+        self.tail = 0.0
+        self.order = 0
+        self.open_preds = 0
+
+    @property
+    def done(self) -> bool:
+        return self.status in FINAL_STATUSES
+
+    @property
+    def duration(self) -> float:
+        return 0.0 if self.done else max(self.allocated - self.completed, 0.0)
+
+
+class TaskGraph:
+    """DAG der Task-Abhängigkeiten (thread-safe)"""
+
+    def __init__(self, tasks: Iterable[Dict[str, Any]] = ()):
+        self._lock = threading.RLock()
+        self._nodes: Dict[str, _Node] = {}
+        # Kanten auf noch unbekannte Tasks: fehlender Task -> abhängige Tasks
+        self._pending: Dict[str, Set[str]] = {}
+        self._sources: Set[str] = set()
+        self._ready: Set[str] = set()
+        self._agent_remaining: Dict[str, float] = {}
+        self._dirty = False
+        self.rejected_edges: List[Tuple[str, str]] = []
+        self.add_tasks(tasks)
+
+    @classmethod
+    def attach(cls, event_log: TaskEventLog) -> "TaskGraph":
+        """Graph aus dem aktuellen Zustand bauen und danach per Event pflegen"""
+        graph = cls()
+        with graph._lock:
+            graph.add_tasks(event_log.attach(graph.apply_event).values())
+        return graph
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def __contains__(self, task_id: str) -> bool:
+        return task_id in self._nodes
+
+    # ------------------------------------------------------------------
+    # Struktur
+    # ------------------------------------------------------------------
+
+    def add_task(self, task: Dict[str, Any]):
+        """Task anlegen/aktualisieren; Kanten mit Zyklus landen in rejected_edges"""
+        task_id = task.get("task_id")
+        if not task_id:
+            return
+        with self._lock:
+            existing = task_id in self._nodes
+            node = self._set_node(task)
+            if existing:
+                # Abhängigkeiten werden ersetzt, nicht ergänzt
+                for pred in node.preds:
+                    self._nodes[pred].succs.discard(task_id)
+                node.preds.clear()
+                for dependents in self._pending.values():
+                    dependents.discard(task_id)
+            for dependency in _dependencies(task):
+                self._link(dependency, task_id, strict=False)
+            for dependent in self._pending.pop(task_id, ()):
+                self._link(task_id, dependent, strict=False)
+            self._dirty = True
+
+    def add_tasks(self, tasks: Iterable[Dict[str, Any]]):
+        """Bulk-Aufbau: erst alle Knoten, dann Kanten; Zyklen werden per Kahn erkannt"""
+        with self._lock:
+            tasks = [
+                task
+                for task in tasks
+                if task.get("task_id") and task["task_id"] not in self._nodes
+            ]
+            for task in tasks:
+                self._set_node(task)
+            for task in tasks:
+                task_id = task["task_id"]
+                for dependency in _dependencies(task):
+                    if dependency == task_id:
+                        continue
+                    if dependency in self._nodes:
+                        self._nodes[dependency].succs.add(task_id)
+                        self._nodes[task_id].preds.add(dependency)
+                    else:
+                        self._pending.setdefault(dependency, set()).add(task_id)
+            for task in tasks:
+                for dependent in self._pending.pop(task["task_id"], ()):
+                    self._link(task["task_id"], dependent, strict=False)
+            self._dirty = True
+            self._rebuild()
+
+    def _set_node(self, task: Dict[str, Any]) -> _Node:
+        task_id = task["task_id"]
+        node = self._nodes.get(task_id)
+        if node is None:
+            node = self._nodes[task_id] = _Node(task_id)
+        self._set_agent_remaining(node, -1)
+        node.agent = str(task.get("agent") or "unassigned")
+        node.priority = str(task.get("priority") or "medium")
+        node.status = str(task.get("status") or "todo")
+        node.allocated = float(task.get("allocated_hours") or 0)
+        node.completed = float(task.get("completed_hours") or 0)
+        self._set_agent_remaining(node, 1)
+        return node
+
+    def add_dependency(self, task_id: str, depends_on: str):
+        """Kante depends_on -> task_id; GraphError bei Zyklus"""
+        with self._lock:
+            if task_id not in self._nodes:
+                raise GraphError(f"Unbekannter Task: {task_id}")
+            self._link(depends_on, task_id, strict=True)
+            self._dirty = True
+
+    def remove_task(self, task_id: str):
+        with self._lock:
+            node = self._nodes.pop(task_id, None)
+            if node is None:
+                return
+            self._set_agent_remaining(node, -1)
+            for pred in node.preds:
+                self._nodes[pred].succs.discard(task_id)
+            for succ in node.succs:
+                self._nodes[succ].preds.discard(task_id)
+                # Abhängigkeit bleibt vorgemerkt, falls der Task neu angelegt wird
+                self._pending.setdefault(task_id, set()).add(succ)
+            for dependents in self._pending.values():
+                dependents.discard(task_id)
+            self._dirty = True
+
+    def _link(self, pred: str, succ: str, strict: bool):
+        if pred == succ or pred in self._nodes[succ].preds:
+            return
+        if pred not in self._nodes:
+            self._pending.setdefault(pred, set()).add(succ)
+            return
+        if self._reaches(succ, pred):
+            if strict:
+                raise GraphError(f"Zyklus: {pred} -> {succ}")
+            self.rejected_edges.append((pred, succ))
+            return
+        self._nodes[pred].succs.add(succ)
+        self._nodes[succ].preds.add(pred)
+
+    def _reaches(self, start: str, target: str) -> bool:
+        stack, seen = [start], {start}
+        while stack:
+            current = stack.pop()
+            if current == target:
+                return True
+            for succ in self._nodes[current].succs:
+                if succ not in seen:
+                    seen.add(succ)
+                    stack.append(succ)
+        return False
+
+    def _rebuild(self) -> None:
+        """Topologische Reihenfolge (Kahn) und alle head/tail-Werte neu berechnen"""
+        nodes = self._nodes
+        indegree = {task_id: len(node.preds) for task_id, node in nodes.items()}
+        queue = sorted(task_id for task_id, degree in indegree.items() if degree == 0)
+        order: List[str] = []
+        while queue:
+            task_id = queue.pop()
+            order.append(task_id)
+            for succ in nodes[task_id].succs:
+                indegree[succ] -= 1
+                if indegree[succ] == 0:
+                    queue.append(succ)
+
+        if len(order) < len(nodes):
+            # Zyklus (nur über den Bulk-Aufbau möglich): je stark zusammenhängender
+            # Komponente nur die Rückwärtskanten einer Tiefensuche verwerfen -
+            # Kanten von Tasks, die nur hinter einem Zyklus liegen, bleiben erhalten
+            remaining = set(nodes) - set(order)
+            for component in self._cycle_components(remaining):
+                for pred, succ in self._back_edges(component):
+                    nodes[pred].succs.discard(succ)
+                    nodes[succ].preds.discard(pred)
+                    self.rejected_edges.append((pred, succ))
+            return self._rebuild()
+
+        for position, task_id in enumerate(order):
+            node = nodes[task_id]
+            node.order = position
+            node.head = max(
+                (nodes[p].head + nodes[p].duration for p in node.preds), default=0.0
+            )
+            node.open_preds = sum(1 for p in node.preds if not nodes[p].done)
+        for task_id in reversed(order):
+            node = nodes[task_id]
+            node.tail = max(
+                (nodes[s].duration + nodes[s].tail for s in node.succs), default=0.0
+            )
+
+        self._sources = {task_id for task_id, node in nodes.items() if not node.preds}
+        self._ready = {
+            task_id
+            for task_id, node in nodes.items()
+            if not node.done and not node.open_preds
+        }
+        self._dirty = False
+
+    def _cycle_components(self, candidates: Set[str]) -> List[Set[str]]:
+        """Stark zusammenhängende Komponenten mit mehr als einem Task (Tarjan)"""
+        nodes = self._nodes
+        index: Dict[str, int] = {}
+        low: Dict[str, int] = {}
+        stack: List[str] = []
+        on_stack: Set[str] = set()
+        components: List[Set[str]] = []
+
+        def visit(task_id: str) -> Tuple[str, Iterator[str]]:
+            index[task_id] = low[task_id] = len(index)
+            stack.append(task_id)
+            on_stack.add(task_id)
+            return task_id, iter(sorted(nodes[task_id].succs & candidates))
+
+        for root in sorted(candidates):
+            if root in index:
+                continue
+            work = [visit(root)]
+            while work:
+                current, succs = work[-1]
+                for succ in succs:
+                    if succ not in index:
+                        work.append(visit(succ))
+                        break
+                    if succ in on_stack:
+                        low[current] = min(low[current], index[succ])
+                else:
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        low[parent] = min(low[parent], low[current])
+                    if low[current] == index[current]:
+                        component = set()
+                        while True:
+                            member = stack.pop()
+                            on_stack.discard(member)
+                            component.add(member)
+                            if member == current:
+                                break
+                        if len(component) > 1:
+                            components.append(component)
+        return components
+
+    def _back_edges(self, component: Set[str]) -> List[Tuple[str, str]]:
+        """Rückwärtskanten einer Tiefensuche innerhalb der Komponente
+
+        Ohne diese Kanten ist die Komponente azyklisch.
+        """
+        nodes = self._nodes
+        active: Set[str] = set()
+        done: Set[str] = set()
+        edges: List[Tuple[str, str]] = []
+        for root in sorted(component):
+            if root in done:
+                continue
+            active.add(root)
+            work = [(root, iter(sorted(nodes[root].succs & component)))]
+            while work:
+                current, succs = work[-1]
+                for succ in succs:
+                    if succ in active:
+                        edges.append((current, succ))
+                    elif succ not in done:
+                        active.add(succ)
+                        work.append((succ, iter(sorted(nodes[succ].succs & component))))
+                        break
+                else:
+                    work.pop()
+                    active.discard(current)
+                    done.add(current)
+        return edges
+
+    def _ensure_built(self):
+        if self._dirty:
+            self._rebuild()
+
+    # ------------------------------------------------------------------
+    # Inkrementelle Updates
+    # ------------------------------------------------------------------
+
+    def update_progress(self, task_id: str, completed_hours: float):
+        with self._lock:
+            node = self._nodes.get(task_id)
+            if node is None:
+                return
+            status = status_after_progress(node.status, node.allocated, completed_hours)
+            self._update(node, completed=float(completed_hours), status=status)
+
+    def set_status(self, task_id: str, status: str):
+        with self._lock:
+            node = self._nodes.get(task_id)
+            if node is not None:
+                self._update(node, status=status)
+
+    def _update(
+        self,
+        node: _Node,
+        completed: Optional[float] = None,
+        status: Optional[str] = None,
+    ):
+        old_duration, was_done = node.duration, node.done
+        self._set_agent_remaining(node, -1)
+        if completed is not None:
+            node.completed = completed
+        if status is not None:
+            node.status = status
+        self._set_agent_remaining(node, 1)
+        if self._dirty:
+            return
+
+        if node.done != was_done:
+            delta = -1 if node.done else 1
+            for succ_id in node.succs:
+                succ = self._nodes[succ_id]
+                succ.open_preds += delta
+                self._refresh_ready(succ)
+            self._refresh_ready(node)
+        if abs(node.duration - old_duration) > EPSILON:
+            self._propagate_heads(node)
+            self._propagate_tails(node)
+
+    def _refresh_ready(self, node: _Node):
+        if not node.done and not node.open_preds:
+            self._ready.add(node.task_id)
+        else:
+            self._ready.discard(node.task_id)
+
+    def _propagate_heads(self, changed: _Node):
+        """head der Nachfolger in topologischer Reihenfolge nachführen"""
+        nodes = self._nodes
+        heap = [(nodes[s].order, s) for s in changed.succs]
+        heapq.heapify(heap)
+        queued = set(changed.succs)
+        while heap:
+            _, task_id = heapq.heappop(heap)
+            node = nodes[task_id]
+            head = max(
+                (nodes[p].head + nodes[p].duration for p in node.preds), default=0.0
+            )
+            if abs(head - node.head) <= EPSILON:
+                continue
+            node.head = head
+            for succ in node.succs:
+                if succ not in queued:
+                    queued.add(succ)
+                    heapq.heappush(heap, (nodes[succ].order, succ))
+
+    def _propagate_tails(self, changed: _Node):
+        """tail der Vorgänger in umgekehrter topologischer Reihenfolge nachführen"""
+        nodes = self._nodes
+        heap = [(-nodes[p].order, p) for p in changed.preds]
+        heapq.heapify(heap)
+        queued = set(changed.preds)
+        while heap:
+            _, task_id = heapq.heappop(heap)
+            node = nodes[task_id]
+            tail = max(
+                (nodes[s].duration + nodes[s].tail for s in node.succs), default=0.0
+            )
+            if abs(tail - node.tail) <= EPSILON:
+                continue
+            node.tail = tail
+            for pred in node.preds:
+                if pred not in queued:
+                    queued.add(pred)
+                    heapq.heappush(heap, (-nodes[pred].order, pred))
+
+    def _set_agent_remaining(self, node: _Node, sign: int):
+        remaining = self._agent_remaining.get(node.agent, 0.0) + sign * node.duration
+        self._agent_remaining[node.agent] = max(remaining, 0.0)
+
+    def apply_event(self, event: Dict[str, Any]):
+        """Listener für TaskEventLog"""
+        op, task_id = event["op"], event.get("task_id")
+        data = event.get("data") or {}
+        if op == OP_CREATE:
+            task = dict(data)
+            task.setdefault("task_id", task_id)
+            self.add_task(task)
+        elif not task_id:
+            return
+        elif op == OP_PROGRESS:
+            self.update_progress(task_id, data["completed_hours"])
+        elif op == OP_STATUS:
+            self.set_status(task_id, data["status"])
+        elif op == OP_DELETE:
+            self.remove_task(task_id)
+
+    # ------------------------------------------------------------------
+    # Abfragen
+    # ------------------------------------------------------------------
+
+    @property
+    def project_length(self) -> float:
+        """Länge des kritischen Pfads in Stunden (Rest)"""
+        with self._lock:
+            self._ensure_built()
+            nodes = self._nodes
+            return max(
+                (nodes[s].duration + nodes[s].tail for s in self._sources), default=0.0
+            )
+
+    def topological_order(self) -> List[str]:
+        with self._lock:
+            self._ensure_built()
+            return sorted(self._nodes, key=lambda task_id: self._nodes[task_id].order)
+
+    def dependencies(self, task_id: str) -> List[str]:
+        """Angenommene (zyklusfreie) Vorgänger eines Tasks"""
+        with self._lock:
+            return sorted(self._nodes[task_id].preds)
+
+    def schedule(self, task_id: str) -> Dict[str, float]:
+        """Frühester/spätester Start und Ende sowie Slack (Stunden ab jetzt)"""
+        with self._lock:
+            self._ensure_built()
+            node = self._nodes[task_id]
+            length = self.project_length
+            finish = node.head + node.duration
+            latest_finish = length - node.tail
+            return {
+                "earliest_start": node.head,
+                "earliest_finish": finish,
+                "latest_start": latest_finish - node.duration,
+                "latest_finish": latest_finish,
+                "slack": latest_finish - finish,
+            }
+
+    def slack(self, task_id: str) -> float:
+        return self.schedule(task_id)["slack"]
+
+    def critical_path(self) -> List[str]:
+        """Task-IDs des (eines) kritischen Pfads vom Start bis zum Ende"""
+        with self._lock:
+            self._ensure_built()
+            length = self.project_length
+            nodes = self._nodes
+            open_sources = [
+                s
+                for s in self._sources
+                if nodes[s].duration > EPSILON or nodes[s].tail > EPSILON
+            ]
+            if not open_sources or length <= EPSILON:
+                return []
+            current = max(
+                open_sources, key=lambda s: (nodes[s].duration + nodes[s].tail, s)
+            )
+            path = [current]
+            while True:
+                node = nodes[current]
+                finish = node.head + node.duration
+                candidates = [
+                    s
+                    for s in node.succs
+                    if abs(nodes[s].head - finish) <= EPSILON
+                    and abs(finish + nodes[s].duration + nodes[s].tail - length)
+                    <= EPSILON
+                ]
+                if not candidates or node.tail <= EPSILON:
+                    return path
+                current = max(candidates, key=lambda s: (nodes[s].duration, s))
+                path.append(current)
+
+    def agent_capacity(self, hours_per_day: float = 8.0) -> Dict[str, Dict[str, float]]:
+        """Offene Reststunden je Agent und daraus Arbeitstage"""
+        with self._lock:
+            return {
+                agent: {
+                    "remaining_hours": hours,
+                    "days": hours / hours_per_day if hours_per_day else 0.0,
+                }
+                for agent, hours in sorted(self._agent_remaining.items())
+                if hours > EPSILON
+            }
+
+    def suggest_next(
+        self, agent: Optional[str] = None, limit: int = 5
+    ) -> List[Dict[str, Any]]:
+        """Startbereite Tasks
+
+        Reihenfolge: geringster Slack, Priorität, am wenigsten ausgelasteter Agent.
+        """
+        with self._lock:
+            self._ensure_built()
+            length = self.project_length
+            nodes = self._nodes
+
+            def rank(task_id: str) -> Tuple:
+                node = nodes[task_id]
+                slack = length - (node.head + node.duration + node.tail)
+                return (
+                    round(slack, 6),
+                    PRIORITY_ORDER.get(node.priority, 2),
+                    self._agent_remaining.get(node.agent, 0.0),
+                    node.order,
+                    task_id,
+                )
+
+            candidates = (
+                task_id
+                for task_id in self._ready
+                if agent is None or nodes[task_id].agent == agent
+            )
+            best = heapq.nsmallest(limit, candidates, key=rank)
+            return [
+                {
+                    "task_id": task_id,
+                    "agent": nodes[task_id].agent,
+                    "priority": nodes[task_id].priority,
+                    "remaining_hours": nodes[task_id].duration,
+                    "slack": rank(task_id)[0],
+                    "critical": rank(task_id)[0] <= EPSILON,
+                    "unblocks": len(nodes[task_id].succs),
+                }
+                for task_id in best
+            ]
+
+
+def _dependencies(task: Dict[str, Any]) -> List[str]:
+    for field in DEPENDENCY_FIELDS:
+        value = task.get(field)
+        if value:
+            return [str(v) for v in ([value] if isinstance(value, str) else value)]
+    return []
@@ -0,0 +1,381 @@
+"""
+BMAD Task Index
+Persistenter Datums-Index mit Sekundärindizes nach Agent und Status
+
+Jeder Task belegt ein Intervall [start, end] (start_date bis due_date/end_date,
+eintägige Tasks: start == end). Die Intervalle liegen in Buckets nach Dauer
+(0 Tage, 1, 2-3, 4-7, ... - Zweierpotenzen), je Bucket nach Start sortiert.
+Eine Abfrage "aktiv am Tag D" sucht per bisect in jedem Bucket nur Starts im
+Fenster [D - längste Dauer des Buckets, D]; ein einzelner monatelanger Task
+verbreitert so nur das Fenster seines eigenen Buckets. Leere Buckets fallen
+weg, es muss nie eine globale Maximaldauer nachgeführt werden. Datumswerte
+werden einmal beim Einfügen geparst, nicht bei jeder Abfrage. Offene Tasks
+liegen zusätzlich nach Ende sortiert vor; suggest_next liest davon nur den
+Anfang.
+
+Der Index folgt dem TaskEventLog inkrementell (create, progress, status,
+delete) und wird unter ~/.bmad-global/task-index.json mit der Log-Sequenz
+gespeichert. Beim nächsten Start werden nur die Events danach nachgespielt;
+erst wenn diese bereits kompaktiert sind, wird aus dem Snapshot neu aufgebaut.
+Das automatische Speichern läuft in einem Hintergrund-Thread, nicht im
+Listener - der hält die Schreibsperre des Event-Logs.
+"""
+
+import bisect
+import threading
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional, Set, Tuple
+
+from .atomic_writer import atomic_writer
+from .serialization import load_json_file
+from .task_event_log import (
+    OP_CREATE,
+    OP_DELETE,
+    OP_PROGRESS,
+    OP_STATUS,
+    TaskEventLog,
+    status_after_progress,
+)
+
+INDEX_FORMAT = "bmad-task-index/1"
+# Index nach so vielen Events speichern (0 = nur explizit per save())
+DEFAULT_AUTOSAVE_EVERY = 500
+
+START_FIELDS = ("start_date",)
+END_FIELDS = ("due_date", "end_date", "deadline")
+FINAL_STATUSES = ("completed", "done", "cancelled")
+PRIORITY_ORDER = {"critical": 0, "high": 1, "medium": 2, "low": 3}
+
+
+def default_index_file() -> Path:
+    return Path.home() / ".bmad-global" / "task-index.json"
+
+
+def _day(value: Any) -> Optional[str]:
+    """ISO-Datum (YYYY-MM-DD) aus Datum/Datetime-String, sonst None"""
+    if not value:
+        return None
+    text = str(value)[:10]
+    try:
+        date.fromisoformat(text)
+    except ValueError:
+        return None
+    return text
+
+
+def _span_days(start: str, end: str) -> int:
+    return (date.fromisoformat(end) - date.fromisoformat(start)).days
+
+
+def _span_bucket(start: str, end: str) -> int:
+    """Bucket k enthält Dauern bis 2**k - 1 Tage"""
+    return _span_days(start, end).bit_length()
+
+
+def _remove_sorted(items: List[Tuple[str, str]], item: Tuple[str, str]):
+    position = bisect.bisect_left(items, item)
+    if position < len(items) and items[position] == item:
+        del items[position]
+
+
+class IndexEntry(NamedTuple):
+    start: Optional[str]
+    end: Optional[str]
+    agent: str
+    status: str
+    priority: str
+    allocated_hours: float
+
+
+def entry_for(task: Dict[str, Any]) -> IndexEntry:
+    start = next((_day(task.get(f)) for f in START_FIELDS if _day(task.get(f))), None)
+    end = next((_day(task.get(f)) for f in END_FIELDS if _day(task.get(f))), None)
+    start = start or end
+    if start and (end is None or end < start):
+        end = start
+    return IndexEntry(
+        start,
+        end,
+        str(task.get("agent") or "unassigned"),
+        str(task.get("status") or "todo"),
+        str(task.get("priority") or "medium"),
+        float(task.get("allocated_hours") or 0),
+    )
+
+
+class TaskIndex:
+    """Sortierter Intervall-Index plus Agent-/Status-Sets (thread-safe)"""
+
+    def __init__(
+        self,
+        index_file: Optional[Path] = None,
+        autosave_every: int = DEFAULT_AUTOSAVE_EVERY,
+    ):
+        self.index_file = Path(index_file) if index_file else default_index_file()
+        self.autosave_every = autosave_every
+        self.log_sequence = 0
+        self._events_since_save = 0
+        self._lock = threading.RLock()
+        self._entries: Dict[str, IndexEntry] = {}
+        # Dauer-Bucket -> [(start, task_id)] nach Start sortiert
+        self._by_start: Dict[int, List[Tuple[str, str]]] = {}
+        # Offene Tasks mit Datum als (end, task_id)
+        self._open_by_end: List[Tuple[str, str]] = []
+        self._by_agent: Dict[str, Set[str]] = {}
+        self._by_status: Dict[str, Set[str]] = {}
+        self._saver: Optional[threading.Thread] = None
+
+    @classmethod
+    def attach(
+        cls, event_log: TaskEventLog, index_file: Optional[Path] = None, **options: Any
+    ) -> "TaskIndex":
+        """Gespeicherten Index laden, Log-Tail nachspielen, danach per Event pflegen"""
+        index = cls(index_file, **options)
+        with index._lock:
+            if index.load():
+                sequence = event_log.follow(index.apply_event, index.log_sequence)
+                if sequence is not None:
+                    index.log_sequence = sequence
+                    return index
+            index.clear()
+            for task in event_log.attach(index.apply_event).values():
+                index.upsert(task)
+            index.log_sequence = max(index.log_sequence, event_log.sequence)
+            index.save()
+        return index
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # ------------------------------------------------------------------
+    # Pflege
+    # ------------------------------------------------------------------
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._by_start.clear()
+            self._open_by_end.clear()
+            self._by_agent.clear()
+            self._by_status.clear()
+
+    def upsert(self, task: Dict[str, Any]):
+        task_id = task.get("task_id")
+        if task_id:
+            self._put(task_id, entry_for(task))
+
+    def remove(self, task_id: str):
+        with self._lock:
+            entry = self._entries.pop(task_id, None)
+            if entry is None:
+                return
+            # entry_for setzt start und end nur gemeinsam
+            if entry.start and entry.end:
+                bucket = _span_bucket(entry.start, entry.end)
+                starts = self._by_start[bucket]
+                _remove_sorted(starts, (entry.start, task_id))
+                if not starts:
+                    del self._by_start[bucket]
+                if entry.status not in FINAL_STATUSES:
+                    _remove_sorted(self._open_by_end, (entry.end, task_id))
+            self._discard(self._by_agent, entry.agent, task_id)
+            self._discard(self._by_status, entry.status, task_id)
+
+    def apply_event(self, event: Dict[str, Any]):
+        """Listener für TaskEventLog"""
+        op, task_id = event["op"], event.get("task_id")
+        data = event.get("data") or {}
+        with self._lock:
+            if event.get("seq"):
+                self.log_sequence = max(self.log_sequence, event["seq"])
+            if op == OP_CREATE:
+                task = dict(data)
+                task.setdefault("task_id", task_id)
+                task.setdefault("status", "todo")
+                self.upsert(task)
+            elif task_id:
+                self._apply_update(op, task_id, data)
+            self._events_since_save += 1
+            if self.autosave_every and self._events_since_save >= self.autosave_every:
+                self._save_in_background()
+
+    def _apply_update(self, op: str, task_id: str, data: Dict[str, Any]):
+        entry = self._entries.get(task_id)
+        if entry is None:
+            return
+        if op == OP_PROGRESS:
+            status = status_after_progress(
+                entry.status, entry.allocated_hours, data["completed_hours"]
+            )
+            if status and status != entry.status:
+                self._put(task_id, entry._replace(status=status))
+        elif op == OP_STATUS:
+            self._put(task_id, entry._replace(status=str(data["status"])))
+        elif op == OP_DELETE:
+            self.remove(task_id)
+
+    def _put(self, task_id: str, entry: IndexEntry):
+        with self._lock:
+            if task_id in self._entries:
+                self.remove(task_id)
+            self._entries[task_id] = entry
+            if entry.start and entry.end:
+                starts = self._by_start.setdefault(
+                    _span_bucket(entry.start, entry.end), []
+                )
+                bisect.insort(starts, (entry.start, task_id))
+                if entry.status not in FINAL_STATUSES:
+                    bisect.insort(self._open_by_end, (entry.end, task_id))
+            self._by_agent.setdefault(entry.agent, set()).add(task_id)
+            self._by_status.setdefault(entry.status, set()).add(task_id)
+
+    @staticmethod
+    def _discard(index: Dict[str, Set[str]], key: str, task_id: str):
+        ids = index.get(key)
+        if ids is not None:
+            ids.discard(task_id)
+            if not ids:
+                del index[key]
+
+    # ------------------------------------------------------------------
+    # Abfragen
+    # ------------------------------------------------------------------
+
+    def entry(self, task_id: str) -> Optional[IndexEntry]:
+        return self._entries.get(task_id)
+
+    def in_range(
+        self,
+        first: date,
+        last: date,
+        agent: Optional[str] = None,
+        status: Optional[str] = None,
+    ) -> List[str]:
+        """Tasks, deren Intervall [first, last] überlappt (nach Start sortiert)"""
+        first_day, last_day = first.isoformat(), last.isoformat()
+        with self._lock:
+            filters = self._filter_sets(agent, status)
+            if filters is None:
+                return []
+            matches = []
+            for bucket, starts in self._by_start.items():
+                low = (first - timedelta(days=(1 << bucket) - 1)).isoformat()
+                lo = bisect.bisect_left(starts, (low, ""))
+                hi = bisect.bisect_right(starts, (last_day, "\uffff"))
+                for start, task_id in starts[lo:hi]:
+                    end = self._entries[task_id].end
+                    if end is None or end < first_day:
+                        continue
+                    if all(task_id in ids for ids in filters):
+                        matches.append((start, task_id))
+            matches.sort()
+            return [task_id for _, task_id in matches]
+
+    def active_on(
+        self, day: Optional[date] = None, **filters: Optional[str]
+    ) -> List[str]:
+        """bmad_get_today_tasks / bmad_get_todays_schedule: aktiv am Tag (heute)"""
+        day = day or date.today()
+        return self.in_range(day, day, **filters)
+
+    def by_agent(self, agent: str) -> Set[str]:
+        with self._lock:
+            return set(self._by_agent.get(agent, ()))
+
+    def by_status(self, status: str) -> Set[str]:
+        with self._lock:
+            return set(self._by_status.get(status, ()))
+
+    def suggest_next(
+        self, agent: Optional[str] = None, day: Optional[date] = None, limit: int = 5
+    ) -> List[str]:
+        """bmad_suggest_next_tasks: offene, bereits gestartete Tasks
+
+        Reihenfolge: frühestes Ende, dann Priorität, dann Start. Gelesen
+        werden nur die offenen Tasks nach Ende, bis limit Kandidaten gefunden
+        sind und das Ende wechselt.
+        """
+        today = (day or date.today()).isoformat()
+        with self._lock:
+            agent_ids = self._by_agent.get(agent, set()) if agent else None
+            candidates: List[Tuple[str, int, str, str]] = []
+            for end, task_id in self._open_by_end:
+                if len(candidates) >= limit and end != candidates[-1][0]:
+                    break
+                entry = self._entries[task_id]
+                if (
+                    entry.start is None
+                    or entry.start > today
+                    or (agent_ids is not None and task_id not in agent_ids)
+                ):
+                    continue
+                candidates.append(
+                    (end, PRIORITY_ORDER.get(entry.priority, 2), entry.start, task_id)
+                )
+        candidates.sort()
+        return [task_id for *_, task_id in candidates[:limit]]
+
+    def _filter_sets(
+        self, agent: Optional[str], status: Optional[str]
+    ) -> Optional[List[Set[str]]]:
+        filters = []
+        for index, key in ((self._by_agent, agent), (self._by_status, status)):
+            if key is None:
+                continue
+            ids = index.get(key)
+            if not ids:
+                return None
+            filters.append(ids)
+        return filters
+
+    # ------------------------------------------------------------------
+    # Persistenz
+    # ------------------------------------------------------------------
+
+    @property
+    def dirty(self) -> bool:
+        """Events seit dem letzten Speichern"""
+        return self._events_since_save > 0
+
+    def save(self) -> bool:
+        # Unter der Sperre nur flach kopieren; Serialisieren und Schreiben danach
+        with self._lock:
+            entries, sequence = dict(self._entries), self.log_sequence
+            self._events_since_save = 0
+        document = {
+            "format": INDEX_FORMAT,
+            "log_sequence": sequence,
+            "tasks": {task_id: list(entry) for task_id, entry in entries.items()},
+        }
+        return atomic_writer.write_json(self.index_file, document, indent=None)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Laufendes Hintergrund-Speichern abwarten, offene Events sichern"""
+        saver = self._saver
+        if saver is not None:
+            saver.join(timeout)
+        return self.save() if self.dirty else True
+
+    def _save_in_background(self):
+        with self._lock:
+            if self._saver is not None and self._saver.is_alive():
+                return
+            self._saver = threading.Thread(
+                target=self.save, name="bmad-task-index-save", daemon=True
+            )
+            self._saver.start()
+
+    def load(self) -> bool:
+        try:
+            document = load_json_file(self.index_file)
+        except (OSError, ValueError):
+            return False
+        if not isinstance(document, dict) or document.get("format") != INDEX_FORMAT:
+            return False
+        with self._lock:
+            self.clear()
+            for task_id, values in document.get("tasks", {}).items():
+                self._put(task_id, IndexEntry(*values))
+            self.log_sequence = document.get("log_sequence", 0)
+        return True
@@ -0,0 +1,324 @@
+"""
+BMAD Task Store Reader
+Streamender Lesezugriff auf ~/.bmad-global/tasks.json
+
+Die Tasks werden Element für Element aus dem "tasks"-Array dekodiert, ohne das
+gesamte Dokument zu materialisieren. Die Anzahl wird zusätzlich in einer kleinen
+Meta-Datei gecached (gültig solange Größe und mtime von tasks.json gleich bleiben).
+"""
+
+import json
+import os
+import re
+from datetime import date, datetime
+from pathlib import Path
+from typing import IO, Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+_CHUNK_SIZE = 64 * 1024
+_WHITESPACE = " \t\n\r"
+# Scanner: Strukturzeichen außerhalb von Strings, Ende/Escape in Strings,
+# Ende von Skalaren
+_STRUCTURAL = re.compile(r'["\[\]{}]')
+_STRING_SPECIAL = re.compile(r'["\\]')
+_SCALAR_END = re.compile(r"[,\]}\s]")
+
+
+def default_tasks_file() -> Path:
+    return Path.home() / ".bmad-global" / "tasks.json"
+
+
+class _StreamBuffer:
+    """Chunk-Puffer über einer Textdatei mit inkrementellem Scanner
+
+    Werte im Puffer dekodiert raw_decode direkt. Reicht ein Wert über das
+    Pufferende, findet _scan sein Ende Chunk für Chunk (Zustand: Tiefe,
+    String, Escape). Übersprungene Werte werden dabei nicht gepuffert, zu
+    dekodierende als Stücke gesammelt und einmal gelesen - linear in der
+    Wertgröße, auch wenn er viele Chunks umfasst.
+    """
+
+    def __init__(self, f: IO[str]):
+        self.f = f
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self) -> bool:
+        if self.eof:
+            return False
+        chunk = self.f.read(_CHUNK_SIZE)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buf = self.buf[self.pos :] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Nächstes Nicht-Whitespace-Zeichen ('' am Dateiende)"""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char: str):
+        if self.peek() != char:
+            raise ValueError(f"Ungültiges tasks.json: '{char}' erwartet")
+        self.pos += 1
+
+    def decode(self, decoder: json.JSONDecoder) -> Any:
+        """Dekodiere den nächsten vollständigen JSON-Wert"""
+        found, value = self._decode_buffered(decoder)
+        if found:
+            return value
+        text = self._scan(keep=True)
+        value, end = decoder.raw_decode(text)
+        if end != len(text):
+            raise ValueError("Ungültiges tasks.json: unerwartete Zeichen nach Wert")
+        return value
+
+    def skip(self, decoder: json.JSONDecoder):
+        """Überspringe den nächsten JSON-Wert ohne ihn zu puffern"""
+        if not self._decode_buffered(decoder)[0]:
+            self._scan(keep=False)
+
+    def _decode_buffered(self, decoder: json.JSONDecoder) -> Tuple[bool, Any]:
+        """Schneller Weg: Wert liegt vollständig im Puffer (Regelfall)
+
+        Schlägt höchstens einmal pro Puffer fehl - ein Wert über das Pufferende
+        geht dann an _scan, statt raw_decode nach jedem Chunk neu zu starten.
+        """
+        self.peek()
+        try:
+            value, end = decoder.raw_decode(self.buf, self.pos)
+        except json.JSONDecodeError:
+            if self.eof:
+                raise
+            return False, None
+        # Am Pufferende könnte z.B. eine Zahl abgeschnitten sein
+        if end < len(self.buf) or self.eof:
+            self.pos = end
+            return True, value
+        return False, None
+
+    def _scan(self, keep: bool) -> str:
+        first = self.peek()
+        if not first:
+            raise ValueError("Ungültiges tasks.json: unerwartetes Dateiende")
+        pieces: List[str] = []
+        scalar = first not in '[{"'
+        depth = 0
+        in_string = escape = False
+        while True:
+            buf, i, end = self.buf, self.pos, None
+            while i < len(buf):
+                if escape:
+                    escape = False
+                    i += 1
+                elif scalar:
+                    match = _SCALAR_END.search(buf, i)
+                    if match is not None:
+                        end = match.start()
+                    break
+                elif in_string:
+                    match = _STRING_SPECIAL.search(buf, i)
+                    if match is None:
+                        break
+                    i = match.end()
+                    if match.group() == "\\":
+                        escape = True
+                        continue
+                    in_string = False
+                    if depth == 0:
+                        end = i
+                        break
+                else:
+                    match = _STRUCTURAL.search(buf, i)
+                    if match is None:
+                        break
+                    i = match.end()
+                    char = match.group()
+                    if char == '"':
+                        in_string = True
+                    elif char in "[{":
+                        depth += 1
+                    else:
+                        depth -= 1
+                        if depth == 0:
+                            end = i
+                            break
+            if end is not None:
+                if keep:
+                    pieces.append(buf[self.pos : end])
+                self.pos = end
+                return "".join(pieces)
+            # Puffer verbraucht: nur der gewünschte Wert wird aufgehoben
+            if keep:
+                pieces.append(buf[self.pos :])
+            self.pos = len(buf)
+            if not self._fill():
+                if scalar:
+                    return "".join(pieces)
+                raise ValueError("Ungültiges tasks.json: unerwartetes Dateiende")
+
+
+def iter_json_array(f: IO[str], key: str = "tasks") -> Iterator[Any]:
+    """Streame die Elemente von document[key] bzw. eines Top-Level-Arrays"""
+    decoder = json.JSONDecoder()
+    stream = _StreamBuffer(f)
+
+    first = stream.peek()
+    if first == "[":
+        yield from _iter_array(stream, decoder)
+        return
+
+    stream.expect("{")
+    while stream.peek() not in ("}", ""):
+        name = stream.decode(decoder)
+        stream.expect(":")
+        if name == key and stream.peek() == "[":
+            yield from _iter_array(stream, decoder)
+            return
+        stream.skip(decoder)  # anderen Wert überspringen
+        if stream.peek() == ",":
+            stream.pos += 1
+
+
+def read_json_key(f: IO[str], key: str) -> Any:
+    """Lies nur den Wert eines Top-Level-Keys (früh im Dokument = billig)"""
+    decoder = json.JSONDecoder()
+    stream = _StreamBuffer(f)
+    if stream.peek() != "{":
+        return None
+
+    stream.expect("{")
+    while stream.peek() not in ("}", ""):
+        name = stream.decode(decoder)
+        stream.expect(":")
+        if name == key:
+            return stream.decode(decoder)
+        stream.skip(decoder)
+        if stream.peek() == ",":
+            stream.pos += 1
+    return None
+
+
+def _iter_array(stream: _StreamBuffer, decoder: json.JSONDecoder) -> Iterator[Any]:
+    stream.expect("[")
+    while stream.peek() not in ("]", ""):
+        yield stream.decode(decoder)
+        if stream.peek() == ",":
+            stream.pos += 1
+
+
+class TaskStoreReader:
+    """Lazy Reader für die globale Task-Datei"""
+
+    def __init__(self, tasks_file: Optional[Path] = None):
+        self.tasks_file = Path(tasks_file) if tasks_file else default_tasks_file()
+        self.meta_file = self.tasks_file.with_name(self.tasks_file.stem + ".meta.json")
+
+    def exists(self) -> bool:
+        return self.tasks_file.exists()
+
+    def iter_tasks(self) -> Iterator[Dict[str, Any]]:
+        if not self.exists():
+            return
+        with open(self.tasks_file, "r", encoding="utf-8") as f:
+            for task in iter_json_array(f, "tasks"):
+                if isinstance(task, dict):
+                    yield task
+
+    def filter(
+        self,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        **fields: Any,
+    ) -> Iterator[Dict[str, Any]]:
+        """Tasks nach Feldwerten (agent="dev", status="todo") und/oder Prädikat"""
+        for task in self.iter_tasks():
+            if any(task.get(k) != v for k, v in fields.items()):
+                continue
+            if predicate is None or predicate(task):
+                yield task
+
+    def count(self) -> int:
+        """Anzahl der Tasks - aus dem Meta-Cache, sonst per Streaming gezählt"""
+        try:
+            st = self.tasks_file.stat()
+        except FileNotFoundError:
+            return 0
+
+        meta = self._read_meta()
+        if (
+            meta
+            and meta.get("size") == st.st_size
+            and meta.get("mtime_ns") == st.st_mtime_ns
+        ):
+            return meta["count"]
+
+        count = sum(1 for _ in self.iter_tasks())
+        self._write_meta(
+            {"size": st.st_size, "mtime_ns": st.st_mtime_ns, "count": count}
+        )
+        return count
+
+    def today_tasks(self, day: Optional[date] = None) -> List[Dict[str, Any]]:
+        """Tasks mit start_date am angegebenen Tag (Standard: heute)"""
+        day_str = (day or date.today()).isoformat()
+        return list(
+            self.filter(lambda t: str(t.get("start_date") or "")[:10] == day_str)
+        )
+
+    def summary(self) -> Dict[str, Any]:
+        """Aggregierte Kennzahlen in einem Streaming-Durchlauf"""
+        by_status: Dict[str, int] = {}
+        by_agent: Dict[str, Dict[str, float]] = {}
+        allocated = completed = 0.0
+        total = 0
+
+        for task in self.iter_tasks():
+            total += 1
+            status = task.get("status", "unknown")
+            by_status[status] = by_status.get(status, 0) + 1
+
+            hours = float(task.get("allocated_hours") or 0)
+            done = float(task.get("completed_hours") or 0)
+            allocated += hours
+            completed += done
+
+            agent = by_agent.setdefault(
+                task.get("agent", "unassigned"),
+                {"tasks": 0, "allocated_hours": 0.0, "completed_hours": 0.0},
+            )
+            agent["tasks"] += 1
+            agent["allocated_hours"] += hours
+            agent["completed_hours"] += done
+
+        return {
+            "total_tasks": total,
+            "by_status": by_status,
+            "by_agent": by_agent,
+            "allocated_hours": allocated,
+            "completed_hours": completed,
+            "completion_rate": (completed / allocated * 100) if allocated else 0.0,
+            "generated_at": datetime.now().isoformat(),
+        }
+
+    def _read_meta(self) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self.meta_file, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write_meta(self, meta: Dict[str, Any]):
+        try:
+            tmp = self.meta_file.with_suffix(".tmp")
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(meta, f)
+            os.replace(tmp, self.meta_file)
+        except OSError:
+            pass  # Cache ist optional
@@ -0,0 +1,177 @@
+"""
+BMAD Template Layout
+Vorkompilierte .bmad-core Template-Strukturen
+
+Die eingebauten Template-Strukturen (TEMPLATE_STRUCTURES) werden einmal pro
+Template und Version in eine flache Liste von Verzeichnissen und Seed-Dateien
+übersetzt und gecached. Das Anlegen erfolgt danach in einem Durchgang: ein
+scandir pro vorhandenem Template-Verzeichnis, dann nur fehlende Pfade anlegen.
+
+Öffentliche API für Skripte (get_template_layout, create_template_structure).
+"""
+
+import os
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from .instrumentation import instrumentation
+
+TEMPLATE_VERSION = "2.0.0"
+
+# Gemeinsamer Kern aller Templates (dict = Verzeichnis, sonst Seed-Inhalt)
+_CORE_STRUCTURE: Dict[str, Any] = {
+    "tasks": {"active": {}, "completed": {}, "templates": {}},
+    "agents": {},
+    "workflows": {},
+    "integrations": {},
+    "quality-gates": {},
+    "memory": {"decisions": {}},
+}
+
+# Template-Name -> .bmad-core Struktur
+TEMPLATE_STRUCTURES: Dict[str, Dict[str, Any]] = {
+    "standard": _CORE_STRUCTURE,
+    "infrastructure": {
+        **_CORE_STRUCTURE,
+        "integrations": {"monitoring": {}, "deployment": {}},
+        "runbooks": {},
+    },
+    "web-app": {
+        **_CORE_STRUCTURE,
+        "quality-gates": {"frontend": {}, "backend": {}},
+        "design": {},
+    },
+}
+
+
+@dataclass(frozen=True)
+class TemplateLayout:
+    """Flache, unveränderliche Form einer Template-Struktur"""
+
+    template: str
+    version: str
+    directories: Tuple[str, ...]  # relative POSIX-Pfade, Eltern vor Kindern
+    files: Tuple[Tuple[str, str], ...]  # (relativer Pfad, Seed-Inhalt)
+
+    def missing(self, base: Path) -> List[str]:
+        """Fehlende Pfade (Verzeichnisse mit abschließendem '/')"""
+        existing = _scan_existing(Path(base), self.directories)
+        missing = [d + "/" for d in self.directories if d not in existing]
+        missing.extend(path for path, _ in self.files if path not in existing)
+        return missing
+
+
+def compile_layout(
+    structure: Dict[str, Any], template: str = "custom", version: str = ""
+) -> TemplateLayout:
+    """Übersetze ein verschachteltes Struktur-Dict (dict = Verzeichnis, sonst Datei)"""
+    directories: List[str] = []
+    files: List[Tuple[str, str]] = []
+
+    def visit(node: Dict[str, Any], prefix: str):
+        for name, value in node.items():
+            rel_path = f"{prefix}{name}"
+            if isinstance(value, dict):
+                directories.append(rel_path)
+                visit(value, rel_path + "/")
+            else:
+                files.append((rel_path, "" if value is None else str(value)))
+
+    visit(structure or {}, "")
+    return TemplateLayout(template, str(version), tuple(directories), tuple(files))
+
+
+_cache_lock = threading.Lock()
+_layouts: Dict[Tuple[str, str], TemplateLayout] = {}
+_latest: Dict[str, TemplateLayout] = {}
+
+
+def get_template_layout(template: str, version: Optional[str] = None) -> TemplateLayout:
+    """Kompiliertes .bmad-core Layout eines Templates (memoisiert je Version)"""
+    with _cache_lock:
+        cached = (
+            _latest.get(template)
+            if version is None
+            else _layouts.get((template, str(version)))
+        )
+        if cached is not None:
+            return cached
+
+    if template not in TEMPLATE_STRUCTURES:
+        available = ", ".join(TEMPLATE_STRUCTURES)
+        raise ValueError(f"Unbekanntes Template: {template}. Verfügbar: {available}")
+
+    layout = compile_layout(
+        TEMPLATE_STRUCTURES[template],
+        template=template,
+        version=TEMPLATE_VERSION,
+    )
+
+    with _cache_lock:
+        _layouts[(template, layout.version)] = layout
+        _latest[template] = layout
+    return layout
+
+
+def clear_layout_cache():
+    with _cache_lock:
+        _layouts.clear()
+        _latest.clear()
+
+
+def _scan_existing(base: Path, directories: Tuple[str, ...]) -> Set[str]:
+    """Ein scandir für base und jedes vorhandene Template-Verzeichnis"""
+    existing: Set[str] = set()
+    wanted = set(directories)
+    pending = [("", str(base))]
+
+    while pending:
+        rel_dir, abs_dir = pending.pop()
+        try:
+            entries = os.scandir(abs_dir)
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+        with entries:
+            for entry in entries:
+                rel_path = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+                existing.add(rel_path)
+                if rel_path in wanted and entry.is_dir():
+                    pending.append((rel_path, entry.path))
+    return existing
+
+
+def materialize_layout(base: Path, layout: TemplateLayout) -> Dict[str, int]:
+    """Lege fehlende Verzeichnisse und Seed-Dateien an; vorhandene bleiben unberührt"""
+    base = Path(base)
+    base.mkdir(parents=True, exist_ok=True)
+    existing = _scan_existing(base, layout.directories)
+    stats = {"directories_created": 0, "files_created": 0, "skipped": 0}
+
+    # Eltern stehen vor Kindern -> einfaches mkdir reicht
+    for rel_dir in layout.directories:
+        if rel_dir in existing:
+            stats["skipped"] += 1
+            continue
+        os.mkdir(base / rel_dir)
+        stats["directories_created"] += 1
+
+    for rel_path, seed in layout.files:
+        if rel_path in existing:
+            stats["skipped"] += 1
+            continue
+        with open(base / rel_path, "x", encoding="utf-8") as f:
+            f.write(seed)
+        stats["files_created"] += 1
+
+    instrumentation.count(
+        files_touched=stats["directories_created"] + stats["files_created"],
+        syscalls_avoided=stats["skipped"],
+    )
+    return stats
+
+
+def create_template_structure(base: Path, template: str) -> Dict[str, int]:
+    """Lege die .bmad-core Struktur eines Templates unter base an"""
+    return materialize_layout(base, get_template_layout(template))
@@ -0,0 +1,464 @@
+"""
+BMAD Workflow Compiler
+Kompiliert Workflow-YAML (stages, transitions, quality_gates, ...) in eine
+unveränderliche, indizierte State-Machine
+
+    path = Path("config/bmad-core/workflows/development-workflow.yaml")
+    workflow = load_workflow(path)
+    workflow.stage("testing").agent          # O(1)
+    workflow.stages_for_agent("dev")         # O(1)
+    workflow.next_stage("implementation")    # O(1)
+
+Kompilierte Workflows werden nach SHA-256 des YAML-Inhalts als JSON unter
+~/.bmad-global/cache/workflows/ abgelegt; im Prozess zusätzlich nach Pfad und
+Datei-Signatur. Ein erneutes Laden parst das YAML nur nach einer Änderung.
+"""
+
+import hashlib
+import json
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from .atomic_writer import atomic_writer, render_json
+from .config_resolver import Signature, file_signature
+from .serialization import load_yaml
+
+# Erhöhen, wenn sich das kompilierte Format ändert (alte Cache-Dateien werden ignoriert)
+COMPILER_VERSION = 1
+
+# Workflow-Dateien nennen den Agent "agent" (Core) oder "responsible_agent" (Business)
+AGENT_KEYS = ("agent", "responsible_agent")
+STAGE_LIST_KEYS = ("tasks", "deliverables", "exit_criteria", "required_data")
+
+
+class WorkflowError(ValueError):
+    """Ungültige Workflow-Definition"""
+
+
+def default_cache_dir() -> Path:
+    return Path.home() / ".bmad-global" / "cache" / "workflows"
+
+
+def freeze(value: Any) -> Any:
+    """dict -> MappingProxyType, list -> tuple (rekursiv)"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """Gegenstück zu freeze() für die JSON-Serialisierung"""
+    if isinstance(value, Mapping):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [thaw(item) for item in value]
+    return value
+
+
+@dataclass(frozen=True)
+class CompiledStage:
+    name: str
+    index: int
+    agent: Optional[str]
+    title: str
+    description: str
+    tasks: Tuple[str, ...]
+    deliverables: Tuple[str, ...]
+    exit_criteria: Tuple[str, ...]
+    required_data: Tuple[str, ...]
+    quality_checks: Tuple[str, ...]
+    extra: Mapping[str, Any]
+
+
+@dataclass(frozen=True)
+class Transition:
+    source: str
+    target: str
+    condition: Optional[str] = None
+
+
+class CompiledWorkflow:
+    """Unveränderliche State-Machine eines Workflows mit O(1)-Indizes"""
+
+    __slots__ = (
+        "name",
+        "version",
+        "source_hash",
+        "stages",
+        "transitions",
+        "rollback_triggers",
+        "extra",
+        "_by_name",
+        "_by_agent",
+        "_next",
+        "_previous",
+    )
+
+    name: str
+    version: str
+    source_hash: str
+    stages: Tuple[CompiledStage, ...]
+    transitions: Tuple[Transition, ...]
+    rollback_triggers: Tuple[Mapping[str, Any], ...]
+    extra: Mapping[str, Any]
+    _by_name: Mapping[str, CompiledStage]
+    _by_agent: Mapping[str, Tuple[CompiledStage, ...]]
+    _next: Mapping[str, Optional[str]]
+    _previous: Mapping[str, str]
+
+    def __init__(
+        self,
+        name: str,
+        version: str,
+        source_hash: str,
+        stages: Tuple[CompiledStage, ...],
+        transitions: Tuple[Transition, ...],
+        rollback_triggers: Tuple[Mapping[str, Any], ...],
+        extra: Mapping[str, Any],
+    ):
+        by_name = {stage.name: stage for stage in stages}
+        if len(by_name) != len(stages):
+            raise WorkflowError(f"Workflow '{name}': doppelte Stage-Namen")
+        for transition in transitions:
+            for stage_name in (transition.source, transition.target):
+                if stage_name not in by_name:
+                    raise WorkflowError(
+                        f"Workflow '{name}': Transition auf unbekannte "
+                        f"Stage '{stage_name}'"
+                    )
+
+        # Ohne explizite Transitions gilt die Reihenfolge der Stages
+        following: Dict[str, Optional[str]] = {
+            stage.name: stages[i + 1].name if i + 1 < len(stages) else None
+            for i, stage in enumerate(stages)
+        }
+        explicit: Dict[str, str] = {}
+        for transition in transitions:
+            explicit.setdefault(transition.source, transition.target)
+        following.update(explicit)
+        previous: Dict[str, str] = {}
+        for source, target in following.items():
+            if target is not None:
+                previous.setdefault(target, source)
+
+        by_agent: Dict[str, List[CompiledStage]] = {}
+        for stage in stages:
+            if stage.agent:
+                by_agent.setdefault(stage.agent, []).append(stage)
+
+        setattr_ = object.__setattr__
+        setattr_(self, "name", name)
+        setattr_(self, "version", version)
+        setattr_(self, "source_hash", source_hash)
+        setattr_(self, "stages", stages)
+        setattr_(self, "transitions", transitions)
+        setattr_(self, "rollback_triggers", rollback_triggers)
+        setattr_(self, "extra", extra)
+        setattr_(self, "_by_name", MappingProxyType(by_name))
+        setattr_(
+            self,
+            "_by_agent",
+            MappingProxyType({a: tuple(s) for a, s in by_agent.items()}),
+        )
+        setattr_(self, "_next", MappingProxyType(following))
+        setattr_(self, "_previous", MappingProxyType(previous))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("CompiledWorkflow ist unveränderlich")
+
+    def __repr__(self) -> str:
+        return f"CompiledWorkflow({self.name!r}, stages={len(self.stages)})"
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    @property
+    def first_stage(self) -> Optional[CompiledStage]:
+        return self.stages[0] if self.stages else None
+
+    @property
+    def agents(self) -> Tuple[str, ...]:
+        return tuple(self._by_agent)
+
+    def stage(self, name: str) -> CompiledStage:
+        try:
+            return self._by_name[name]
+        except KeyError:
+            raise KeyError(f"Stage '{name}' nicht in Workflow '{self.name}'") from None
+
+    def has_stage(self, name: str) -> bool:
+        return name in self._by_name
+
+    def stages_for_agent(self, agent: str) -> Tuple[CompiledStage, ...]:
+        return self._by_agent.get(agent, ())
+
+    def next_stage(self, name: str) -> Optional[CompiledStage]:
+        """Folge-Stage (None am Ende des Workflows)"""
+        target = self._next.get(self.stage(name).name)
+        return self._by_name[target] if target else None
+
+    def previous_stage(self, name: str) -> Optional[CompiledStage]:
+        source = self._previous.get(self.stage(name).name)
+        return self._by_name[source] if source else None
+
+    def is_final(self, name: str) -> bool:
+        return self._next.get(self.stage(name).name) is None
+
+    # ------------------------------------------------------------------
+    # Serialisierung (Disk-Cache)
+    # ------------------------------------------------------------------
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "compiler_version": COMPILER_VERSION,
+            "name": self.name,
+            "version": self.version,
+            "source_hash": self.source_hash,
+            "stages": [
+                {
+                    "name": s.name,
+                    "agent": s.agent,
+                    "title": s.title,
+                    "description": s.description,
+                    "tasks": list(s.tasks),
+                    "deliverables": list(s.deliverables),
+                    "exit_criteria": list(s.exit_criteria),
+                    "required_data": list(s.required_data),
+                    "quality_checks": list(s.quality_checks),
+                    "extra": thaw(s.extra),
+                }
+                for s in self.stages
+            ],
+            "transitions": [
+                [t.source, t.target, t.condition] for t in self.transitions
+            ],
+            "rollback_triggers": thaw(self.rollback_triggers),
+            "extra": thaw(self.extra),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CompiledWorkflow":
+        stages = tuple(
+            CompiledStage(
+                name=s["name"],
+                index=i,
+                agent=s["agent"],
+                title=s["title"],
+                description=s["description"],
+                tasks=tuple(s["tasks"]),
+                deliverables=tuple(s["deliverables"]),
+                exit_criteria=tuple(s["exit_criteria"]),
+                required_data=tuple(s["required_data"]),
+                quality_checks=tuple(s["quality_checks"]),
+                extra=freeze(s["extra"]),
+            )
+            for i, s in enumerate(data["stages"])
+        )
+        transitions = tuple(Transition(*t) for t in data["transitions"])
+        return cls(
+            data["name"],
+            data["version"],
+            data["source_hash"],
+            stages,
+            transitions,
+            freeze(data["rollback_triggers"]),
+            freeze(data["extra"]),
+        )
+
+
+# ----------------------------------------------------------------------
+# Kompilierung
+# ----------------------------------------------------------------------
+
+
+def _string_list(value: Any) -> Tuple[str, ...]:
+    if value is None:
+        return ()
+    if isinstance(value, (list, tuple)):
+        return tuple(str(item) for item in value)
+    return (str(value),)
+
+
+def compile_workflow(
+    definition: Dict[str, Any], source_hash: str = ""
+) -> CompiledWorkflow:
+    """Workflow-Dict (wie aus YAML geladen) kompilieren"""
+    if not isinstance(definition, dict):
+        raise WorkflowError("Workflow-Definition muss ein Mapping sein")
+    name = str(definition.get("name") or "workflow")
+
+    quality_checks: Dict[str, List[str]] = {}
+    for gate in definition.get("quality_gates") or ():
+        if isinstance(gate, dict) and gate.get("stage"):
+            quality_checks.setdefault(gate["stage"], []).extend(
+                _string_list(gate.get("checks"))
+            )
+
+    known = {"name"} | set(AGENT_KEYS) | set(STAGE_LIST_KEYS) | {"title", "description"}
+    stages = []
+    for index, raw in enumerate(definition.get("stages") or ()):
+        if not isinstance(raw, dict) or not raw.get("name"):
+            raise WorkflowError(f"Workflow '{name}': Stage {index} ohne Namen")
+        stage_name = str(raw["name"])
+        agent = next((raw[key] for key in AGENT_KEYS if raw.get(key)), None)
+        stages.append(
+            CompiledStage(
+                name=stage_name,
+                index=index,
+                agent=agent,
+                title=str(raw.get("title") or stage_name),
+                description=str(raw.get("description") or ""),
+                tasks=_string_list(raw.get("tasks")),
+                deliverables=_string_list(raw.get("deliverables")),
+                exit_criteria=_string_list(raw.get("exit_criteria")),
+                required_data=_string_list(raw.get("required_data")),
+                quality_checks=tuple(quality_checks.get(stage_name, ())),
+                extra=freeze({k: v for k, v in raw.items() if k not in known}),
+            )
+        )
+
+    transitions = tuple(
+        Transition(str(t["from"]), str(t["to"]), t.get("condition"))
+        for t in definition.get("transitions") or ()
+        if isinstance(t, dict) and t.get("from") and t.get("to")
+    )
+    extra = {
+        k: v
+        for k, v in definition.items()
+        if k
+        not in (
+            "name",
+            "version",
+            "stages",
+            "transitions",
+            "rollback_triggers",
+            "quality_gates",
+        )
+    }
+    return CompiledWorkflow(
+        name,
+        str(definition.get("version") or ""),
+        source_hash,
+        tuple(stages),
+        transitions,
+        freeze(definition.get("rollback_triggers") or []),
+        freeze(extra),
+    )
+
+
+def compile_workflow_bytes(content: bytes) -> CompiledWorkflow:
+    return compile_workflow(load_yaml(content), hashlib.sha256(content).hexdigest())
+
+
+# ----------------------------------------------------------------------
+# Laden mit Cache
+# ----------------------------------------------------------------------
+
+
+class WorkflowCache:
+    """Prozess-Cache (Pfad + Signatur) vor Disk-Cache (Inhalts-Hash) vor YAML-Parse"""
+
+    def __init__(self, cache_dir: Optional[Path] = None, use_disk: bool = True):
+        self.cache_dir = Path(cache_dir) if cache_dir else default_cache_dir()
+        self.use_disk = use_disk
+        self._lock = threading.Lock()
+        self._by_path: Dict[Path, Tuple[Signature, CompiledWorkflow]] = {}
+        self._by_hash: Dict[str, CompiledWorkflow] = {}
+        self.stats = {"memory_hits": 0, "disk_hits": 0, "compiled": 0}
+
+    def load(self, path: Path) -> CompiledWorkflow:
+        path = Path(path)
+        signature = file_signature(path)
+        with self._lock:
+            entry = self._by_path.get(path)
+            if signature is not None and entry is not None and entry[0] == signature:
+                self.stats["memory_hits"] += 1
+                return entry[1]
+
+        with open(path, "rb") as f:
+            content = f.read()
+        workflow = self.load_bytes(content)
+        with self._lock:
+            self._by_path[path] = (signature, workflow)
+        return workflow
+
+    def load_bytes(self, content: bytes) -> CompiledWorkflow:
+        digest = hashlib.sha256(content).hexdigest()
+        with self._lock:
+            workflow = self._by_hash.get(digest)
+            if workflow is not None:
+                self.stats["memory_hits"] += 1
+                return workflow
+
+        workflow = self._read_disk(digest)
+        if workflow is None:
+            workflow = compile_workflow(load_yaml(content), digest)
+            self._write_disk(workflow)
+            with self._lock:
+                self.stats["compiled"] += 1
+        with self._lock:
+            self._by_hash[digest] = workflow
+        return workflow
+
+    def clear(self):
+        with self._lock:
+            self._by_path.clear()
+            self._by_hash.clear()
+
+    def _cache_file(self, digest: str) -> Path:
+        return self.cache_dir / f"{digest}.json"
+
+    def _read_disk(self, digest: str) -> Optional[CompiledWorkflow]:
+        if not self.use_disk:
+            return None
+        try:
+            with open(self._cache_file(digest), "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if (
+                data.get("compiler_version") != COMPILER_VERSION
+                or data.get("source_hash") != digest
+            ):
+                return None
+            workflow = CompiledWorkflow.from_dict(data)
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        with self._lock:
+            self.stats["disk_hits"] += 1
+        return workflow
+
+    def _write_disk(self, workflow: CompiledWorkflow):
+        if not self.use_disk:
+            return
+        try:
+            content = render_json(workflow.to_dict(), ensure_ascii=False)
+            atomic_writer.write_bytes(self._cache_file(workflow.source_hash), content)
+        except (OSError, TypeError, ValueError):
+            # Cache ist optional; Werte ohne JSON-Form (z.B. YAML-Datum) bleiben
+            # nur im Prozess-Cache
+            pass
+
+
+# Globale Instanz
+workflow_cache = WorkflowCache()
+
+
+def load_workflow(path: Path) -> CompiledWorkflow:
+    """Workflow-Datei laden (gecacht)"""
+    return workflow_cache.load(path)
+
+
+def load_workflows(directory: Path) -> Dict[str, CompiledWorkflow]:
+    """Alle *.yaml eines workflows/-Verzeichnisses, Schlüssel = Dateiname ohne Endung"""
+    directory = Path(directory)
+    if not directory.is_dir():
+        return {}
+    return {
+        path.stem: workflow_cache.load(path)
+        for path in sorted(directory.glob("*.yaml"))
+    }
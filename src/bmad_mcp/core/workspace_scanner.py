@@ -0,0 +1,254 @@
+"""
+BMAD Workspace Scanner
+Paralleles Auffinden von BMAD-Projekten unter großen Monorepo-Wurzeln
+
+Ein Verzeichnis gilt als Projekt, wenn es .bmad-core/ oder eine Legacy-Konfiguration
+(bmad-config.json, agent-access-config.yaml, bmad-*-settings.json) enthält.
+Verzeichnisse werden mit os.scandir in einem Thread-Pool gelesen. Ein persistenter
+mtime-Cache (~/.bmad-global/scan-cache.json) sorgt dafür, dass bei erneuten Scans
+nur geänderte Verzeichnisse wieder gelesen werden - unveränderte kosten ein stat().
+"""
+
+import fnmatch
+import hashlib
+import os
+import re
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .atomic_writer import atomic_writer
+from .backup_store import DEFAULT_IGNORE_NAMES
+from .serialization import load_json_file
+
+BMAD_CORE_DIR = ".bmad-core"
+LEGACY_MARKERS = ("bmad-config.json", "agent-access-config.yaml")
+LEGACY_MARKER_PATTERNS = ("bmad-*-settings.json",)
+
+# Diese Verzeichnisse werden nie betreten (zusätzlich zu .bmad-core selbst)
+DEFAULT_PRUNE_NAMES = frozenset(
+    DEFAULT_IGNORE_NAMES
+    | {
+        ".venv",
+        ".tox",
+        ".mypy_cache",
+        ".pytest_cache",
+        ".next",
+        "target",
+        "migration-backups",
+    }
+)
+
+DEFAULT_MAX_DEPTH = 8
+CACHE_FORMAT = 1
+
+
+def is_marker(name: str, is_dir: bool) -> bool:
+    if is_dir:
+        return name == BMAD_CORE_DIR
+    return name in LEGACY_MARKERS or any(
+        fnmatch.fnmatchcase(name, p) for p in LEGACY_MARKER_PATTERNS
+    )
+
+
+def template_for_markers(markers: Iterable[str]) -> str:
+    """Template anhand der Legacy-Dateien wählen (wie bei den bekannten Projekten)"""
+    markers = set(markers)
+    if "agent-access-config.yaml" in markers:
+        return "infrastructure"
+    if "bmad-config.json" in markers:
+        return "web-app"
+    return "standard"
+
+
+@dataclass
+class DiscoveredProject:
+    """Gefundenes Projekt mit seinen Marker-Dateien"""
+
+    path: Path
+    markers: List[str] = field(default_factory=list)
+
+    @property
+    def name(self) -> str:
+        return self.path.name
+
+    @property
+    def backup_name(self) -> str:
+        """Eindeutiger, stabiler Backup-Namensraum: Ordnername plus Hash des Pfads
+
+        Gleichnamige Ordner an verschiedenen Orten teilen sich so keine
+        Snapshots (Hash-Wiederverwendung, prune(keep_last), Snapshot-IDs).
+        """
+        slug = re.sub(r"[^a-z0-9._-]+", "-", self.name.lower()).strip("-") or "project"
+        digest = hashlib.sha1(
+            os.fspath(self.path).encode("utf-8", "surrogateescape")
+        ).hexdigest()[:8]
+        return f"{slug}-{digest}"
+
+    @property
+    def has_bmad_core(self) -> bool:
+        return BMAD_CORE_DIR in self.markers
+
+    @property
+    def template(self) -> str:
+        return template_for_markers(self.markers)
+
+    @property
+    def legacy_files(self) -> List[str]:
+        return [m for m in self.markers if m != BMAD_CORE_DIR]
+
+
+def default_cache_file() -> Path:
+    return Path.home() / ".bmad-global" / "scan-cache.json"
+
+
+class WorkspaceScanner:
+    """Paralleler scandir-Scanner mit Tiefenlimit, Prune-Liste und mtime-Cache"""
+
+    def __init__(
+        self,
+        max_depth: int = DEFAULT_MAX_DEPTH,
+        prune_names: Optional[Iterable[str]] = None,
+        max_workers: int = 8,
+        cache_file: Optional[Path] = None,
+        use_cache: bool = True,
+    ):
+        self.max_depth = max_depth
+        self.prune_names = frozenset(
+            DEFAULT_PRUNE_NAMES if prune_names is None else prune_names
+        )
+        self.max_workers = max(1, max_workers)
+        self.cache_file = Path(cache_file) if cache_file else default_cache_file()
+        self.use_cache = use_cache
+        self.stats = {"directories": 0, "scanned": 0, "cached": 0, "errors": 0}
+
+        self._lock = threading.Lock()
+        self._cache: Dict[str, Dict[str, Any]] = {}
+        self._visited: Dict[str, Dict[str, Any]] = {}
+
+    def scan(self, roots: Iterable[Path]) -> List[DiscoveredProject]:
+        """Alle Projekte unter den Wurzeln finden (sortiert nach Pfad)"""
+        roots = [Path(r).expanduser().resolve() for r in roots]
+        self.stats = {"directories": 0, "scanned": 0, "cached": 0, "errors": 0}
+        self._cache = self._load_cache() if self.use_cache else {}
+        self._visited = {}
+        projects: List[DiscoveredProject] = []
+
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="bmad-scan"
+        ) as executor:
+            pending = {
+                executor.submit(self._visit, str(root)): 0
+                for root in roots
+                if root.is_dir()
+            }
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    depth = pending.pop(future)
+                    dir_path, entry = future.result()
+                    if entry is None:
+                        continue
+                    if entry["markers"]:
+                        projects.append(
+                            DiscoveredProject(Path(dir_path), sorted(entry["markers"]))
+                        )
+                    if depth >= self.max_depth:
+                        continue
+                    for name in entry["subdirs"]:
+                        if name in self.prune_names or name == BMAD_CORE_DIR:
+                            continue
+                        pending[
+                            executor.submit(self._visit, os.path.join(dir_path, name))
+                        ] = (depth + 1)
+
+        if self.use_cache:
+            self._save_cache(roots)
+        projects.sort(key=lambda p: str(p.path))
+        return projects
+
+    def _visit(self, dir_path: str) -> Tuple[str, Optional[Dict[str, Any]]]:
+        """Ein Verzeichnis lesen - oder aus dem Cache, wenn die mtime unverändert ist"""
+        try:
+            mtime_ns = os.stat(dir_path).st_mtime_ns
+        except OSError:
+            with self._lock:
+                self.stats["errors"] += 1
+            return dir_path, None
+
+        cached = self._cache.get(dir_path)
+        if cached is not None and cached.get("mtime_ns") == mtime_ns:
+            with self._lock:
+                self.stats["directories"] += 1
+                self.stats["cached"] += 1
+                self._visited[dir_path] = cached
+            return dir_path, cached
+
+        markers, subdirs = [], []
+        try:
+            with os.scandir(dir_path) as entries:
+                for item in entries:
+                    try:
+                        is_dir = item.is_dir(follow_symlinks=False)
+                    except OSError:
+                        continue
+                    if is_marker(item.name, is_dir):
+                        markers.append(item.name)
+                    if is_dir:
+                        subdirs.append(item.name)
+        except OSError:
+            with self._lock:
+                self.stats["errors"] += 1
+            return dir_path, None
+
+        entry = {"mtime_ns": mtime_ns, "markers": markers, "subdirs": subdirs}
+        with self._lock:
+            self.stats["directories"] += 1
+            self.stats["scanned"] += 1
+            self._visited[dir_path] = entry
+        return dir_path, entry
+
+    # ------------------------------------------------------------------
+    # Cache
+    # ------------------------------------------------------------------
+
+    def _load_cache(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            data = load_json_file(self.cache_file)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("format") != CACHE_FORMAT:
+            return {}
+        return data.get("directories", {})
+
+    def _save_cache(self, roots: List[Path]):
+        """Einträge unter den gescannten Wurzeln ersetzen, andere Wurzeln behalten"""
+        prefixes = [str(root) for root in roots]
+
+        def under_scanned_root(path: str) -> bool:
+            return any(
+                path == p or path.startswith(p.rstrip(os.sep) + os.sep)
+                for p in prefixes
+            )
+
+        directories = {
+            path: entry
+            for path, entry in self._cache.items()
+            if not under_scanned_root(path)
+        }
+        directories.update(self._visited)
+        try:
+            atomic_writer.write_json(
+                self.cache_file,
+                {"format": CACHE_FORMAT, "directories": directories},
+                indent=None,
+            )
+        except OSError:
+            pass  # Cache ist optional
+
+
+def discover_projects(roots: Iterable[Path], **options: Any) -> List[DiscoveredProject]:
+    """Kurzform: WorkspaceScanner(**options).scan(roots)"""
+    return WorkspaceScanner(**options).scan(roots)
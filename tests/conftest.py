@@ -0,0 +1,22 @@
+"""
+Gemeinsame Test-Fixtures für bmad_mcp
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# src-Pfad wie in scripts/ einbinden
+REPO_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(REPO_ROOT / "src"))
+
+
+@pytest.fixture
+def bmad_home(tmp_path, monkeypatch):
+    """Isoliertes Home-Verzeichnis, damit ~/.bmad-global nicht angefasst wird"""
+    home = tmp_path / "home"
+    home.mkdir()
+    monkeypatch.setenv("HOME", str(home))
+    monkeypatch.setenv("USERPROFILE", str(home))
+    return home
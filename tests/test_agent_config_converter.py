@@ -0,0 +1,99 @@
+"""
+Tests für den Agent-Config-Konverter
+"""
+
+import json
+from pathlib import Path
+
+from bmad_mcp.core.agent_config_converter import (
+    DEFAULT_MODEL_PREFERENCES,
+    AgentConfigConverter,
+    convert_agent_configs,
+)
+from bmad_mcp.core.serialization import load_yaml_file
+
+GLOBAL_CONFIG = Path(__file__).parent.parent / "config" / "bmad-global-config.yaml"
+
+
+def _project(root, name, settings):
+    project = root / name
+    project.mkdir()
+    (project / "bmad-dev-settings.json").write_text(
+        json.dumps(settings), encoding="utf-8"
+    )
+    return project
+
+
+def test_failing_file_is_isolated_and_recorded(tmp_path, bmad_home):
+    project = tmp_path / "project"
+    project.mkdir()
+    (project / "bmad-dev-settings.json").write_text(
+        json.dumps({"editor": "vim"}), encoding="utf-8"
+    )
+    # Tief verschachteltes JSON: RecursionError, kein ValueError
+    (project / "bmad-pm-settings.json").write_text(
+        "[" * 100_000 + "]" * 100_000, encoding="utf-8"
+    )
+    (project / "bmad-analyst-settings.json").write_text("{kaputt", encoding="utf-8")
+
+    converter = AgentConfigConverter(tmp_path / "missing-config.yaml")
+    conversions = {c.agent: c for c in converter.convert_project(project)}
+
+    assert conversions["dev"].content and conversions["dev"].error is None
+    assert conversions["pm"].content is None and conversions["pm"].error.startswith(
+        "RecursionError"
+    )
+    assert conversions["analyst"].content is None and conversions[
+        "analyst"
+    ].error.startswith("JSONDecodeError")
+    assert converter.stats["errors"] == 2
+    assert sorted(f["file"] for f in converter.failed) == sorted(
+        str(project / name)
+        for name in ("bmad-pm-settings.json", "bmad-analyst-settings.json")
+    )
+
+    result = convert_agent_configs(
+        [project], global_config_file=tmp_path / "missing-config.yaml"
+    )
+    assert result["written"] == 1 and result["errors"] == 2
+    assert len(result["failed"]) == 2
+    assert (project / ".bmad-core" / "agents" / "dev.yaml").exists()
+
+
+def test_unchanged_files_are_served_from_memo(tmp_path, bmad_home):
+    first = _project(tmp_path, "first", {"editor": "vim"})
+    second = _project(tmp_path, "second", {"editor": "vim"})
+    converter = AgentConfigConverter(GLOBAL_CONFIG)
+
+    [original] = converter.convert_project(first)
+    assert converter.stats == {"files": 1, "converted": 1, "memo_hits": 0, "errors": 0}
+
+    # Gleicher Inhalt in einem anderen Projekt und erneuter Lauf: nur Memo-Treffer
+    [copy] = converter.convert_project(second)
+    [again] = converter.convert_project(first)
+    assert converter.stats["memo_hits"] == 2
+    assert converter.stats["converted"] == 1
+    assert copy.content == again.content == original.content
+
+    (first / "bmad-dev-settings.json").write_text('{"editor": "emacs"}')
+    converter.convert_project(first)
+    assert converter.stats["converted"] == 2
+    assert converter.stats["memo_hits"] == 2
+
+
+def test_defaults_come_from_global_config(tmp_path, bmad_home):
+    project = _project(tmp_path, "project", {"editor": "vim"})
+    converter = AgentConfigConverter(GLOBAL_CONFIG)
+
+    assert converter.model_preferences("dev") == {
+        "primary": "anthropic/claude-3.5-sonnet",
+        "fallback": DEFAULT_MODEL_PREFERENCES["fallback"],
+        "temperature": 0.1,
+    }
+    assert converter.model_preferences("analyst")["temperature"] == 0.2
+    assert converter.model_preferences("unknown") == DEFAULT_MODEL_PREFERENCES
+
+    converter.write(converter.convert_project(project))
+    written = load_yaml_file(project / ".bmad-core" / "agents" / "dev.yaml")
+    assert written["model_preferences"]["primary"] == "anthropic/claude-3.5-sonnet"
+    assert written["legacy_config"] == {"editor": "vim"}
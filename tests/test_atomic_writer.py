@@ -0,0 +1,53 @@
+"""
+Tests für den idempotenten Atomic Writer
+"""
+
+import os
+
+import pytest
+
+from bmad_mcp.core.atomic_writer import AtomicWriter
+
+
+def test_unchanged_content_keeps_file_untouched(tmp_path):
+    writer = AtomicWriter()
+    target = tmp_path / "nested" / "config.yaml"
+    assert writer.write_yaml(target, {"name": "demo", "agents": ["pm", "dev"]})
+    os.utime(target, ns=(1, 1))
+
+    assert not writer.write_yaml(target, {"name": "demo", "agents": ["pm", "dev"]})
+    assert target.stat().st_mtime_ns == 1
+    assert writer.report()["files_written"] == 1
+    assert writer.report()["files_unchanged"] == 1
+
+    # Gleiche Größe, anderer Inhalt -> Hashvergleich erkennt die Änderung
+    assert writer.write_text(target, "a" * target.stat().st_size)
+    assert writer.report()["files_written"] == 2
+
+
+def test_replace_keeps_mode_and_leaves_no_temp_files(tmp_path):
+    writer = AtomicWriter()
+    target = tmp_path / "project.json"
+    target.write_text("{}")
+    os.chmod(target, 0o640)
+
+    assert writer.write_json(target, {"project": "demo"})
+    assert (target.stat().st_mode & 0o777) == 0o640
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["project.json"]
+    writer.reset()
+    assert writer.report()["files_written"] == 0
+
+
+def test_failed_write_removes_temp_file(tmp_path, monkeypatch):
+    writer = AtomicWriter()
+    target = tmp_path / "config.yaml"
+    target.write_text("alt")
+
+    def fail_replace(src, dst):
+        raise OSError("replace fehlgeschlagen")
+
+    monkeypatch.setattr(os, "replace", fail_replace)
+    with pytest.raises(OSError):
+        writer.write_text(target, "neu")
+    assert target.read_text() == "alt"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["config.yaml"]
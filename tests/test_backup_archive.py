@@ -0,0 +1,170 @@
+"""
+Tests für das seekbare Backup-Archiv
+"""
+
+import os
+import tarfile
+
+import pytest
+
+from bmad_mcp.core import backup_archive
+from bmad_mcp.core.backup_archive import BackupArchive, create_archive
+from bmad_mcp.core.fs_walker import EVENT_FILE, SKIP_UNREADABLE, walk_files
+
+
+def _project(root):
+    files = {
+        "main.py": b"print('hi')\n" * 100,
+        "docs/readme.md": b"# Doku\n",
+        "data/blob.bin": os.urandom(5000),
+    }
+    for rel_path, data in files.items():
+        (root / rel_path).parent.mkdir(parents=True, exist_ok=True)
+        (root / rel_path).write_bytes(data)
+    return files
+
+
+def test_archive_round_trip_and_single_file_restore(tmp_path, monkeypatch):
+    monkeypatch.setattr(backup_archive, "_CHUNK_SIZE", 512)
+    project = tmp_path / "project"
+    files = _project(project)
+    archive_path = tmp_path / "backup.tar.gz"
+    meta = create_archive(walk_files(project), archive_path, project, "demo")
+    assert meta["stats"]["files"] == 3
+    assert meta["stats"]["bytes"] == sum(len(data) for data in files.values())
+    assert not archive_path.with_name(archive_path.name + ".tmp").exists()
+
+    archive = BackupArchive(archive_path)
+    assert archive.index["project"] == "demo"
+    assert archive.read_file("data/blob.bin") == files["data/blob.bin"]
+    dest = archive.extract_file("docs/readme.md", tmp_path / "single")
+    assert dest.read_bytes() == b"# Doku\n"
+
+    result = archive.extract_all(tmp_path / "restore")
+    assert result["files"] == 3
+    for rel_path, data in files.items():
+        assert (tmp_path / "restore" / rel_path).read_bytes() == data
+
+    # Ein gewöhnlicher tar-Reader sieht dieselben Dateien
+    with tarfile.open(archive_path, "r:gz") as tar:
+        assert sorted(tar.getnames()) == sorted(
+            list(files) + [backup_archive.INDEX_NAME]
+        )
+
+
+def test_plain_tar_is_rejected(tmp_path):
+    project = tmp_path / "project"
+    _project(project)
+    plain = tmp_path / "plain.tar.gz"
+    with tarfile.open(plain, "w:gz") as tar:
+        tar.add(project / "main.py", arcname="main.py")
+    with pytest.raises(ValueError):
+        BackupArchive(plain).index
+
+
+def test_file_deleted_after_walk_is_skipped(tmp_path):
+    project = tmp_path / "project"
+    project.mkdir()
+    for name in ("a.txt", "gone.txt", "z.txt"):
+        (project / name).write_text(name * 50)
+
+    def delete_before_open(event):
+        # Die Datei verschwindet zwischen Walk und Öffnen
+        if event.kind == EVENT_FILE and event.rel_path == "gone.txt":
+            event.path.unlink()
+
+    archive_path = tmp_path / "backup.tar.gz"
+    meta = create_archive(
+        walk_files(project), archive_path, project, "demo", progress=delete_before_open
+    )
+
+    assert meta["skipped"] == {SKIP_UNREADABLE: 1}
+    assert meta["complete"] is True
+    archive = BackupArchive(archive_path)
+    assert sorted(archive.list_files()) == ["a.txt", "z.txt"]
+    assert archive.read_file("z.txt") == b"z.txt" * 50
+
+
+def test_small_files_share_compressed_blocks(tmp_path):
+    project = tmp_path / "project"
+    files = {}
+    for n in range(60):
+        data = f"name: agent-{n}\nversion: 2.0.0\nenabled: true\n".encode() * 3
+        files[f"agents/agent{n}.yaml"] = data
+    files["large.bin"] = os.urandom(3000)
+    for rel_path, data in files.items():
+        (project / rel_path).parent.mkdir(parents=True, exist_ok=True)
+        (project / rel_path).write_bytes(data)
+
+    solid = tmp_path / "solid.tar.gz"
+    per_file = tmp_path / "per-file.tar.gz"
+    create_archive(walk_files(project), solid, project, "demo", block_size=2048)
+    create_archive(walk_files(project), per_file, project, "demo", block_size=0)
+    assert solid.stat().st_size < per_file.stat().st_size
+
+    archive = BackupArchive(solid)
+    entries = archive.index["files"]
+    assert len({entry["offset"] for entry in entries.values()}) < len(entries)
+    # Dateien ab block_size liegen allein in ihrem Block
+    assert entries["large.bin"]["skip"] == 0
+    assert (
+        sum(
+            entry["offset"] == entries["large.bin"]["offset"]
+            for entry in entries.values()
+        )
+        == 1
+    )
+    for rel_path, data in files.items():
+        assert archive.read_file(rel_path) == data
+    archive.extract_all(tmp_path / "restore")
+    for rel_path, data in files.items():
+        assert (tmp_path / "restore" / rel_path).read_bytes() == data
+    with tarfile.open(solid, "r:gz") as tar:
+        assert len(tar.getnames()) == len(files) + 1
+
+
+def test_zstd_archive_round_trip(tmp_path):
+    zstandard = pytest.importorskip("zstandard")
+    assert backup_archive.default_compression() == backup_archive.COMPRESSION_ZSTD
+
+    project = tmp_path / "project"
+    files = _project(project)
+    for n in range(20):
+        files[f"agents/agent{n}.yaml"] = f"name: agent-{n}\n".encode() * 5
+        (project / "agents").mkdir(exist_ok=True)
+        (project / f"agents/agent{n}.yaml").write_bytes(files[f"agents/agent{n}.yaml"])
+
+    archive_path = tmp_path / "backup.tar.zst"
+    meta = create_archive(walk_files(project), archive_path, project, "demo")
+    assert meta["stats"]["files"] == len(files)
+
+    archive = BackupArchive(archive_path)
+    assert archive.index["compression"] == backup_archive.COMPRESSION_ZSTD
+    for rel_path, data in files.items():
+        assert archive.read_file(rel_path) == data
+    archive.extract_all(tmp_path / "restore")
+    for rel_path, data in files.items():
+        assert (tmp_path / "restore" / rel_path).read_bytes() == data
+
+    # Gewöhnliches tar über einen zstd-Stream sieht dieselben Dateien
+    with open(archive_path, "rb") as raw:
+        reader = zstandard.ZstdDecompressor().stream_reader(
+            raw, read_across_frames=True
+        )
+        with tarfile.open(fileobj=reader, mode="r|") as tar:
+            names = [member.name for member in tar]
+    assert sorted(names) == sorted(list(files) + [backup_archive.INDEX_NAME])
+
+
+def test_index_pointing_past_member_raises(tmp_path):
+    project = tmp_path / "project"
+    project.mkdir()
+    (project / "a.txt").write_bytes(b"a" * 10)
+    archive_path = tmp_path / "backup.tar.gz"
+    create_archive(walk_files(project), archive_path, project, "demo")
+
+    archive = BackupArchive(archive_path)
+    # Hinter dem einzigen Eintrag des Blocks liegt kein weiterer Tar-Header
+    archive.index["files"]["a.txt"]["skip"] = 2 * tarfile.BLOCKSIZE
+    with pytest.raises(ValueError):
+        archive.read_file("a.txt")
@@ -0,0 +1,164 @@
+"""
+Tests für den deduplizierten Backup-Store
+"""
+
+import builtins
+import hashlib
+import os
+
+from bmad_mcp.core import backup_store
+from bmad_mcp.core.backup_store import BackupStore
+
+
+def test_latest_snapshot_skips_incomplete(tmp_path):
+    project = tmp_path / "project"
+    project.mkdir()
+    for name in ("a.txt", "b.txt", "c.txt"):
+        (project / name).write_text(name * 100)
+
+    store = BackupStore(tmp_path / "store")
+    complete = store.create_snapshot(project, "demo")
+    budgeted = BackupStore(tmp_path / "store", max_total_bytes=200)
+    partial = budgeted.create_snapshot(project, "demo")
+
+    assert budgeted.load_manifest(str(partial))["complete"] is False
+    assert store.latest_snapshot("demo")["id"] == complete.stem
+    # Der nächste Snapshot baut auf dem vollständigen auf, nicht auf dem Teilstand
+    assert (
+        store.load_manifest(str(store.create_snapshot(project, "demo")))["parent"]
+        == complete.stem
+    )
+
+
+def test_changed_files_are_read_once(tmp_path, monkeypatch):
+    monkeypatch.setattr(backup_store, "_CHUNK_SIZE", 64)
+    project = tmp_path / "project"
+    project.mkdir()
+    (project / "small.txt").write_bytes(b"klein")
+    (project / "large.bin").write_bytes(bytes(range(256)) * 10)
+    (project / "copy.bin").write_bytes(bytes(range(256)) * 10)
+
+    opened = []
+    real_open = builtins.open
+
+    def counting_open(file, mode="r", *args, **kwargs):
+        if str(file).startswith(str(project)):
+            opened.append(str(file))
+        return real_open(file, mode, *args, **kwargs)
+
+    monkeypatch.setattr(backup_store, "open", counting_open, raising=False)
+    store = BackupStore(tmp_path / "store")
+    manifest = store.load_manifest(str(store.create_snapshot(project, "demo")))
+
+    assert sorted(opened) == sorted(
+        str(project / name) for name in ("small.txt", "large.bin", "copy.bin")
+    )
+    assert (
+        manifest["files"]["large.bin"]["hash"]
+        == hashlib.sha256(bytes(range(256)) * 10).hexdigest()
+    )
+    assert (
+        manifest["files"]["small.txt"]["hash"] == hashlib.sha256(b"klein").hexdigest()
+    )
+    assert manifest["stats"]["new_blobs"] == 2
+    # Verworfene Kopie des Duplikats bleibt nicht liegen
+    assert not list(store.objects_dir.glob(".tmp-*"))
+
+    restored = tmp_path / "restored"
+    store.restore(manifest["id"], restored)
+    assert (restored / "copy.bin").read_bytes() == (project / "large.bin").read_bytes()
+
+
+def test_prune_keeps_complete_snapshots_and_in_flight_files(tmp_path):
+    project = tmp_path / "project"
+    project.mkdir()
+    (project / "a.txt").write_text("a" * 100)
+    (project / "b.txt").write_text("b" * 100)
+
+    store = BackupStore(tmp_path / "store")
+    complete = store.create_snapshot(project, "demo")
+    budgeted = BackupStore(tmp_path / "store", max_total_bytes=150)
+    partials = [budgeted.create_snapshot(project, "demo") for _ in range(2)]
+    assert [store.load_manifest(str(p))["complete"] for p in partials] == [False, False]
+
+    # Temporäre Datei eines laufenden Schreibvorgangs und ein noch unreferenzierter Blob
+    tmp_file = store.objects_dir / "ab" / ".tmp-inflight"
+    tmp_file.parent.mkdir(exist_ok=True)
+    tmp_file.write_bytes(b"x")
+    fresh_blob = store.objects_dir / "cd" / ("0" * 62)
+    fresh_blob.parent.mkdir(exist_ok=True)
+    fresh_blob.write_bytes(b"y")
+
+    result = store.prune(keep_last=1)
+    assert result["removed_snapshots"] == 0
+    assert store.latest_snapshot("demo")["id"] == complete.stem
+    assert tmp_file.exists() and fresh_blob.exists()
+
+    # Nach der Schonfrist: nur der unreferenzierte Blob verschwindet
+    result = store.prune(keep_last=1, grace_seconds=-1)
+    assert result["removed_blobs"] == 1
+    assert not fresh_blob.exists() and tmp_file.exists()
+    assert store.restore(complete.stem, tmp_path / "restored")["files"] == 2
+
+
+def test_prune_drops_partial_snapshots_older_than_kept(tmp_path):
+    project = tmp_path / "project"
+    project.mkdir()
+    (project / "a.txt").write_text("a" * 100)
+    (project / "b.txt").write_text("b" * 100)
+
+    store = BackupStore(tmp_path / "store")
+    budgeted = BackupStore(tmp_path / "store", max_total_bytes=150)
+    old_partial = budgeted.create_snapshot(project, "demo")
+    first = store.create_snapshot(project, "demo")
+    second = store.create_snapshot(project, "demo")
+    new_partial = budgeted.create_snapshot(project, "demo")
+
+    assert store.prune(keep_last=1)["removed_snapshots"] == 2
+    assert [s["id"] for s in store.list_snapshots("demo")] == [
+        second.stem,
+        new_partial.stem,
+    ]
+    assert not old_partial.exists() and not first.exists()
+
+
+def test_latest_snapshot_reads_only_the_ref(tmp_path, monkeypatch):
+    project = tmp_path / "project"
+    project.mkdir()
+    (project / "a.txt").write_text("a")
+
+    store = BackupStore(tmp_path / "store")
+    store.create_snapshot(project, "other")
+    first = store.create_snapshot(project, "demo")
+    second = store.create_snapshot(project, "demo")
+    assert (tmp_path / "store" / "refs" / "demo").read_text() == second.stem
+
+    def no_scan(self):
+        raise AssertionError("Manifest-Scan trotz refs/")
+
+    monkeypatch.setattr(BackupStore, "_iter_manifests", no_scan)
+    assert store.latest_snapshot("demo")["id"] == second.stem
+
+    # Veralteter Verweis (z. B. nach prune) -> einmal scannen, Verweis reparieren
+    monkeypatch.undo()
+    second.unlink()
+    assert store.latest_snapshot("demo")["id"] == first.stem
+    assert (tmp_path / "store" / "refs" / "demo").read_text() == first.stem
+    (tmp_path / "store" / "refs" / "demo").unlink()
+    assert store.latest_snapshot("demo")["id"] == first.stem
+
+
+def test_reused_hash_refreshes_blob_mtime(tmp_path):
+    project = tmp_path / "project"
+    project.mkdir()
+    (project / "a.txt").write_text("unverändert")
+
+    store = BackupStore(tmp_path / "store")
+    first = store.load_manifest(str(store.create_snapshot(project, "demo")))
+    blob = store._blob_path(first["files"]["a.txt"]["hash"])
+    os.utime(blob, (1, 1))
+
+    # Hash kommt aus dem Vorgänger, der Blob wird trotzdem als frisch markiert -
+    # ein paralleles prune mit Schonfrist darf ihn nicht löschen
+    store.create_snapshot(project, "demo")
+    assert blob.stat().st_mtime > 1
@@ -0,0 +1,79 @@
+"""
+Tests für die geschichtete Konfigurationsauflösung
+"""
+
+import os
+
+from bmad_mcp.core.config_resolver import ConfigResolver, deep_merge
+
+
+def _write(path, text):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+
+
+def _touch_later(path):
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+def test_deep_merge_does_not_mutate_inputs():
+    base = {"a": {"x": 1, "list": [1]}, "b": 1}
+    override = {"a": {"y": 2, "list": [2]}, "c": 3}
+    assert deep_merge(base, override) == {
+        "a": {"x": 1, "list": [2], "y": 2},
+        "b": 1,
+        "c": 3,
+    }
+    assert base == {"a": {"x": 1, "list": [1]}, "b": 1}
+
+
+def test_layers_merge_in_priority_order(tmp_path):
+    config_dir = tmp_path / "config"
+    project = tmp_path / "project"
+    _write(
+        config_dir / "bmad-global-config.yaml",
+        "level: global\nnotion: {enabled: true, db: g}\n"
+        "bmad_agents:\n  dev: {model: a, temperature: 0.1}\n",
+    )
+    _write(
+        config_dir / "bmad-core" / "core-config.yaml", "level: core\ncore_only: true\n"
+    )
+    _write(
+        project / ".bmad-core" / "project.yaml",
+        "level: project\nnotion: {db: p}\nagents:\n  dev: {model: b}\n",
+    )
+    _write(project / ".bmad-core" / "agents" / "dev.yaml", "temperature: 0.5\n")
+
+    resolver = ConfigResolver(config_dir)
+    resolved = resolver.resolve(project)
+    assert resolved["level"] == "project"
+    assert resolved["core_only"] is True
+    assert resolved["notion"] == {"enabled": True, "db": "p"}
+    assert resolver.resolve_agent("dev", project) == {"model": "b", "temperature": 0.5}
+    assert resolver.resolve_agent("qa", project) == {}
+    assert resolver.resolve()["level"] == "core"
+
+
+def test_only_changed_layer_is_reparsed(tmp_path):
+    config_dir = tmp_path / "config"
+    project = tmp_path / "project"
+    global_file = config_dir / "bmad-global-config.yaml"
+    project_file = project / ".bmad-core" / "project.yaml"
+    _write(global_file, "a: 1\n")
+    _write(project_file, "b: 1\n")
+
+    resolver = ConfigResolver(config_dir)
+    assert resolver.resolve(project) == {"a": 1, "b": 1}
+    parses = resolver.cache.stats["parses"]
+    resolver.resolve(project)["a"] = "verändert"
+    assert resolver.resolve(project) == {"a": 1, "b": 1}
+    assert resolver.cache.stats["parses"] == parses
+
+    _write(project_file, "b: 2\n")
+    _touch_later(project_file)
+    assert resolver.resolve(project) == {"a": 1, "b": 2}
+    assert resolver.cache.stats["parses"] == parses + 1
+
+    project_file.unlink()
+    assert resolver.resolve(project) == {"a": 1}
@@ -0,0 +1,118 @@
+"""
+Tests für den Ereignis-Simulator
+"""
+
+from datetime import date
+
+from bmad_mcp.core import event_simulator
+from bmad_mcp.core.event_simulator import (
+    SimulationConfig,
+    compile_plan,
+    monte_carlo,
+    simulate,
+    simulate_crisis,
+)
+
+TASKS = [{"task_id": "api", "allocated_hours": 80, "agent": "dev"}]
+
+PROJECT = [
+    {"task_id": "design", "allocated_hours": 12, "agent": "architect"},
+    {"task_id": "api", "allocated_hours": 30, "agent": "dev", "depends_on": ["design"]},
+    {"task_id": "ui", "allocated_hours": 20, "agent": "dev", "depends_on": ["design"]},
+    {
+        "task_id": "qa",
+        "allocated_hours": 10,
+        "agent": "qa",
+        "depends_on": ["api", "ui"],
+    },
+]
+CRISIS = SimulationConfig(
+    block_probability=0.3, rework_probability=0.3, outage_probability=0.5
+)
+
+
+def test_overtime_shortens_crisis_in_days(monkeypatch):
+    # Nur Überstunden: gleiche Arbeitsstunden, aber 10 statt 8 pro Tag
+    monkeypatch.setitem(
+        event_simulator.CRISIS_SCENARIOS, "overtime", {"hours_per_day": 10.0}
+    )
+    result = simulate_crisis(
+        TASKS,
+        "overtime",
+        runs=5,
+        base=SimulationConfig(estimate_sigma=0.0),
+        start=date(2025, 3, 3),
+        workers=1,
+    )
+
+    assert (
+        result["baseline"]["hours"]["p50"] == result["crisis"]["hours"]["p50"] == 80.0
+    )
+    assert result["baseline"]["days"]["p50"] == 10.0
+    assert result["crisis"]["days"]["p50"] == 8.0
+    assert result["delay_days"]["p50"] == -2.0
+    # Mo 2025-03-03 + 10 Arbeitstage = Fr 03-14, + 8 Arbeitstage = Mi 03-12
+    assert result["baseline"]["completion"]["p50"] == "2025-03-14"
+    assert result["crisis"]["completion"]["p50"] == "2025-03-12"
+    assert result["delay_calendar_days"]["p50"] == -2
+    assert "delay_hours" not in result
+
+
+def test_same_seed_gives_identical_results():
+    plan = compile_plan(PROJECT)
+    first = simulate(plan, CRISIS, seed=7)
+    assert simulate(plan, CRISIS, seed=7) == first
+    assert simulate(plan, CRISIS, seed=8) != first
+
+    kwargs = dict(runs=50, config=CRISIS, seed=3, start=date(2025, 3, 3), workers=1)
+    assert monte_carlo(PROJECT, **kwargs) == monte_carlo(PROJECT, **kwargs)
+
+
+def test_monte_carlo_does_not_depend_on_worker_count():
+    kwargs = dict(
+        runs=event_simulator.MIN_PARALLEL_RUNS,
+        config=CRISIS,
+        seed=11,
+        start=date(2025, 3, 3),
+        deadline=date(2025, 4, 1),
+    )
+    assert monte_carlo(PROJECT, workers=1, **kwargs) == monte_carlo(
+        PROJECT, workers=2, **kwargs
+    )
+
+
+def test_outage_pauses_and_resumes_running_task():
+    config = SimulationConfig(
+        estimate_sigma=0.0, outage_probability=1.0, outage_hours=(5.0, 5.0)
+    )
+    plan = compile_plan([{"task_id": "api", "allocated_hours": 10, "agent": "dev"}])
+    result = simulate(plan, config, seed=1)
+
+    assert result.outages == 1
+    # 10 Stunden Arbeit plus 5 Stunden Pause, Arbeitszeit unverändert
+    assert result.hours == 15.0
+    assert result.worked == {"api": 10.0}
+    assert result.unfinished == []
+
+
+def test_blocked_task_waits_and_frees_its_agent():
+    config = SimulationConfig(
+        estimate_sigma=0.0, block_probability=1.0, block_hours=(4.0, 4.0)
+    )
+    plan = compile_plan(
+        [
+            {"task_id": "a", "allocated_hours": 4, "agent": "dev"},
+            {"task_id": "b", "allocated_hours": 2, "agent": "dev", "depends_on": ["a"]},
+        ]
+    )
+    result = simulate(plan, config, seed=1)
+
+    # Jeder Task wird einmal blockiert: a 0-4 blockiert, 4-8 Arbeit;
+    # b 8-12 blockiert, 12-14 Arbeit
+    assert result.blocked == 2
+    assert result.finished == {"a": 8.0, "b": 14.0}
+    assert result.worked == {"a": 4.0, "b": 2.0}
+
+    stopped = simulate(plan, config, seed=1, until=3.0)
+    assert stopped.unfinished == ["a", "b"]
+    assert stopped.worked == {}
@@ -0,0 +1,148 @@
+"""
+Tests für den streamenden Verzeichnis-Walker
+"""
+
+import os
+
+import pytest
+
+from bmad_mcp.core.backup_store import BackupStore
+from bmad_mcp.core.fs_walker import (
+    EVENT_FILE,
+    EVENT_SKIP,
+    SKIP_IGNORE_RULE,
+    SKIP_SYMLINK,
+    SKIP_SYMLINK_LOOP,
+    SKIP_UNREADABLE,
+    walk_files,
+)
+
+
+@pytest.fixture
+def project(tmp_path):
+    root = tmp_path / "project"
+    (root / "docs").mkdir(parents=True)
+    (root / "docs" / "readme.md").write_text("hallo")
+    (root / "main.py").write_text("print(1)")
+    try:
+        os.symlink(root / "docs", root / "docs-link", target_is_directory=True)
+        os.symlink(root, root / "docs" / "loop", target_is_directory=True)
+        os.symlink(root / "missing.txt", root / "broken")
+        os.symlink(root / "main.py", root / "main-link.py")
+    except (OSError, NotImplementedError):
+        pytest.skip("Symlinks nicht verfügbar")
+    return root
+
+
+def collect(root, **options):
+    files, skipped = {}, {}
+    for event in walk_files(root, **options):
+        if event.kind == EVENT_FILE:
+            files[event.rel_path] = event.size
+        elif event.kind == EVENT_SKIP:
+            skipped[event.rel_path] = event.reason
+    return files, skipped
+
+
+def test_symlinked_directory_is_walked_not_yielded_as_file(project):
+    files, skipped = collect(project)
+    assert sorted(files) == [
+        "docs-link/readme.md",
+        "docs/readme.md",
+        "main-link.py",
+        "main.py",
+    ]
+    assert skipped["docs/loop"] == SKIP_SYMLINK_LOOP
+    assert skipped["docs-link/loop"] == SKIP_SYMLINK_LOOP
+    assert skipped["broken"] == SKIP_UNREADABLE
+
+
+def test_link_to_inner_ancestor_is_a_loop(tmp_path):
+    root = tmp_path / "project"
+    (root / "a" / "b").mkdir(parents=True)
+    (root / "a" / "b" / "h").write_text("h")
+    try:
+        os.symlink(
+            os.path.join("..", "..", "a"),
+            root / "a" / "b" / "loop",
+            target_is_directory=True,
+        )
+    except (OSError, NotImplementedError):
+        pytest.skip("Symlinks nicht verfügbar")
+    files, skipped = collect(root)
+    assert sorted(files) == ["a/b/h"]
+    assert skipped["a/b/loop"] == SKIP_SYMLINK_LOOP
+
+
+def test_anchored_directory_pattern_matches_only_at_base(tmp_path):
+    root = tmp_path / "project"
+    for rel in ("build/out.js", "sub/build/keep.js", "sub/dist/x.js", "dist/y.js"):
+        (root / rel).parent.mkdir(parents=True, exist_ok=True)
+        (root / rel).write_text(rel)
+    (root / ".gitignore").write_text("/build/\ndist/\n")
+    files, skipped = collect(root)
+    assert sorted(files) == [".gitignore", "sub/build/keep.js"]
+    assert skipped == {
+        "build": SKIP_IGNORE_RULE,
+        "dist": SKIP_IGNORE_RULE,
+        "sub/dist": SKIP_IGNORE_RULE,
+    }
+
+
+def test_symlinks_can_be_skipped(project):
+    files, skipped = collect(project, follow_symlinks=False)
+    assert sorted(files) == ["docs/readme.md", "main.py"]
+    assert skipped["docs-link"] == SKIP_SYMLINK
+
+
+def test_backups_handle_symlinked_directories(project, tmp_path):
+    store = BackupStore(tmp_path / "backups")
+    manifest = store.load_manifest(store.create_snapshot(project, "demo").stem)
+    assert "docs-link/readme.md" in manifest["files"]
+    assert store.create_archive(project, "demo").exists()
+
+
+def test_deep_tree_emits_every_file(tmp_path, monkeypatch):
+    root = tmp_path / "project"
+    expected = set()
+    for rel_dir in ("a", "a/b", "a/b/c", "a/b/c/d", "x/y/z"):
+        (root / rel_dir).mkdir(parents=True, exist_ok=True)
+        (root / rel_dir / "file.txt").write_text(rel_dir)
+        expected.add(f"{rel_dir}/file.txt")
+
+    real_scandir = os.scandir
+
+    class WindowsEntry:
+        """DirEntry wie unter Windows: stat() ohne dev/ino"""
+
+        def __init__(self, entry):
+            self._entry = entry
+            self.name, self.path = entry.name, entry.path
+
+        def is_symlink(self):
+            return self._entry.is_symlink()
+
+        def is_dir(self, follow_symlinks=True):
+            return self._entry.is_dir(follow_symlinks=follow_symlinks)
+
+        def stat(self, follow_symlinks=True):
+            st = self._entry.stat(follow_symlinks=follow_symlinks)
+            return os.stat_result(st[:1] + (0, 0) + st[3:])
+
+    class WindowsScandir:
+        def __init__(self, path):
+            self._it = real_scandir(path)
+
+        def __enter__(self):
+            return self
+
+        def __iter__(self):
+            return (WindowsEntry(entry) for entry in self._it)
+
+        def __exit__(self, *exc):
+            self._it.close()
+
+    monkeypatch.setattr(os, "scandir", WindowsScandir)
+    files, skipped = collect(root)
+    assert set(files) == expected
+    assert skipped == {}
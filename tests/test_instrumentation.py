@@ -0,0 +1,61 @@
+"""
+Tests für die Zeit- und I/O-Messung
+"""
+
+import threading
+
+from bmad_mcp.core.instrumentation import NO_PROJECT, Instrumentation
+
+
+def test_counters_land_in_innermost_stage():
+    inst = Instrumentation()
+    inst.count(bytes_read=10)  # ohne Stufe ein No-op
+
+    with inst.project("demo"):
+        with inst.stage("migrate"):
+            inst.count(files_touched=1)
+            with inst.stage("backup"):
+                assert inst.current_stage() == ("demo", "backup")
+                inst.count(bytes_read=100, bytes_written=40)
+    assert inst.current_stage() is None
+
+    report = inst.report()
+    assert list(report) == ["demo"]
+    assert report["demo"]["backup"]["bytes_read"] == 100
+    assert report["demo"]["backup"]["bytes_written"] == 40
+    assert report["demo"]["migrate"]["bytes_read"] == 0
+    assert report["demo"]["migrate"]["files_touched"] == 1
+    assert report["demo"]["migrate"]["calls"] == 1
+    assert (
+        report["demo"]["migrate"]["wall_time"] >= report["demo"]["backup"]["wall_time"]
+    )
+
+
+def test_projects_are_thread_local_and_totals_sum_up():
+    inst = Instrumentation()
+
+    @inst.measure("convert")
+    def convert(size):
+        inst.count(bytes_written=size)
+
+    def run(name, size):
+        with inst.project(name):
+            for _ in range(3):
+                convert(size)
+
+    threads = [threading.Thread(target=run, args=(f"p{i}", i + 1)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    convert(5)
+
+    report = inst.report()
+    assert sorted(report) == [NO_PROJECT, "p0", "p1", "p2", "p3"]
+    assert report["p2"]["convert"]["bytes_written"] == 9
+    totals = inst.totals_by_stage()
+    assert totals["convert"]["calls"] == 13
+    assert totals["convert"]["bytes_written"] == 3 * (1 + 2 + 3 + 4) + 5
+
+    inst.reset()
+    assert inst.report() == {}
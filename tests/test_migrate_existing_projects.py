@@ -0,0 +1,145 @@
+"""
+Tests für das Migrations-Skript (Plan anwenden, Dry-Run, Resume, parallel)
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+from bmad_mcp.core.global_registry import GlobalRegistry
+from bmad_mcp.core.template_layout import compile_layout
+from bmad_mcp.core.workspace_scanner import DiscoveredProject
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+import migrate_existing_projects as migration  # noqa: E402
+
+# Kleines Layout statt der eingebauten Templates
+STRUCTURE = {"agents": {}, "tasks": {"active": {}}, "README.md": "# BMAD Projekt\n"}
+
+
+@pytest.fixture
+def migrator_env(bmad_home, monkeypatch):
+    monkeypatch.setattr(
+        migration,
+        "get_template_layout",
+        lambda template: compile_layout(STRUCTURE, template, "test"),
+    )
+    # Registry-Datenbank im Test-Home statt der prozessweiten Instanz
+    monkeypatch.setattr(migration, "global_registry", GlobalRegistry())
+    return bmad_home
+
+
+def _workspace(root, count):
+    projects = []
+    for i in range(count):
+        path = root / f"app{i}"
+        path.mkdir(parents=True)
+        (path / "bmad-config.json").write_text(json.dumps({"project": f"app{i}"}))
+        (path / "bmad-dev-settings.json").write_text(
+            json.dumps({"agent": "dev", "temperature": 0.1 * i})
+        )
+        projects.append(
+            DiscoveredProject(
+                path=path, markers=["bmad-config.json", "bmad-dev-settings.json"]
+            )
+        )
+    return projects
+
+
+def _migrator(projects):
+    migrator = migration.BMadProjectMigrator()
+    migrator.discovered_projects = list(projects)
+    return migrator
+
+
+def _snapshots(migrator, project):
+    return migrator.backup_store.list_snapshots(project.backup_name)
+
+
+def test_apply_plan_writes_once_and_skips_unchanged(migrator_env, tmp_path):
+    (project,) = _workspace(tmp_path / "ws", 1)
+    migrator = _migrator([project])
+
+    plan, config = migrator.plan_discovered_project(project)
+    result = migrator._apply_plan(plan, project.backup_name, project.name, config)
+    bmad_core = project.path / ".bmad-core"
+    assert result["status"] == "migrated"
+    assert (bmad_core / "README.md").read_text() == "# BMAD Projekt\n"
+    assert (bmad_core / "agents" / "dev.yaml").exists()
+    assert len(_snapshots(migrator, project)) == 1
+
+    # Zweiter Lauf: nur migrated_at/backup_location würden sich ändern -> kein Backup
+    plan, config = migrator.plan_discovered_project(project)
+    assert not plan.has_changes
+    result = migrator._apply_plan(plan, project.backup_name, project.name, config)
+    assert result["status"] == "unchanged"
+    assert result["backup"] is None
+    assert len(_snapshots(migrator, project)) == 1
+
+
+def test_dry_run_writes_nothing(migrator_env, tmp_path, capsys):
+    root = tmp_path / "ws"
+    (project,) = _workspace(root, 1)
+
+    assert migration.main(["--dry-run", "--scan", str(root), "--no-scan-cache"]) == 0
+    output = capsys.readouterr().out
+    assert "1 Registry-Updates" in output
+    assert f"+ {project.path / '.bmad-core' / 'README.md'}" in output
+    assert not (project.path / ".bmad-core").exists()
+    assert not any((migrator_env / ".bmad-global" / "migration-backups").glob("*.json"))
+    assert migration.global_registry.store.count() == 0
+
+
+def test_resume_continues_after_crash(migrator_env, tmp_path, monkeypatch):
+    projects = _workspace(tmp_path / "ws", 2)
+    crashed = projects[1].path / ".bmad-core" / "agents" / "dev.yaml"
+    original_write = migration.AtomicWriter.write_bytes
+
+    def crash_on_agents(writer, path, content):
+        if path == crashed:
+            raise OSError("Abbruch simuliert")
+        return original_write(writer, path, content)
+
+    monkeypatch.setattr(migration.AtomicWriter, "write_bytes", crash_on_agents)
+    first = _migrator(projects).run_full_migration()
+    assert [e["project"] for e in first["errors"]] == ["app1"]
+    assert not crashed.exists()
+
+    monkeypatch.setattr(migration.AtomicWriter, "write_bytes", original_write)
+    migrator = _migrator(projects)
+    second = migrator.run_full_migration(resume=True)
+    assert second["resumed"] and second["run_id"] == first["run_id"]
+    assert second["errors"] == []
+    assert crashed.exists()
+    # Backups des abgebrochenen Laufs wiederverwenden, app0 nicht erneut migrieren
+    assert [len(_snapshots(migrator, p)) for p in projects] == [1, 1]
+    assert second["summary"]["writes"]["files_written"] == 1
+    assert sorted(p["path"] for p in migrator.registry_store.list_projects()) == sorted(
+        str(p.path) for p in projects
+    )
+
+    # Abgeschlossener Lauf wird nicht noch einmal fortgesetzt
+    assert not _migrator(projects).run_full_migration(resume=True)["resumed"]
+
+
+def test_parallel_run_matches_serial(migrator_env, tmp_path):
+    serial = _migrator(_workspace(tmp_path / "serial", 5)).run_full_migration()
+    parallel_migrator = _migrator(_workspace(tmp_path / "parallel", 5))
+    parallel = parallel_migrator.run_full_migration(parallel=True, max_workers=4)
+
+    assert parallel["errors"] == serial["errors"] == []
+    assert [p["project"] for p in parallel["projects"]] == [
+        p["project"] for p in serial["projects"]
+    ]
+    assert [p["plan"] for p in parallel["projects"]] == [
+        p["plan"] for p in serial["projects"]
+    ]
+    assert parallel["summary"]["registered_projects"] == 5
+    assert (
+        parallel["summary"]["writes"]["files_written"]
+        == serial["summary"]["writes"]["files_written"]
+    )
+    assert parallel_migrator.registry_store.count() == 10
@@ -0,0 +1,57 @@
+"""
+Tests für das Checkpoint-Journal der Migration
+"""
+
+from bmad_mcp.core.migration_journal import (
+    STEP_BACKUP,
+    STEP_CONFIG,
+    STEP_REGISTRY,
+    MigrationJournal,
+)
+
+
+def test_resume_restores_steps_of_last_open_run(tmp_path):
+    journal_file = tmp_path / "journal.jsonl"
+    finished = MigrationJournal(journal_file)
+    finished.start_run()
+    finished.mark_done("/p/old", STEP_BACKUP, path="old")
+    finished.finish_run(successful_migrations=1)
+
+    crashed = MigrationJournal(journal_file)
+    run_id, resumed = crashed.start_run(resume=True)
+    assert not resumed
+    crashed.mark_done("/p/a", STEP_BACKUP, path="/backups/a")
+    crashed.mark_done("/p/a", STEP_CONFIG)
+    crashed.record_result("/p/b", {"status": "unchanged"}, needs_registry=False)
+    crashed.record_result("/p/c", {"status": "migrated"})
+
+    journal = MigrationJournal(journal_file)
+    assert journal.start_run(resume=True) == (run_id, True)
+    assert journal.done_steps("/p/a") == {STEP_BACKUP, STEP_CONFIG}
+    assert journal.step_data("/p/a", STEP_BACKUP) == {"path": "/backups/a"}
+    assert journal.done_steps("/p/old") == set()
+    assert journal.completed_result("/p/b") == {"status": "unchanged"}
+    # Ergebnis zählt erst, wenn auch die Registry geschrieben ist
+    assert journal.completed_result("/p/c") is None
+    journal.mark_done("/p/c", STEP_REGISTRY)
+    assert journal.completed_result("/p/c") == {"status": "migrated"}
+
+    journal.finish_run()
+    assert MigrationJournal(journal_file).start_run(resume=True)[1] is False
+
+
+def test_torn_last_line_is_repaired(tmp_path):
+    journal_file = tmp_path / "journal.jsonl"
+    journal = MigrationJournal(journal_file)
+    run_id, _ = journal.start_run()
+    journal.mark_done("/p/a", STEP_BACKUP, path="a")
+    with open(journal_file, "a", encoding="utf-8") as f:
+        f.write('{"type": "step", "project": "/p/a", "st')
+
+    resumed = MigrationJournal(journal_file)
+    assert resumed.start_run(resume=True) == (run_id, True)
+    resumed.mark_done("/p/a", STEP_CONFIG)
+    assert MigrationJournal(journal_file).start_run(resume=True) == (run_id, True)
+    lines = journal_file.read_text(encoding="utf-8").splitlines()
+    assert all(line.endswith("}") for line in lines)
+    assert len(lines) == 3
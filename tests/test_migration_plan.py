@@ -0,0 +1,100 @@
+"""
+Tests für den In-Memory-Migrationsplan
+"""
+
+from bmad_mcp.core.atomic_writer import AtomicWriter
+from bmad_mcp.core.migration_journal import (
+    STEP_AGENTS,
+    STEP_CONFIG,
+    STEP_REGISTRY,
+    STEP_STRUCTURE,
+)
+from bmad_mcp.core.migration_plan import (
+    OP_CREATE,
+    OP_OVERWRITE,
+    OP_UNCHANGED,
+    VOLATILE_KEYS,
+    MigrationPlan,
+)
+from bmad_mcp.core.template_layout import compile_layout
+
+LAYOUT = compile_layout({"agents": {}, "README.md": "# Projekt\n"}, "standard", "1")
+
+
+def _plan(project, migrated_at="heute"):
+    plan = MigrationPlan(project="demo", project_path=project)
+    bmad_core = project / ".bmad-core"
+    plan.add_layout(bmad_core, LAYOUT)
+    plan.add_yaml(
+        bmad_core / "project.yaml",
+        {"name": "demo", "migrated_at": migrated_at},
+        volatile_keys=VOLATILE_KEYS,
+    )
+    plan.add_file(bmad_core / "agents" / "dev.yaml", b"agent: dev\n", step=STEP_AGENTS)
+    plan.add_json(bmad_core / "legacy.json", {"b": 1})
+    plan.add_registry_update(project, {"name": "demo"})
+    return plan
+
+
+def test_plan_classifies_and_diffs_without_writing(tmp_path):
+    project = tmp_path / "project"
+    (project / ".bmad-core").mkdir(parents=True)
+    (project / ".bmad-core" / "legacy.json").write_text('{"a": 1}')
+
+    plan = _plan(project)
+    assert [op.action for op in plan.files] == [OP_CREATE, OP_CREATE, OP_OVERWRITE]
+    assert plan.summary() == {
+        OP_CREATE: 2,
+        OP_OVERWRITE: 1,
+        OP_UNCHANGED: 0,
+        "missing_paths": 2,
+        "registry_updates": 1,
+    }
+    diff = plan.diff()
+    assert f"+ {project / '.bmad-core' / 'agents'}\n" in diff
+    assert '-{"a": 1}' in diff and "--- /dev/null" in diff
+    assert sorted(p.name for p in (project / ".bmad-core").iterdir()) == ["legacy.json"]
+
+
+def test_apply_runs_steps_in_order_and_is_idempotent(tmp_path):
+    project = tmp_path / "project"
+    writer, steps, registered = AtomicWriter(), [], []
+
+    summary = _plan(project).apply(
+        register=lambda path, config: registered.append(path),
+        writer=writer,
+        on_step=steps.append,
+    )
+    assert summary[OP_CREATE] == 3
+    assert steps == [STEP_STRUCTURE, STEP_CONFIG, STEP_AGENTS, STEP_REGISTRY]
+    assert registered == [project]
+    assert (project / ".bmad-core" / "README.md").read_text() == "# Projekt\n"
+
+    # Nur ein volatiles Feld unterscheidet sich -> keine Änderung, keine Schritte
+    plan = _plan(project, migrated_at="morgen")
+    assert not plan.has_changes
+    steps.clear()
+    assert (
+        plan.apply(
+            register=lambda path, config: registered.append(path),
+            writer=writer,
+            on_step=steps.append,
+        )["registry_updates"]
+        == 0
+    )
+    assert steps == [] and registered == [project]
+    assert writer.report()["files_unchanged"] == 3
+
+
+def test_apply_skips_completed_steps(tmp_path):
+    project = tmp_path / "project"
+    steps = []
+    _plan(project).apply(
+        writer=AtomicWriter(),
+        skip_steps=[STEP_STRUCTURE, STEP_AGENTS],
+        on_step=steps.append,
+    )
+    assert steps == [STEP_CONFIG]
+    assert not (project / ".bmad-core" / "README.md").exists()
+    assert not (project / ".bmad-core" / "agents" / "dev.yaml").exists()
+    assert (project / ".bmad-core" / "project.yaml").exists()
@@ -0,0 +1,85 @@
+"""
+Tests für den Monitor-Scheduler
+"""
+
+import asyncio
+import logging
+import threading
+
+from bmad_mcp.core.monitor_scheduler import (
+    KIND_PROGRESS,
+    KIND_REMINDER,
+    MonitorScheduler,
+)
+from bmad_mcp.core.task_event_log import OP_CREATE, OP_DELETE, TaskEventLog
+
+
+def test_task_created_from_other_thread_wakes_idle_loop(tmp_path):
+    calls = []
+    event_log = TaskEventLog(tmp_path, compact_every=0)
+
+    async def scenario():
+        scheduler = MonitorScheduler()
+        scheduler.register_handler(
+            KIND_PROGRESS, lambda project, task_ids: calls.append((project, task_ids))
+        )
+        scheduler.watch(event_log, project="demo", interval=0.2)
+        await scheduler.start()
+        await asyncio.sleep(0.05)  # Schleife schläft ohne fällige Einträge
+
+        writer = threading.Thread(
+            target=event_log.create_task, args=("a",), kwargs={"name": "A"}
+        )
+        writer.start()
+        writer.join()
+
+        for _ in range(60):
+            if calls:
+                break
+            await asyncio.sleep(0.05)
+        await scheduler.stop()
+
+    asyncio.run(asyncio.wait_for(scenario(), timeout=5))
+    assert calls and calls[0] == ("demo", ["a"])
+
+
+def test_handler_errors_are_logged(caplog):
+    def failing(project, task_ids):
+        raise RuntimeError("kaputt")
+
+    async def scenario():
+        scheduler = MonitorScheduler()
+        scheduler.register_handler(KIND_PROGRESS, failing)
+        await scheduler.start()
+        scheduler.trigger(KIND_PROGRESS, "demo")
+        for _ in range(40):
+            if scheduler.stats["errors"]:
+                break
+            await asyncio.sleep(0.05)
+        await scheduler.stop()
+        return scheduler.stats["errors"]
+
+    with caplog.at_level(logging.ERROR, logger="bmad_mcp.core.monitor_scheduler"):
+        errors = asyncio.run(asyncio.wait_for(scenario(), timeout=5))
+    assert errors == 1
+    assert "kaputt" in caplog.text
+
+
+def test_events_without_task_id_leave_project_jobs_alone():
+    class FakeLog:
+        def attach(self, listener):
+            self.listener = listener
+            return {}
+
+    scheduler = MonitorScheduler(clock=lambda: 0.0)
+    scheduler.add_interval(KIND_REMINDER, "demo", 60)
+    event_log = FakeLog()
+    scheduler.watch(event_log, project="demo")
+
+    event_log.listener({"op": OP_CREATE, "data": {"name": "ohne ID"}})
+    event_log.listener({"op": OP_DELETE, "task_id": None})
+    assert scheduler.pending() == 1
+    assert scheduler.next_due() == 60
+
+    event_log.listener({"op": OP_CREATE, "task_id": "a"})
+    assert scheduler.pending() == 2
@@ -0,0 +1,63 @@
+"""
+Tests für die Slot-Records
+"""
+
+import copy
+import io
+import json
+import pickle
+import typing
+
+from bmad_mcp.core.records import (
+    MISSING,
+    Task,
+    WorkSession,
+    decode_tasks,
+    encode_tasks,
+    iter_task_records,
+)
+
+
+def test_round_trip_keeps_explicit_none_and_extra_field():
+    data = {
+        "task_id": "t1",
+        "agent": None,
+        "allocated_hours": 4,
+        "extra": {"x": 1},
+        "notes": None,
+        "completed_hours": 1.5,
+    }
+    task = Task.from_dict(data)
+
+    assert task.to_dict() == data
+    assert json.loads(encode_tasks([task])) == [data]
+    assert decode_tasks(json.dumps([data]))[0].to_dict() == data
+
+
+def test_absent_fields_stay_absent():
+    task = Task(task_id="t1")
+    assert task.to_dict() == {"task_id": "t1"}
+    assert task.status is MISSING
+    assert task.get("status", "todo") == "todo"
+    assert task.remaining_hours == 0.0
+
+
+def test_keys_that_are_not_keywords_survive():
+    data = {"task_id": "t1", "self": "x", "with-dash": 2}
+    assert Task.from_dict(data).to_dict() == data
+    document = io.StringIO(json.dumps({"tasks": [data]}))
+    assert [task.to_dict() for task in iter_task_records(document)] == [data]
+
+
+def test_records_copy_and_pickle():
+    session = WorkSession(task_id="t1", hours_worked=2.0)
+    for clone in (copy.deepcopy(session), pickle.loads(pickle.dumps(session))):
+        assert clone == session
+        assert clone.agent is MISSING
+
+
+def test_slot_fields_are_annotated():
+    for cls in (Task, WorkSession):
+        hints = typing.get_type_hints(cls)
+        assert set(cls.FIELDS) | {"_extra"} <= set(hints)
+        assert not hasattr(cls(task_id="t1"), "__dict__")
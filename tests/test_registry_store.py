@@ -0,0 +1,62 @@
+"""
+Tests für die SQLite-Registry und die globale Registry-Fassade
+"""
+
+import json
+
+from bmad_mcp.core.global_registry import GlobalRegistry
+from bmad_mcp.core.registry_store import SQLiteRegistry
+
+
+def test_lookups_and_batched_upsert(tmp_path):
+    registry = SQLiteRegistry(tmp_path / "registry.db")
+    assert (
+        registry.register_projects(
+            [
+                ("/p/a", {"name": "a", "type": "web", "template": "react"}),
+                ("/p/b", {"name": "b", "type": "api", "template": "fastapi"}),
+                ("/p/c", {"name": "c", "type": "web", "template": "vue"}),
+            ]
+        )
+        == 3
+    )
+    assert [p["path"] for p in registry.find_projects(project_type="web")] == [
+        "/p/a",
+        "/p/c",
+    ]
+    assert (
+        registry.find_projects(name="b", template="fastapi")[0]["config"]["type"]
+        == "api"
+    )
+
+    first = registry.get_project("/p/a")
+    updated = registry.register_project("/p/a", {"name": "a2", "type": "web"})
+    assert (
+        updated["name"] == "a2" and updated["registered_at"] == first["registered_at"]
+    )
+    assert registry.count() == 3
+    assert registry.remove_project("/p/b") and not registry.remove_project("/p/b")
+
+
+def test_wal_mode(tmp_path):
+    registry = SQLiteRegistry(tmp_path / "registry.db")
+    mode = registry._connection().execute("PRAGMA journal_mode").fetchone()[0]
+    assert mode == "wal"
+
+
+def test_global_registry_imports_legacy_file_once(bmad_home):
+    legacy = bmad_home / ".bmad-global" / "registry.json"
+    legacy.parent.mkdir(parents=True)
+    legacy.write_text(
+        json.dumps({"projects": {"/p/old": {"name": "old", "type": "standard"}}})
+    )
+
+    registry = GlobalRegistry()
+    assert [p["path"] for p in registry.list_projects()] == ["/p/old"]
+    registry.register_project("/p/new", {"name": "new", "type": "standard"})
+    registry.remove_project("/p/old")
+
+    # Neuer Prozess: keine zweite Übernahme, einziger Speicher ist die Datenbank
+    reopened = GlobalRegistry()
+    assert [p["path"] for p in reopened.list_projects()] == ["/p/new"]
+    assert reopened.store.db_path == bmad_home / ".bmad-global" / "registry.db"
@@ -0,0 +1,74 @@
+"""
+Tests für die Terminprognose
+"""
+
+import pytest
+
+from bmad_mcp.core import schedule_forecast
+from bmad_mcp.core.schedule_forecast import ScheduleForecaster, bmad_forecast_schedule
+
+TASKS = [
+    {"task_id": "spec", "allocated_hours": 16, "agent": "pm", "phase": "plan"},
+    {"task_id": "api", "allocated_hours": 40, "agent": "dev", "phase": "build"},
+    {"task_id": "ui", "allocated_hours": 24, "agent": "dev", "phase": "build"},
+    {"task_id": "tests", "allocated_hours": 32, "agent": "qa", "phase": "build"},
+    {
+        "task_id": "release",
+        "allocated_hours": 8,
+        "agent": "dev",
+        "phase": "ship",
+        "completed_hours": 2,
+    },
+]
+
+
+@pytest.mark.parametrize(
+    "options",
+    [{"capacity": {"dev": 0}}, {"capacity": {"qa": -2}}, {"hours_per_day": 0}],
+)
+def test_non_positive_capacity_is_rejected(options):
+    with pytest.raises(ValueError):
+        ScheduleForecaster(TASKS, **options)
+    result = bmad_forecast_schedule(TASKS, trials=10, seed=1, **options)
+    assert result["success"] is False
+    assert "größer 0" in result["error"]
+
+
+@pytest.mark.parametrize(
+    "options", [{"mean_overrun": 0}, {"mean_overrun": -1.2}, {"overrun_sigma": -0.1}]
+)
+def test_invalid_overrun_parameters_are_rejected(options):
+    result = bmad_forecast_schedule(TASKS, trials=10, seed=1, **options)
+    assert result["success"] is False
+    assert "overrun" in result["error"] and "domain" not in result["error"]
+
+
+def test_numpy_and_python_paths_agree():
+    pytest.importorskip("numpy")
+    vectorized = ScheduleForecaster(TASKS, capacity={"dev": 6.0}, use_numpy=True)
+    looped = ScheduleForecaster(TASKS, capacity={"dev": 6.0}, use_numpy=False)
+    assert vectorized.use_numpy and not looped.use_numpy
+
+    fast = vectorized.forecast(trials=40_000, seed=3)
+    slow = looped.forecast(trials=40_000, seed=3)
+    # Verschiedene Zufallsgeneratoren, gleiches Modell: gleiche Verteilung
+    for key in ("mean", "p10", "p50", "p90"):
+        assert fast["days"][key] == pytest.approx(slow["days"][key], rel=0.02)
+    for phase in fast["bottlenecks"]:
+        for agent, share in fast["bottlenecks"][phase].items():
+            assert share == pytest.approx(
+                slow["bottlenecks"][phase].get(agent, 0.0), abs=0.02
+            )
+    assert sum(fast["histogram"].values()) == sum(slow["histogram"].values()) == 40_000
+
+
+def test_missing_numpy_is_reported(monkeypatch, caplog):
+    monkeypatch.setattr(schedule_forecast, "NUMPY_AVAILABLE", False)
+    with caplog.at_level("WARNING", logger=schedule_forecast.__name__):
+        result = bmad_forecast_schedule(
+            TASKS, trials=200, seed=1, start_date="2025-03-03"
+        )
+    assert result["success"] is True
+    assert result["vectorized"] is False
+    assert result["warning"] == schedule_forecast.NO_NUMPY_WARNING
+    assert schedule_forecast.NO_NUMPY_WARNING in caplog.text
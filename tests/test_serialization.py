@@ -0,0 +1,75 @@
+"""
+Tests für das zentrale YAML/JSON-Backend
+"""
+
+import importlib
+
+import pytest
+import yaml
+
+from bmad_mcp.core import serialization
+
+SAMPLE = {
+    "project": {"name": "Demo-Projekt", "owner": "Müller"},
+    "agents": ["pm", "dev", "qa"],
+    "settings": {"auto_save": True, "interval": 30, "ratio": 0.5},
+}
+
+
+@pytest.fixture
+def pure_python_backend(monkeypatch):
+    """serialization ohne libyaml neu laden, danach Originalzustand herstellen"""
+    monkeypatch.delattr(yaml, "CSafeLoader", raising=False)
+    monkeypatch.delattr(yaml, "CSafeDumper", raising=False)
+    module = importlib.reload(serialization)
+    yield module
+    monkeypatch.undo()
+    importlib.reload(serialization)
+
+
+@pytest.mark.skipif(
+    not getattr(yaml, "__with_libyaml__", False), reason="PyYAML ohne libyaml"
+)
+def test_uses_c_loader_and_dumper_when_available(tmp_path):
+    assert serialization.LIBYAML_AVAILABLE
+    assert serialization.SafeLoader is yaml.CSafeLoader
+    assert serialization.SafeDumper is yaml.CSafeDumper
+    assert serialization.backend_info()["loader"] == "CSafeLoader"
+
+    path = tmp_path / "config.yaml"
+    path.write_bytes(serialization.dump_yaml_bytes(SAMPLE))
+    assert serialization.load_yaml_file(path) == SAMPLE
+
+
+def test_falls_back_to_pure_python(pure_python_backend, tmp_path):
+    module = pure_python_backend
+    assert not module.LIBYAML_AVAILABLE
+    assert module.SafeLoader is yaml.SafeLoader
+    assert module.SafeDumper is yaml.SafeDumper
+    assert module.backend_info()["dumper"] == "SafeDumper"
+
+    path = tmp_path / "config.yaml"
+    path.write_bytes(module.dump_yaml_bytes(SAMPLE))
+    assert module.load_yaml_file(path) == SAMPLE
+
+
+def test_backends_produce_identical_yaml(pure_python_backend):
+    fallback_text = pure_python_backend.dump_yaml(SAMPLE)
+    assert fallback_text == yaml.safe_dump(
+        SAMPLE, default_flow_style=False, allow_unicode=True
+    )
+    assert "Müller" in fallback_text
+    assert pure_python_backend.load_yaml(fallback_text) == SAMPLE
+
+
+def test_load_is_safe():
+    with pytest.raises(serialization.YAMLError):
+        serialization.load_yaml("!!python/object/apply:os.system ['true']")
+
+
+def test_json_round_trip(tmp_path):
+    path = tmp_path / "project.json"
+    path.write_bytes(serialization.dump_json_bytes(SAMPLE))
+    assert serialization.load_json_file(path) == SAMPLE
+    assert b"\\u00fc" in serialization.dump_json_bytes(SAMPLE)
+    assert "ü".encode() in serialization.dump_json_bytes(SAMPLE, ensure_ascii=False)
@@ -0,0 +1,125 @@
+"""
+Tests für die spaltenbasierte Task-Tabelle
+"""
+
+import random
+
+import pytest
+
+from bmad_mcp.core.task_analytics import NUMPY_AVAILABLE, TaskTable
+from bmad_mcp.core.task_event_log import (
+    OP_CREATE,
+    OP_DELETE,
+    OP_PROGRESS,
+    OP_STATUS,
+    TaskEventLog,
+)
+
+BACKENDS = [
+    False,
+    pytest.param(
+        True, marks=pytest.mark.skipif(not NUMPY_AVAILABLE, reason="NumPy fehlt")
+    ),
+]
+
+
+def _expected(tasks, dim, default, **filters):
+    groups = {}
+    for task in tasks.values():
+        if any(
+            (task.get(key) or "unassigned") != value for key, value in filters.items()
+        ):
+            continue
+        entry = groups.setdefault(
+            task.get(dim) or default,
+            {"tasks": 0, "allocated_hours": 0.0, "completed_hours": 0.0},
+        )
+        entry["tasks"] += 1
+        entry["allocated_hours"] += float(task.get("allocated_hours") or 0)
+        entry["completed_hours"] += float(task.get("completed_hours") or 0)
+    return groups
+
+
+@pytest.mark.parametrize("use_numpy", BACKENDS)
+def test_attached_table_follows_event_log(tmp_path, use_numpy):
+    rng = random.Random(11)
+    log = TaskEventLog(tmp_path / "log", compact_every=0)
+    for i in range(20):
+        log.create_task(
+            f"old{i}", agent="dev", allocated_hours=4, project="alpha", phase="build"
+        )
+    table = TaskTable.attach(log, use_numpy=use_numpy)
+
+    for i in range(300):
+        log.create_task(
+            f"t{i}",
+            agent=rng.choice(["dev", "qa", None]),
+            phase=rng.choice(["plan", "build"]),
+            project=rng.choice(["alpha", "beta"]),
+            allocated_hours=rng.randrange(1, 9),
+        )
+    for i in range(0, 300, 3):
+        log.update_task_progress(f"t{i}", completed_hours=rng.randrange(0, 9))
+    for i in range(1, 300, 7):
+        log.set_task_status(f"t{i}", "blocked")
+    for i in range(2, 300, 5):
+        log.delete_task(f"t{i}")
+
+    tasks = log.tasks
+    assert len(table) == len(tasks)
+    # Ganzzahlige Stunden -> Summen exakt vergleichbar
+    assert table.group_by("agent") == _expected(tasks, "agent", "unassigned")
+    assert table.group_by("status") == _expected(tasks, "status", "unknown")
+    assert table.group_by("phase", project="beta") == _expected(
+        tasks, "phase", "unphased", project="beta"
+    )
+
+    status = table.project_status("alpha")
+    assert status["total_tasks"] == sum(
+        1 for t in tasks.values() if t.get("project") == "alpha"
+    )
+    assert table.agent_summary("nobody")["total_tasks"] == 0
+
+
+@pytest.mark.parametrize("use_numpy", BACKENDS)
+def test_compaction_keeps_aggregates(use_numpy):
+    table = TaskTable(
+        (
+            {
+                "task_id": f"t{i}",
+                "agent": "dev" if i % 2 else "qa",
+                "allocated_hours": 1,
+            }
+            for i in range(3000)
+        ),
+        use_numpy=use_numpy,
+    )
+    before = table.group_by("agent", status="unknown")
+    for i in range(4000):
+        table.upsert({"task_id": f"x{i}", "agent": "pm", "allocated_hours": 2})
+        table.delete(f"x{i}")
+
+    # Nach über 1024 Tombstones wird kompaktiert, Codes und Summen bleiben gleich
+    assert table._dead < 1024
+    assert table.group_by("agent", status="unknown") == before
+    assert table.summary()["allocated_hours"] == 3000.0
+    with pytest.raises(ValueError):
+        table.group_by("priority")
+
+
+def test_events_without_task_id_are_ignored():
+    table = TaskTable(
+        [{"task_id": "a", "agent": "dev", "status": "todo", "allocated_hours": 4}]
+    )
+    before = table.group_by("status")
+    table.apply_event({"op": OP_CREATE, "data": {"agent": "qa"}})
+    table.apply_event({"op": OP_PROGRESS, "data": {"completed_hours": 4}})
+    table.apply_event({"op": OP_STATUS, "task_id": None, "data": {"status": "done"}})
+    table.apply_event({"op": OP_DELETE})
+    assert len(table) == 1
+    assert table.group_by("status") == before
+
+    table.apply_event(
+        {"op": OP_PROGRESS, "task_id": "a", "data": {"completed_hours": 2}}
+    )
+    assert list(table.group_by("status")) == ["in_progress"]
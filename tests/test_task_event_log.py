@@ -0,0 +1,107 @@
+"""
+Tests für das Task-Event-Log
+"""
+
+import json
+
+import pytest
+
+from bmad_mcp.core.task_event_log import TaskEventLog
+
+
+def test_torn_tail_is_repaired_before_append(tmp_path):
+    log = TaskEventLog(tmp_path, compact_every=0)
+    log.create_task("a", name="A")
+    with open(log.log_file, "a", encoding="utf-8") as f:
+        f.write('{"seq": 2, "op": "cre')
+    log.create_task("b", name="B")
+    log.create_task("c", name="C")
+
+    replay = TaskEventLog(tmp_path, compact_every=0)
+    assert sorted(replay.tasks) == ["a", "b", "c"]
+    assert replay.sequence == 3
+    assert replay.skipped_lines == 0
+
+
+def test_replay_skips_corrupt_line_instead_of_stopping(tmp_path):
+    log = TaskEventLog(tmp_path, compact_every=0)
+    log.create_task("a", name="A")
+    with open(log.log_file, "a", encoding="utf-8") as f:
+        f.write("not json\n")
+    log.create_task("b", name="B")
+
+    replay = TaskEventLog(tmp_path, compact_every=0)
+    assert sorted(replay.tasks) == ["a", "b"]
+    assert replay.skipped_lines == 1
+
+    # Neue Events setzen die Sequenz fort statt Nummern wiederzuverwenden
+    assert replay.create_task("c")["seq"] == 3
+    assert replay.task_count() == 3
+
+
+def test_task_count_matches_replay_with_repeated_ids(tmp_path):
+    log = TaskEventLog(tmp_path, compact_every=0)
+    log.create_task("a", name="A")
+    log.create_task("b", name="B")
+    log.compact()
+    # Ältere Logs können doppelte Creates/Deletes enthalten (create = Upsert)
+    log._append("create", "c", {"name": "C"})
+    log._append("create", "c", {"name": "C2"})
+    log._append("create", "c", {"name": "C3"})
+    log._append("delete", "b", {})
+    log._append("delete", "b", {})
+
+    fresh = TaskEventLog(tmp_path, compact_every=0)
+    count = fresh.task_count()
+    assert count == len(TaskEventLog(tmp_path, compact_every=0).tasks) == 2
+    assert sorted(fresh.tasks) == ["a", "c"]
+
+
+def test_duplicate_create_and_unknown_delete_are_rejected(tmp_path):
+    log = TaskEventLog(tmp_path, compact_every=0)
+    log.create_task("a", name="A")
+    with pytest.raises(ValueError):
+        log.create_task("a", name="again")
+    with pytest.raises(KeyError):
+        log.delete_task("missing")
+    log.delete_task("a")
+    log.create_task("a", name="A3")
+    assert TaskEventLog(tmp_path, compact_every=0).task_count() == 1
+    assert log.sequence == 3
+
+
+def test_tasks_without_id_survive_compaction(tmp_path):
+    legacy = [
+        {"title": "Altlast ohne ID", "status": "todo"},
+        {"task_id": "a", "title": "A"},
+    ]
+    (tmp_path / "tasks.json").write_text(json.dumps({"tasks": legacy, "sessions": []}))
+
+    log = TaskEventLog(tmp_path, compact_every=0)
+    assert log.task_count() == 2
+    log.create_task("b", title="B")
+    assert log.task_count() == 3
+    log.compact()
+
+    document = json.loads((tmp_path / "tasks.json").read_text())
+    assert {"title": "Altlast ohne ID", "status": "todo"} in document["tasks"]
+    assert document["meta"]["task_count"] == 3
+    fresh = TaskEventLog(tmp_path, compact_every=0)
+    assert fresh.task_count() == 3
+    assert sorted(fresh.tasks) == ["a", "b"]
+    fresh.compact()
+    assert len(json.loads((tmp_path / "tasks.json").read_text())["tasks"]) == 3
+
+
+def test_task_events_without_id_are_ignored_on_replay(tmp_path):
+    log = TaskEventLog(tmp_path, compact_every=0)
+    log.create_task("a", title="A")
+    log._append("create", None, {"title": "ohne ID"})
+    log._append("delete", None, {})
+    log.end_work_session({"hours_worked": 1.5})
+
+    fresh = TaskEventLog(tmp_path, compact_every=0)
+    assert fresh.task_count() == 1
+    assert sorted(fresh.tasks) == ["a"]
+    assert fresh.sessions[0]["hours_worked"] == 1.5
+    assert fresh.sequence == 4
@@ -0,0 +1,84 @@
+"""
+Tests für den Task-Abhängigkeitsgraphen
+"""
+
+import pytest
+
+from bmad_mcp.core.event_simulator import SimulationConfig, compile_plan, simulate
+from bmad_mcp.core.task_event_log import OP_DELETE, OP_PROGRESS, OP_STATUS
+from bmad_mcp.core.task_graph import GraphError, TaskGraph
+
+
+def task(task_id, depends_on=(), hours=1.0):
+    return {
+        "task_id": task_id,
+        "depends_on": list(depends_on),
+        "allocated_hours": hours,
+    }
+
+
+def test_cycle_keeps_edges_downstream_of_the_cycle():
+    graph = TaskGraph(
+        [task("A", ["B"]), task("B", ["A"]), task("C", ["B"]), task("D", ["C"])]
+    )
+
+    # Genau eine Rückwärtskante je Zyklus wird verworfen
+    assert graph.rejected_edges == [("B", "A")]
+    assert graph.dependencies("C") == ["B"]
+    assert graph.dependencies("D") == ["C"]
+    assert [s["task_id"] for s in graph.suggest_next()] == ["A"]
+
+
+def test_simulator_respects_edges_behind_a_cycle():
+    tasks = [task("A", ["B"]), task("B", ["A"]), task("C", ["B"]), task("D", ["C"])]
+    result = simulate(compile_plan(tasks), SimulationConfig(estimate_sigma=0.0))
+    assert result.finished == {"A": 1.0, "B": 2.0, "C": 3.0, "D": 4.0}
+
+
+def test_independent_cycles_each_lose_one_edge():
+    graph = TaskGraph(
+        [
+            task("a", ["c"]),
+            task("b", ["a"]),
+            task("c", ["b"]),
+            task("x", ["y"]),
+            task("y", ["x"]),
+            task("z", ["a", "x"]),
+        ]
+    )
+    assert len(graph.rejected_edges) == 2
+    assert graph.dependencies("z") == ["a", "x"]
+
+
+def test_add_dependency_rejects_cycle():
+    graph = TaskGraph([task("a"), task("b", ["a"])])
+    with pytest.raises(GraphError):
+        graph.add_dependency("a", "b")
+
+
+def test_incremental_progress_matches_rebuild():
+    graph = TaskGraph(
+        [task("a", hours=4), task("b", ["a"], hours=2), task("c", ["a"], hours=5)]
+    )
+    assert graph.project_length == 9
+    graph.update_progress("c", 4)
+    assert graph.project_length == 6
+    assert graph.critical_path() == ["a", "b"]
+    assert (
+        graph.project_length
+        == TaskGraph(
+            [task("a", hours=4), task("b", ["a"], hours=2), task("c", ["a"], hours=1)]
+        ).project_length
+    )
+
+
+def test_events_without_task_id_are_ignored():
+    graph = TaskGraph([task("a", hours=4)])
+    graph.apply_event({"op": OP_PROGRESS, "data": {"completed_hours": 3}})
+    graph.apply_event({"op": OP_STATUS, "task_id": None, "data": {"status": "done"}})
+    graph.apply_event({"op": OP_DELETE})
+    assert graph.project_length == 4
+    graph.apply_event(
+        {"op": OP_PROGRESS, "task_id": "a", "data": {"completed_hours": 3}}
+    )
+    assert graph.project_length == 1
@@ -0,0 +1,148 @@
+"""
+Tests für den Task-Index
+"""
+
+import random
+import threading
+from datetime import date, timedelta
+
+from bmad_mcp.core import task_index as task_index_module
+from bmad_mcp.core.task_event_log import TaskEventLog
+from bmad_mcp.core.task_index import FINAL_STATUSES, PRIORITY_ORDER, TaskIndex
+
+
+def _brute_force_suggestions(index, agent, day, limit):
+    candidates = []
+    for task_id in list(index._entries):
+        entry = index.entry(task_id)
+        if (
+            not entry.start
+            or entry.start > day.isoformat()
+            or entry.status in FINAL_STATUSES
+        ):
+            continue
+        if agent and entry.agent != agent:
+            continue
+        candidates.append(
+            (entry.end, PRIORITY_ORDER.get(entry.priority, 2), entry.start, task_id)
+        )
+    return [task_id for *_, task_id in sorted(candidates)[:limit]]
+
+
+def test_suggest_next_matches_full_scan(tmp_path):
+    rng = random.Random(3)
+    index = TaskIndex(tmp_path / "index.json", autosave_every=0)
+    first = date(2025, 1, 1)
+    for i in range(600):
+        start = first + timedelta(days=rng.randrange(120))
+        index.upsert(
+            {
+                "task_id": f"t{i}",
+                "start_date": start.isoformat(),
+                "due_date": (start + timedelta(days=rng.randrange(20))).isoformat(),
+                "agent": rng.choice(["dev", "qa", "pm"]),
+                "status": rng.choice(["todo", "in_progress", "completed", "done"]),
+                "priority": rng.choice(list(PRIORITY_ORDER)),
+            }
+        )
+    # Statuswechsel und Löschungen pflegen die Ende-Liste mit
+    for i in range(0, 600, 7):
+        index._apply_update("status", f"t{i}", {"status": "completed"})
+    for i in range(3, 600, 11):
+        index._apply_update("status", f"t{i}", {"status": "in_progress"})
+    for i in range(5, 600, 13):
+        index.remove(f"t{i}")
+
+    for day in (date(2025, 1, 10), date(2025, 3, 1), date(2025, 6, 1)):
+        for agent in (None, "dev", "qa"):
+            for limit in (1, 5, 40):
+                assert index.suggest_next(
+                    agent, day, limit
+                ) == _brute_force_suggestions(index, agent, day, limit)
+
+
+def test_autosave_does_not_block_event_log(tmp_path, monkeypatch):
+    log = TaskEventLog(tmp_path / "log", compact_every=0)
+    index = TaskIndex.attach(log, tmp_path / "index.json", autosave_every=3)
+
+    entered, release = threading.Event(), threading.Event()
+    writers = []
+    original = task_index_module.atomic_writer.write_json
+
+    def slow_write_json(path, document, **options):
+        writers.append(threading.current_thread().name)
+        entered.set()
+        release.wait(5)
+        return original(path, document, **options)
+
+    monkeypatch.setattr(task_index_module.atomic_writer, "write_json", slow_write_json)
+    for i in range(8):
+        log.create_task(f"t{i}", start_date="2025-01-02", agent="dev")
+    # Schreiben hängt noch - das Log hat trotzdem alle Events angenommen
+    assert entered.wait(5)
+    assert writers == ["bmad-task-index-save"]
+
+    release.set()
+    assert index.flush(timeout=5)
+    assert not index.dirty
+
+    reloaded = TaskIndex(tmp_path / "index.json")
+    assert reloaded.load()
+    assert len(reloaded) == 8
+    assert reloaded.log_sequence == 8
+
+
+class _CountingDict(dict):
+    reads = 0
+
+    def __getitem__(self, key):
+        self.reads += 1
+        return super().__getitem__(key)
+
+
+def test_in_range_matches_full_scan_and_ignores_long_tasks_elsewhere(tmp_path):
+    rng = random.Random(5)
+    index = TaskIndex(tmp_path / "index.json", autosave_every=0)
+    first = date(2025, 1, 1)
+    for i in range(2000):
+        start = first + timedelta(days=rng.randrange(365))
+        index.upsert(
+            {
+                "task_id": f"t{i}",
+                "start_date": start.isoformat(),
+                "due_date": (start + timedelta(days=rng.randrange(3))).isoformat(),
+            }
+        )
+    index.upsert(
+        {"task_id": "long", "start_date": "2025-01-01", "due_date": "2025-09-30"}
+    )
+
+    for day in (date(2025, 2, 1), date(2025, 7, 15), date(2026, 1, 2)):
+        for last in (day, day + timedelta(days=6)):
+            expected = sorted(
+                (e.start, task_id)
+                for task_id, e in index._entries.items()
+                if e.start <= last.isoformat() and e.end >= day.isoformat()
+            )
+            assert index.in_range(day, last) == [task_id for _, task_id in expected]
+
+    # Der lange Task verbreitert nur das Fenster seines eigenen Buckets
+    index._entries = _CountingDict(index._entries)
+    assert "long" in index.active_on(date(2025, 7, 15))
+    assert index._entries.reads < 40
+
+    buckets = len(index._by_start)
+    index.remove("long")
+    assert len(index._by_start) == buckets - 1
+    assert "long" not in index.active_on(date(2025, 7, 15))
+
+
+def test_events_without_task_id_are_ignored(tmp_path):
+    index = TaskIndex(tmp_path / "index.json", autosave_every=0)
+    index.upsert({"task_id": "a", "start_date": "2025-01-01"})
+    index.apply_event({"op": "status", "task_id": None, "data": {"status": "done"}})
+    index.apply_event({"op": "delete", "data": {}})
+    assert index.by_status("todo") == {"a"}
+    assert index.suggest_next(day=date(2025, 1, 2)) == ["a"]
+    assert index.save()
+    assert (tmp_path / "index.json").read_text().count("\n") == 0
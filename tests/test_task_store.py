@@ -0,0 +1,98 @@
+"""
+Tests für den streamenden Task-Store-Reader
+"""
+
+import io
+import json
+from datetime import date
+
+import pytest
+
+from bmad_mcp.core import task_store
+from bmad_mcp.core.task_store import TaskStoreReader, iter_json_array, read_json_key
+
+TRICKY = {
+    "meta": {
+        "note": 'Klammern "]}" und Escapes \\" \\\\ ü',
+        "n": [1, -2.5e3, True, None, {}],
+    },
+    "history": [[{"a": "}"}], "[", 12345678901234567890],
+    "tasks": [
+        {
+            "task_id": "a",
+            "agent": "dev",
+            "status": "todo",
+            "allocated_hours": 4,
+            "start_date": "2025-03-03",
+        },
+        {
+            "task_id": 'b\\"q',
+            "agent": "qa",
+            "status": "done",
+            "allocated_hours": 2.5,
+            "completed_hours": 2.5,
+        },
+        {
+            "task_id": "c",
+            "agent": "dev",
+            "status": "in_progress",
+            "nested": {"x": [[], [{}]]},
+        },
+    ],
+    "trailer": 0,
+}
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64 * 1024])
+def test_streaming_matches_json_load_at_any_chunk_size(monkeypatch, chunk_size):
+    monkeypatch.setattr(task_store, "_CHUNK_SIZE", chunk_size)
+    text = json.dumps(TRICKY, ensure_ascii=False)
+    assert list(iter_json_array(io.StringIO(text))) == TRICKY["tasks"]
+    assert read_json_key(io.StringIO(text), "meta") == TRICKY["meta"]
+    assert read_json_key(io.StringIO(text), "trailer") == 0
+    assert read_json_key(io.StringIO(text), "missing") is None
+    assert (
+        list(iter_json_array(io.StringIO(json.dumps(TRICKY["tasks"]))))
+        == TRICKY["tasks"]
+    )
+
+
+def test_large_value_before_tasks_is_skipped_in_bounded_memory(monkeypatch):
+    monkeypatch.setattr(task_store, "_CHUNK_SIZE", 4096)
+    largest = []
+    fill = task_store._StreamBuffer._fill
+
+    def tracking_fill(self):
+        result = fill(self)
+        largest.append(len(self.buf))
+        return result
+
+    monkeypatch.setattr(task_store._StreamBuffer, "_fill", tracking_fill)
+    document = {
+        "archive": "x" * 2_000_000,
+        "log": [{"i": i} for i in range(50_000)],
+        "tasks": [{"task_id": "t1"}, {"task_id": "t2"}],
+    }
+    text = json.dumps(document)
+
+    assert [t["task_id"] for t in iter_json_array(io.StringIO(text))] == ["t1", "t2"]
+    # Der Puffer wächst nie über Rest + einen Chunk hinaus
+    assert max(largest) <= 2 * 4096
+
+
+def test_reader_count_filter_and_summary(tmp_path):
+    tasks_file = tmp_path / "tasks.json"
+    tasks_file.write_text(json.dumps(TRICKY), encoding="utf-8")
+    reader = TaskStoreReader(tasks_file)
+
+    assert reader.count() == 3
+    assert reader.meta_file.exists() and reader.count() == 3
+    assert [t["task_id"] for t in reader.filter(agent="dev")] == ["a", "c"]
+    assert [t["task_id"] for t in reader.today_tasks(date(2025, 3, 3))] == ["a"]
+    summary = reader.summary()
+    assert summary["total_tasks"] == 3
+    assert summary["by_agent"]["dev"]["tasks"] == 2
+    assert summary["allocated_hours"] == 6.5
+
+    with pytest.raises(ValueError):
+        list(iter_json_array(io.StringIO('{"tasks": [{"a": 1}, {"b": ')))
@@ -0,0 +1,84 @@
+"""
+Tests für vorkompilierte Template-Layouts
+"""
+
+import pytest
+
+from bmad_mcp.core.template_layout import (
+    TEMPLATE_STRUCTURES,
+    TEMPLATE_VERSION,
+    clear_layout_cache,
+    compile_layout,
+    create_template_structure,
+    get_template_layout,
+    materialize_layout,
+)
+
+STRUCTURE = {
+    "agents": {},
+    "tasks": {"active": {}, "completed": {}},
+    "quality-gates": {"lint.yaml": "enabled: true\n"},
+    "README.md": None,
+}
+
+
+def test_compile_layout_lists_parents_before_children():
+    layout = compile_layout(STRUCTURE, "standard", 2)
+    assert layout.version == "2"
+    assert layout.directories == (
+        "agents",
+        "tasks",
+        "tasks/active",
+        "tasks/completed",
+        "quality-gates",
+    )
+    assert layout.files == (
+        ("quality-gates/lint.yaml", "enabled: true\n"),
+        ("README.md", ""),
+    )
+
+
+def test_materialize_creates_only_missing_paths(tmp_path):
+    layout = compile_layout(STRUCTURE)
+    base = tmp_path / ".bmad-core"
+    (base / "tasks").mkdir(parents=True)
+    (base / "README.md").write_text("eigener Inhalt")
+
+    assert layout.missing(base) == [
+        "agents/",
+        "tasks/active/",
+        "tasks/completed/",
+        "quality-gates/",
+        "quality-gates/lint.yaml",
+    ]
+    assert materialize_layout(base, layout) == {
+        "directories_created": 4,
+        "files_created": 1,
+        "skipped": 2,
+    }
+    assert (base / "README.md").read_text() == "eigener Inhalt"
+    assert (base / "quality-gates" / "lint.yaml").read_text() == "enabled: true\n"
+    assert layout.missing(base) == []
+    assert materialize_layout(base, layout)["skipped"] == 7
+
+
+def test_unknown_template_is_rejected():
+    with pytest.raises(ValueError):
+        get_template_layout("does-not-exist")
+
+
+def test_builtin_templates_are_compiled_once(tmp_path):
+    clear_layout_cache()
+    for template in TEMPLATE_STRUCTURES:
+        layout = get_template_layout(template)
+        assert layout.version == TEMPLATE_VERSION
+        assert "tasks/active" in layout.directories
+        assert get_template_layout(template) is layout
+        assert get_template_layout(template, TEMPLATE_VERSION) is layout
+
+    base = tmp_path / ".bmad-core"
+    stats = create_template_structure(base, "web-app")
+    assert stats["directories_created"] == len(
+        get_template_layout("web-app").directories
+    )
+    assert (base / "quality-gates" / "frontend").is_dir()
@@ -0,0 +1,101 @@
+"""
+Tests für den Workflow-Compiler
+"""
+
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+from bmad_mcp.core.workflow_compiler import (
+    WorkflowCache,
+    WorkflowError,
+    compile_workflow,
+)
+
+REPO_WORKFLOW = (
+    Path(__file__).resolve().parent.parent
+    / "config"
+    / "bmad-core"
+    / "workflows"
+    / "development-workflow.yaml"
+)
+
+WORKFLOW_YAML = b"""
+name: Release
+version: 2
+released: 2025-03-03
+stages:
+  - name: plan
+    agent: pm
+    tasks: [scope]
+  - name: build
+    responsible_agent: dev
+    due: 2025-04-01
+  - name: ship
+    agent: dev
+transitions:
+  - {from: plan, to: build}
+  - {from: build, to: ship}
+quality_gates:
+  - {stage: build, checks: [tests, lint]}
+"""
+
+
+def test_repo_workflow_compiles_and_indexes(tmp_path):
+    workflow = WorkflowCache(tmp_path / "cache").load(REPO_WORKFLOW)
+    assert workflow.first_stage.name == "planning"
+    assert workflow.next_stage("planning").name == "implementation"
+    assert workflow.previous_stage("implementation").name == "planning"
+    assert [s.name for s in workflow.stages_for_agent("dev")] == [
+        "implementation",
+        "deployment",
+    ]
+
+
+def test_lookups_and_immutability():
+    workflow = compile_workflow(
+        {"name": "w", "stages": [{"name": "a", "agent": "dev"}, {"name": "b"}]}
+    )
+    assert workflow.is_final("b") and not workflow.is_final("a")
+    with pytest.raises(KeyError):
+        workflow.stage("missing")
+    with pytest.raises(AttributeError):
+        workflow.name = "x"
+    with pytest.raises(WorkflowError):
+        compile_workflow(
+            {"stages": [{"name": "a"}], "transitions": [{"from": "a", "to": "zz"}]}
+        )
+
+
+def test_disk_cache_is_reused_across_instances(tmp_path):
+    source = tmp_path / "flow.yaml"
+    source.write_bytes(
+        b"name: flow\nstages:\n  - {name: a, agent: dev}\n  - {name: b, agent: qa}\n"
+    )
+    first = WorkflowCache(tmp_path / "cache")
+    compiled = first.load(source)
+    assert first.stats["compiled"] == 1
+    assert first.load(source) is compiled and first.stats["memory_hits"] == 1
+
+    second = WorkflowCache(tmp_path / "cache")
+    reloaded = second.load(source)
+    assert second.stats == {"memory_hits": 0, "disk_hits": 1, "compiled": 0}
+    assert reloaded.to_dict() == compiled.to_dict()
+
+
+def test_yaml_date_values_do_not_break_loading(tmp_path):
+    source = tmp_path / "release.yaml"
+    source.write_bytes(WORKFLOW_YAML)
+    cache = WorkflowCache(tmp_path / "cache")
+    workflow = cache.load(source)
+
+    assert workflow.extra["released"] == date(2025, 3, 3)
+    assert workflow.stage("build").extra["due"] == date(2025, 4, 1)
+    assert workflow.stage("build").agent == "dev"
+    assert workflow.stage("build").quality_checks == ("tests", "lint")
+    # Ohne JSON-Form kein Disk-Cache - aber auch kein Fehler
+    assert not list((tmp_path / "cache").glob("*.json"))
+    assert WorkflowCache(tmp_path / "cache").load(source).extra["released"] == date(
+        2025, 3, 3
+    )
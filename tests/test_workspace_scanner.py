@@ -0,0 +1,44 @@
+"""
+Tests für den Workspace-Scanner
+"""
+
+import json
+
+from bmad_mcp.core.workspace_scanner import DiscoveredProject, WorkspaceScanner
+
+
+def test_same_folder_name_gets_separate_backup_namespaces(tmp_path):
+    first = DiscoveredProject(tmp_path / "team-a" / "My App")
+    second = DiscoveredProject(tmp_path / "team-b" / "My App")
+
+    assert first.name == second.name
+    assert first.backup_name != second.backup_name
+    assert first.backup_name.startswith("my-app-")
+    # Stabil über Läufe hinweg (Hash-Wiederverwendung und prune je Projekt)
+    assert (
+        DiscoveredProject(tmp_path / "team-a" / "My App").backup_name
+        == first.backup_name
+    )
+
+
+def test_scan_finds_both_duplicate_named_projects(tmp_path, bmad_home):
+    for team in ("team-a", "team-b"):
+        (tmp_path / "ws" / team / "app" / ".bmad-core").mkdir(parents=True)
+
+    projects = WorkspaceScanner(cache_file=tmp_path / "scan-cache.json").scan(
+        [tmp_path / "ws"]
+    )
+    assert len({project.backup_name for project in projects}) == 2
+
+
+def test_scan_cache_is_compact_and_reused(tmp_path, bmad_home):
+    (tmp_path / "ws" / "app" / ".bmad-core").mkdir(parents=True)
+    cache_file = tmp_path / "scan-cache.json"
+
+    first = WorkspaceScanner(cache_file=cache_file).scan([tmp_path / "ws"])
+    text = cache_file.read_text()
+    assert "\n" not in text.strip()
+    assert json.loads(text)["directories"]
+
+    second = WorkspaceScanner(cache_file=cache_file).scan([tmp_path / "ws"])
+    assert [p.path for p in second] == [p.path for p in first]